@@ -10,6 +10,23 @@ Key Features:
 - Create memes with custom quotes and authors.
 - Automatically handle image resizing to fit specified dimensions.
 - Save generated memes to a designated output location.
+- Cache decoded and resized source images between renders.
+- Name outputs by content so identical requests reuse the same file.
+- Keep a pool of pre-rendered random memes ready in the background.
+- Render large batches of memes in parallel with `make_memes`.
+- Download remote images with size limits, timeouts and a URL cache.
+- Load fonts once per size and memoize text wrapping and measurement.
+- Fit quotes to the image with the largest font size that fits, placed
+  at the top or bottom with an outline.
+- Render several widths and formats of a meme in one pass with
+  `make_variants`.
+- Decode JPEGs at reduced size with `draft` and shrink large images with
+  `reduce` before a configurable resampling filter.
+- Encode memes with named encoder profiles (JPEG, lossy or lossless
+  WebP, optimized PNG, or 'auto' for the smallest) and report encoded
+  sizes and encode times with `encoding_stats`.
+- Catalog source images once, with their metadata and working-size
+  copies, in an `ImageCatalog`.
 
 Usage:
 To use this package, import the MemeEngine class and create an 
@@ -17,4 +34,9 @@ instance with the desired output directory. Use the `make_meme`
 method to generate and save memes.
 """
 
-from .meme_engine import MemeEngine
\ No newline at end of file
+from .meme_engine import MemeEngine, MemeJob, EncodeResult
+from .image_cache import ImageCache
+from .image_catalog import ImageCatalog, ImageInfo
+from .output_store import OutputStore
+from .meme_pool import MemePool
+from .image_fetcher import ImageFetcher, FetchError
\ No newline at end of file
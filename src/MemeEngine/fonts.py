@@ -0,0 +1,115 @@
+"""
+Fonts Module.
+
+This module loads fonts once per (path, size) and memoizes text layout, so
+rendering a meme does not pay for font file I/O or text measurement that
+an earlier render already did.
+
+Functions:
+- load_font: Return a process-wide cached font for a path and size,
+  falling back to other fonts and finally Pillow's default font.
+- layout_text: Wrap text to a maximum width and measure the result,
+  memoized per (text, font, width).
+
+Usage:
+Call `load_font("arial.ttf", 20)` wherever a font is needed and pass the
+font to `layout_text` to get the wrapped lines and the size of the block.
+Both functions are cached, so repeated calls are dictionary lookups.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+from PIL import Image, ImageDraw, ImageFont
+
+# Fonts tried, in order, when the requested font cannot be loaded
+FALLBACK_FONTS = ('DejaVuSans.ttf', 'LiberationSans-Regular.ttf', 'Arial.ttf')
+
+# Spacing between lines, in pixels, as used by ImageDraw.multiline_text
+LINE_SPACING = 4
+
+# A scratch drawing context used only to measure text
+_measure = ImageDraw.Draw(Image.new('L', (1, 1)))
+
+
+@lru_cache(maxsize=128)
+def load_font(path: str, size: int):
+    """
+    Load a TrueType font, caching it for the life of the process.
+
+    If the font cannot be loaded, the FALLBACK_FONTS are tried and finally
+    Pillow's built-in default font is returned. Failures are cached too,
+    so a missing font is only searched for once per size.
+
+    Args:
+        path (str): The font file name or path.
+        size (int): The font size in points.
+
+    Returns:
+        ImageFont.FreeTypeFont or ImageFont.ImageFont: The loaded font.
+    """
+    for candidate in (path,) + FALLBACK_FONTS:
+        try:
+            return ImageFont.truetype(candidate, size)
+        except IOError:
+            continue
+    return ImageFont.load_default()
+
+
+def text_width(text: str, font) -> float:
+    """
+    Return the width in pixels of a single line of text.
+
+    Args:
+        text (str): The line to measure.
+        font: The font to measure with.
+
+    Returns:
+        float: The advance width of the line.
+    """
+    return font.getlength(text)
+
+
+def _wrap_paragraph(paragraph: str, font, max_width: int) -> list:
+    """Greedily wrap one paragraph of text into lines no wider than max_width."""
+    words = paragraph.split()
+    if not words:
+        return ['']
+
+    lines, current = [], words[0]
+    for word in words[1:]:
+        candidate = f"{current} {word}"
+        if text_width(candidate, font) <= max_width:
+            current = candidate
+        else:
+            lines.append(current)
+            current = word
+    lines.append(current)
+    return lines
+
+
+@lru_cache(maxsize=4096)
+def layout_text(text: str, font, max_width: int) -> Tuple[Tuple[str, ...], int, int]:
+    """
+    Wrap text to max_width and measure the wrapped block.
+
+    Explicit newlines in text are kept; each paragraph is wrapped at word
+    boundaries. A single word wider than max_width is kept on its own line.
+    Results are memoized per (text, font, max_width); fonts returned by
+    `load_font` are shared objects, so they make stable cache keys.
+
+    Args:
+        text (str): The text to lay out.
+        font: The font to lay the text out with.
+        max_width (int): The maximum line width in pixels.
+
+    Returns:
+        Tuple[Tuple[str, ...], int, int]: The lines, and the width and
+        height of the block as drawn with LINE_SPACING between lines.
+    """
+    lines = []
+    for paragraph in text.split('\n'):
+        lines.extend(_wrap_paragraph(paragraph, font, max_width))
+
+    _, _, width, height = _measure.multiline_textbbox((0, 0), '\n'.join(lines),
+                                                      font=font, spacing=LINE_SPACING)
+    return tuple(lines), width, height
@@ -0,0 +1,223 @@
+"""
+Image Cache Module.
+
+This module provides the ImageCache class, a bounded, memory-aware LRU
+cache of decoded source images that have already been resized to a
+target width. Decoding and resizing the full-resolution dog photos
+dominates meme rendering time, and the same handful of photos is used
+over and over again, so keeping the resized result around avoids paying
+that cost on every request.
+
+Classes:
+- ImageCache: An LRU cache of resized images keyed by path, modification
+  time and width, with hit/miss/eviction counters.
+
+Usage:
+Create an ImageCache (or use the shared `default_cache`) and call `get`
+with an image path and a target width. The returned image is always a
+copy, so callers are free to draw on it.
+
+Decoding takes the fast path where it can: JPEG sources are decoded with
+`draft`, which lets the decoder downscale in the DCT domain, and large
+downscales start with an integer `reduce` before the final resampling.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from PIL import Image
+
+
+class ImageCache:
+    """
+    A bounded LRU cache of decoded and resized images.
+
+    Entries are keyed by (absolute path, mtime, width, resample filter) so
+    an edited source file is picked up automatically. The cache is bounded
+    both by the approximate number of bytes held in decoded pixel data and
+    by the number of entries; the least recently used entries are evicted
+    first.
+
+    Attributes:
+        max_bytes (int): The maximum number of decoded bytes to keep.
+        max_entries (int): The maximum number of images to keep.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups that had to decode the image.
+        evictions (int): The number of entries evicted to stay in bounds.
+        current_bytes (int): The approximate number of bytes currently held.
+    """
+
+    def __init__(self, max_bytes: int = 128 * 1024 * 1024, max_entries: int = 64):
+        """
+        Initialize an empty ImageCache.
+
+        Args:
+            max_bytes (int, optional): The memory budget for decoded pixel
+                                       data. Defaults to 128 MiB.
+            max_entries (int, optional): The maximum number of cached
+                                         images. Defaults to 64.
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, img_path: str, width: int, resample: int = None) -> Image.Image:
+        """
+        Return a copy of the image at img_path resized to the given width.
+
+        Args:
+            img_path (str): The path to the source image file.
+            width (int): The desired width; the height keeps the aspect ratio.
+            resample (int, optional): The Pillow resampling filter. Defaults
+                                      to Pillow's default for resize.
+
+        Returns:
+            Image.Image: A resized copy that the caller may modify.
+
+        Raises:
+            IOError: If the image cannot be opened.
+        """
+        key = (os.path.abspath(img_path), os.stat(img_path).st_mtime_ns, width, resample)
+
+        with self._lock:
+            img = self._entries.get(key)
+            if img is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return img.copy()
+            self.misses += 1
+
+        img = self.load(img_path, width, resample)
+        self._put(key, img)
+        return img.copy()
+
+    @staticmethod
+    def load(img_path: str, width: int, resample: int = None) -> Image.Image:
+        """
+        Decode the image at img_path and resize it to the given width.
+
+        JPEG sources are decoded with `draft`, so the decoder itself
+        downscales by 1/2, 1/4 or 1/8 when the target is small enough.
+
+        Args:
+            img_path (str): The path to the source image file.
+            width (int): The desired width; the height keeps the aspect ratio.
+            resample (int, optional): The Pillow resampling filter.
+
+        Returns:
+            Image.Image: The resized image.
+        """
+        with Image.open(img_path) as src:
+            size = ImageCache.target_size(src, width)
+            if src.format == 'JPEG' and src.mode in ('RGB', 'L'):
+                src.draft(src.mode, size)
+            return ImageCache.resize(src, width, resample, size)
+
+    @staticmethod
+    def target_size(img: Image.Image, width: int) -> tuple:
+        """
+        Return the size of img scaled to the given width.
+
+        Args:
+            img (Image.Image): The image to scale.
+            width (int): The desired width.
+
+        Returns:
+            tuple: The (width, height) keeping the aspect ratio.
+        """
+        aspect_ratio = img.height / img.width
+        return width, int(width * aspect_ratio)
+
+    @staticmethod
+    def resize(img: Image.Image, width: int, resample: int = None,
+               size: tuple = None) -> Image.Image:
+        """
+        Resize an image to the given width, keeping its aspect ratio.
+
+        When the image is at least twice the target size in each
+        dimension, it is first shrunk by an integer factor with `reduce`
+        (a fast box filter), leaving at least a 2x reduction for the final
+        resampling filter so quality is preserved.
+
+        Args:
+            img (Image.Image): The image to resize.
+            width (int): The desired width.
+            resample (int, optional): The Pillow resampling filter.
+                                      Defaults to Pillow's default.
+            size (tuple, optional): The target (width, height); defaults
+                                    to the aspect-preserving size of img.
+
+        Returns:
+            Image.Image: A new, resized image.
+        """
+        size = size or ImageCache.target_size(img, width)
+        factor = int(min(img.width / size[0], img.height / max(size[1], 1)) // 2)
+        if factor >= 2 and img.mode not in ('P', '1'):
+            img = img.reduce(factor)
+        if resample is None:
+            return img.resize(size)
+        return img.resize(size, resample=resample)
+
+    @staticmethod
+    def sizeof(img: Image.Image) -> int:
+        """
+        Estimate the number of bytes used by the pixel data of an image.
+
+        Args:
+            img (Image.Image): The image to measure.
+
+        Returns:
+            int: The approximate size of the decoded image in bytes.
+        """
+        return img.width * img.height * len(img.getbands())
+
+    def _put(self, key, img: Image.Image):
+        """Store img under key and evict entries until back within bounds."""
+        size = self.sizeof(img)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = img
+            self.current_bytes += size
+            while (self.current_bytes > self.max_bytes
+                   or len(self._entries) > self.max_entries):
+                _, old = self._entries.popitem(last=False)
+                self.current_bytes -= self.sizeof(old)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove every entry from the cache; counters are left untouched."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict:
+        """
+        Return the current cache counters.
+
+        Returns:
+            dict: The hits, misses, evictions, entries and bytes in use.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+            }
+
+    def __len__(self):
+        """Return the number of cached images."""
+        return len(self._entries)
+
+
+default_cache = ImageCache()
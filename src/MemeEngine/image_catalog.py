@@ -0,0 +1,267 @@
+"""
+Image Catalog Module.
+
+This module provides the ImageCatalog class, which scans a directory of
+source images once and records what the renderer needs to know about
+each of them: width, height, format, aspect ratio and a content hash. It
+also keeps a normalized working-size copy of every image, so choosing a
+random image and rendering it never has to list the directory or decode
+the full-resolution original.
+
+Classes:
+- ImageInfo: The recorded metadata of one source image.
+- ImageCatalog: A persistent index of a directory of images and their
+  working-size copies, updated incrementally when files change.
+
+Usage:
+Create an ImageCatalog for an image directory and call `scan` at start-up
+(and whenever the directory may have changed). Render from
+`working_paths()` instead of the originals, and use `info` to look up the
+metadata of an image.
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+from typing import Dict, Iterator, List, NamedTuple, Optional
+from PIL import Image
+from .image_cache import ImageCache
+
+
+class ImageInfo(NamedTuple):
+    """The metadata recorded for one source image."""
+
+    path: str
+    width: int
+    height: int
+    format: str
+    aspect_ratio: float
+    hash: str
+    size: int
+    mtime: int
+    working: str
+
+
+class ImageCatalog:
+    """
+    A persistent catalog of the images in a directory.
+
+    An entry is reused without opening the image when its size and
+    modification time are unchanged; if only the modification time changed,
+    the content hash is compared, so touching a file does not regenerate
+    its working copy. Working copies are named by content hash and width.
+
+    Attributes:
+        directory (str): The directory of source images.
+        work_dir (str): The directory holding the index and working copies.
+        index_path (str): The path of the JSON index file.
+        work_width (int): The width of the working copies.
+        extensions (tuple): The file extensions treated as images.
+    """
+
+    version = 1
+
+    def __init__(self, directory: str, work_dir: str = './_data/.image_catalog',
+                 work_width: int = 500, extensions: tuple = ('.jpg', '.jpeg', '.png')):
+        """
+        Initialize the ImageCatalog, loading its index file if it exists.
+
+        Args:
+            directory (str): The directory of source images.
+            work_dir (str, optional): The directory for the index and the
+                                      working copies. Defaults to
+                                      './_data/.image_catalog'.
+            work_width (int, optional): The width of the working copies.
+                                        Defaults to 500, the meme width.
+            extensions (tuple, optional): The image file extensions.
+                                          Defaults to jpg, jpeg and png.
+        """
+        self.directory = directory
+        self.work_dir = work_dir
+        self.index_path = os.path.join(work_dir, 'index.json')
+        self.work_width = work_width
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self._entries: Dict[str, ImageInfo] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load the index file, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if (data.get('version') == self.version
+                    and data.get('work_width') == self.work_width):
+                self._entries = {path: ImageInfo(*entry)
+                                 for path, entry in data['entries'].items()}
+        except FileNotFoundError:
+            pass
+        except Exception as ex:
+            print(f"error loading image catalog, image_catalog.py: {ex}")
+
+    def save(self):
+        """Write the index file atomically."""
+        with self._lock:
+            data = {'version': self.version, 'work_width': self.work_width,
+                    'entries': {path: list(info) for path, info in self._entries.items()}}
+
+        os.makedirs(self.work_dir, exist_ok=True)
+        tmp = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, 'w', encoding='utf-8') as file:
+                json.dump(data, file, indent=1)
+            os.replace(tmp, self.index_path)
+        except Exception as ex:
+            print(f"error saving image catalog, image_catalog.py: {ex}")
+
+    @staticmethod
+    def file_hash(path: str) -> str:
+        """
+        Return the SHA-256 digest of a file's contents.
+
+        Args:
+            path (str): The path to the file.
+
+        Returns:
+            str: The hex digest of the file contents.
+        """
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def scan(self) -> bool:
+        """
+        Bring the catalog up to date with the image directory.
+
+        New and changed images are measured, hashed and given a working
+        copy; entries of deleted images are dropped together with working
+        copies no longer used by any image. The index is saved if anything
+        changed.
+
+        Returns:
+            bool: True if the catalog changed.
+        """
+        try:
+            names = sorted(os.listdir(self.directory))
+        except OSError as ex:
+            print(f"error scanning images, image_catalog.py: {ex}")
+            names = []
+
+        with self._lock:
+            old = dict(self._entries)
+        entries, changed = {}, False
+        for name in names:
+            if not name.lower().endswith(self.extensions):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                info = self._refresh(path, old.get(path))
+            except Exception as ex:
+                print(f"error cataloging image {path}, image_catalog.py: {ex}")
+                continue
+            changed = changed or info != old.get(path)
+            entries[path] = info
+
+        changed = changed or entries.keys() != old.keys()
+        with self._lock:
+            self._entries = entries
+        if changed:
+            self._remove_unused()
+            self.save()
+        return changed
+
+    def _refresh(self, path: str, info: Optional[ImageInfo]) -> ImageInfo:
+        """Return an up-to-date entry for path, reusing info where possible."""
+        stat = os.stat(path)
+        if info is not None and info.size == stat.st_size and os.path.exists(info.working):
+            if info.mtime == stat.st_mtime_ns:
+                return info
+            if self.file_hash(path) == info.hash:
+                return info._replace(mtime=stat.st_mtime_ns)
+
+        content_hash = self.file_hash(path)
+        working = os.path.join(self.work_dir, f"{content_hash[:32]}_{self.work_width}.png")
+        with Image.open(path) as src:
+            width, height, format = src.width, src.height, src.format
+        if not os.path.exists(working):
+            self._make_working_copy(path, working)
+        return ImageInfo(path, width, height, format, round(width / height, 6),
+                         content_hash, stat.st_size, stat.st_mtime_ns, working)
+
+    def _make_working_copy(self, path: str, working: str):
+        """Write the normalized working-size copy of the image at path."""
+        img = ImageCache.load(path, self.work_width)
+        has_alpha = 'A' in img.getbands() or 'transparency' in img.info
+        img = img.convert('RGBA' if has_alpha else 'RGB')
+
+        os.makedirs(self.work_dir, exist_ok=True)
+        tmp = f"{working}.{os.getpid()}.tmp"
+        img.save(tmp, format='PNG', compress_level=1)
+        os.replace(tmp, working)
+
+    def _remove_unused(self):
+        """Delete working copies that no catalog entry refers to."""
+        with self._lock:
+            used = {os.path.basename(info.working) for info in self._entries.values()}
+        try:
+            names = os.listdir(self.work_dir)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith('.png') and name not in used:
+                try:
+                    os.remove(os.path.join(self.work_dir, name))
+                except OSError:
+                    pass
+
+    def info(self, path: str) -> Optional[ImageInfo]:
+        """
+        Return the metadata recorded for a source image.
+
+        Args:
+            path (str): The path of the source image, as listed by `paths`.
+
+        Returns:
+            Optional[ImageInfo]: The metadata, or None if it is not cataloged.
+        """
+        with self._lock:
+            return self._entries.get(path)
+
+    def paths(self) -> List[str]:
+        """Return the paths of the cataloged source images."""
+        with self._lock:
+            return list(self._entries)
+
+    def working_paths(self) -> List[str]:
+        """Return the paths of the working copies, one per source image."""
+        with self._lock:
+            return [info.working for info in self._entries.values()]
+
+    def choice(self, rng: random.Random = None) -> str:
+        """
+        Return the working copy of a random image.
+
+        Args:
+            rng (random.Random, optional): The random number generator.
+                                           Defaults to the random module.
+
+        Returns:
+            str: The path of a working copy.
+
+        Raises:
+            IndexError: If the catalog is empty.
+        """
+        return (rng or random).choice(self.working_paths())
+
+    def __len__(self):
+        """Return the number of cataloged images."""
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[ImageInfo]:
+        """Iterate over the metadata of the cataloged images."""
+        with self._lock:
+            return iter(list(self._entries.values()))
@@ -0,0 +1,219 @@
+"""
+Image Fetcher Module.
+
+This module provides the ImageFetcher class, which downloads remote images
+into memory for meme generation. Downloads go through a pooled HTTP session
+and are streamed with a byte limit, a per-read timeout and an optional
+deadline for the whole download. Fetched images are cached by URL in a
+cache bounded by total bytes and revalidated with ETag / Last-Modified.
+
+Classes:
+- ImageFetcher: Downloads and caches remote images.
+- FetchError: Raised when an image cannot be fetched.
+
+Usage:
+Create an ImageFetcher and call `fetch_bytes` with an image URL to get its
+contents. Pass a `session` to use a different HTTP client, e.g. one
+pointed at a local test server. `requests` is imported, and the pooled
+session created, on the first download rather than when the fetcher is
+created.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    import requests
+
+
+class FetchError(IOError):
+    """Raised when a remote image cannot be fetched."""
+
+
+class ImageFetcher:
+    """
+    Download remote images into memory, with a URL cache.
+
+    Attributes:
+        max_bytes (int): The largest download accepted, in bytes.
+        timeout (tuple): The (connect, read) timeouts in seconds.
+        cache_bytes (int): The total size of the cached images, in bytes.
+        session (requests.Session): The pooled HTTP session.
+        hits (int): The number of fetches answered from the cache.
+        misses (int): The number of fetches that downloaded the image.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(self, max_bytes: int = 10 * 1024 * 1024, timeout: tuple = (3.05, 10),
+                 cache_bytes: int = 64 * 1024 * 1024, pool_size: int = 10,
+                 session: 'requests.Session' = None):
+        """
+        Initialize the ImageFetcher.
+
+        Args:
+            max_bytes (int, optional): The download size limit. Defaults
+                                       to 10 MiB.
+            timeout (tuple, optional): The (connect, read) timeouts in
+                                       seconds. Defaults to (3.05, 10).
+            cache_bytes (int, optional): The total size of the cached
+                                         images; the least recently used
+                                         are evicted past it. Defaults to
+                                         64 MiB.
+            pool_size (int, optional): The number of pooled connections
+                                       per host. Defaults to 10.
+            session (requests.Session, optional): The session to use.
+                                                  Defaults to a new
+                                                  pooled session.
+        """
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.cache_bytes = cache_bytes
+        self.pool_size = pool_size
+        self.hits = 0
+        self.misses = 0
+        self._session = session
+        self._cache = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> 'requests.Session':
+        """The pooled HTTP session, created on first use."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            with self._lock:
+                if self._session is None:
+                    self._session = session
+        return self._session
+
+    def fetch_bytes(self, url: str, deadline: float = None) -> bytes:
+        """
+        Return the contents of the image at url without touching the disk.
+
+        A cached copy is revalidated with a conditional request and reused
+        when the server answers 304 Not Modified.
+
+        Args:
+            url (str): The http(s) URL of the image.
+            deadline (float, optional): The seconds allowed for the whole
+                                        download. Defaults to no limit
+                                        beyond the per-read timeout.
+
+        Returns:
+            bytes: The image file contents.
+
+        Raises:
+            FetchError: If the URL is invalid, the request fails or times
+                        out, the deadline passes, or the image is larger
+                        than max_bytes.
+        """
+        if urlparse(url).scheme not in ('http', 'https'):
+            raise FetchError(f'Unsupported image URL {url}')
+
+        import requests
+
+        # A monotonic time after which the download is abandoned
+        expires = None if deadline is None else time.monotonic() + deadline
+        timeout = self.timeout
+        if deadline is not None:
+            # No single read may wait past the deadline either
+            timeout = (min(timeout[0], deadline), min(timeout[1], deadline))
+
+        headers = {}
+        with self._lock:
+            cached = self._cache.get(url)
+        if cached is not None:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        try:
+            with self.session.get(url, headers=headers, stream=True,
+                                  timeout=timeout) as response:
+                if response.status_code == 304 and cached is not None:
+                    with self._lock:
+                        if url in self._cache:
+                            self._cache.move_to_end(url)
+                        self.hits += 1
+                    return cached['data']
+                response.raise_for_status()
+                self._check_length(response)
+                data = b''.join(self._chunks(response, expires))
+        except requests.RequestException as ex:
+            raise FetchError(f'Cannot fetch image at {url}: {ex}') from ex
+
+        with self._lock:
+            self.misses += 1
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self._remember(url, {'etag': etag, 'last_modified': last_modified, 'data': data})
+        return data
+
+    def _check_length(self, response: 'requests.Response'):
+        """Reject a response whose declared length is over max_bytes."""
+        length = response.headers.get('Content-Length')
+        if length and length.isdigit() and int(length) > self.max_bytes:
+            raise FetchError(f'Image is larger than {self.max_bytes} bytes')
+
+    def _chunks(self, response: 'requests.Response', expires: float = None):
+        """
+        Yield the body of response in chunks, enforcing max_bytes and expires.
+
+        Each read returns whatever has arrived, up to chunk_size, instead
+        of waiting for a full chunk, and the socket timeout is set to the
+        time left before every read, so a server that drips bytes slowly
+        cannot keep the read going past the deadline.
+        """
+        from urllib3.exceptions import HTTPError, ReadTimeoutError
+
+        raw = response.raw
+        connection = getattr(raw, 'connection', None)
+        sock = getattr(connection, 'sock', None)
+        received = 0
+        while True:
+            if expires is not None:
+                remaining = expires - time.monotonic()
+                if remaining <= 0:
+                    raise FetchError('Image download passed its deadline')
+                if sock is not None:
+                    sock.settimeout(remaining)
+            try:
+                chunk = raw.read1(self.chunk_size, decode_content=True)
+            except (ReadTimeoutError, TimeoutError) as ex:
+                if expires is not None and time.monotonic() >= expires:
+                    raise FetchError('Image download passed its deadline') from ex
+                raise FetchError(f'Image download timed out: {ex}') from ex
+            except (HTTPError, OSError) as ex:
+                raise FetchError(f'Image download failed: {ex}') from ex
+            if not chunk:
+                return
+            received += len(chunk)
+            if received > self.max_bytes:
+                raise FetchError(f'Image is larger than {self.max_bytes} bytes')
+            yield chunk
+
+    def _remember(self, url: str, entry: dict):
+        """Cache entry under url, evicting the least recently used past cache_bytes."""
+        size = len(entry['data'])
+        with self._lock:
+            old = self._cache.pop(url, None)
+            if old is not None:
+                self._cached_bytes -= len(old['data'])
+            if size > self.cache_bytes:
+                return
+            self._cache[url] = entry
+            self._cached_bytes += size
+            while self._cached_bytes > self.cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_bytes -= len(evicted['data'])
@@ -0,0 +1,108 @@
+"""
+Layout Module.
+
+This module fits a quote and its author onto an image: it wraps the text,
+picks the largest font size at which the wrapped text fits the available
+area, and positions the block at the top or bottom of the image. Layouts
+are cached, so a quote that was laid out before costs nothing to lay out
+again.
+
+Classes:
+- TextLayout: The result of laying out a quote: lines, font and position.
+
+Functions:
+- fit_text: Lay out a quote and author for an image of a given size,
+  choosing the font size by binary search.
+
+Usage:
+Call `fit_text(text, author, img.width, img.height)` and draw
+`"\\n".join(layout.lines)` at `(layout.x, layout.y)` with `layout.font`.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+from .fonts import layout_text, load_font
+
+
+class TextLayout(NamedTuple):
+    """A quote laid out for an image of a particular size."""
+
+    lines: Tuple[str, ...]
+    font: object
+    size: int
+    x: float
+    y: float
+    width: int
+    height: int
+
+
+def _fits(text: str, font_path: str, size: int, max_width: int, max_height: int):
+    """Return the wrapped layout at size if it fits the area, else None."""
+    font = load_font(font_path, size)
+    lines, width, height = layout_text(text, font, max_width)
+    if width <= max_width and height <= max_height:
+        return font, lines, width, height
+    return None
+
+
+@lru_cache(maxsize=4096)
+def fit_text(text: str, author: str, width: int, height: int,
+             font_path: str = "arial.ttf", min_size: int = 12, max_size: int = 48,
+             position: str = 'bottom', margin: int = 10,
+             max_height_ratio: float = 0.4) -> TextLayout:
+    """
+    Lay out a quote and its author for an image of the given size.
+
+    The text is wrapped to the image width minus the margins, and the
+    largest font size between min_size and max_size at which the wrapped
+    block fits within max_height_ratio of the image height is found by
+    binary search. If even min_size does not fit, min_size is used.
+
+    Args:
+        text (str): The quote text.
+        author (str): The author of the quote.
+        width (int): The width of the image.
+        height (int): The height of the image.
+        font_path (str, optional): The font to use. Defaults to "arial.ttf".
+        min_size (int, optional): The smallest font size. Defaults to 12.
+        max_size (int, optional): The largest font size. Defaults to 48.
+        position (str, optional): 'top' or 'bottom'. Defaults to 'bottom'.
+        margin (int, optional): The margin around the text in pixels.
+                                Defaults to 10.
+        max_height_ratio (float, optional): The share of the image height
+                                            the text may cover. Defaults
+                                            to 0.4.
+
+    Returns:
+        TextLayout: The lines, font, size and position of the text block.
+
+    Raises:
+        ValueError: If position is not 'top' or 'bottom'.
+    """
+    if position not in ('top', 'bottom'):
+        raise ValueError(f'Cannot place text at {position}')
+
+    full_text = f"{text}\n- {author}"
+    max_width = max(width - 2 * margin, 1)
+    max_height = max(int(height * max_height_ratio), 1)
+
+    best = None
+    lo, hi = min_size, max_size
+    while lo <= hi:
+        size = (lo + hi) // 2
+        fitted = _fits(full_text, font_path, size, max_width, max_height)
+        if fitted is not None:
+            best = (size,) + fitted
+            lo = size + 1
+        else:
+            hi = size - 1
+
+    if best is None:
+        font = load_font(font_path, min_size)
+        lines, block_width, block_height = layout_text(full_text, font, max_width)
+        best = (min_size, font, lines, block_width, block_height)
+
+    size, font, lines, block_width, block_height = best
+    x = (width - block_width) / 2
+    y = margin if position == 'top' else height - block_height - margin
+    return TextLayout(lines, font, size, x, y, block_width, block_height)
@@ -10,16 +10,105 @@ designated output directory.
 Classes:
 - MemeEngine: A class that handles meme generation by loading images, 
   drawing text on them, and saving the results to an output directory.
+- MemeJob: A single (image, quote, author, width) render request for the
+  batch API.
+- EncodeResult: An encoded meme with its format, size and encode time.
 
 Usage:
 To create a meme, initialize an instance of the MemeEngine with the 
 desired output directory, then call the `make_meme` method with the 
 image path, quote text, and author. The generated meme will be saved 
-in the specified output directory.
+in the specified output directory. To render without touching the disk,
+call `render` with a path, bytes, a file-like object or a PIL image; it
+returns the encoded meme in a BytesIO. To render many memes at once, pass
+an iterable of MemeJob tuples to `make_memes`, which renders them in a
+process pool and yields results as they finish.
+
+Memes are encoded with a named encoder profile (see `MemeEngine.profiles`),
+e.g. 'jpeg', 'webp', 'webp-lossless' or 'png-optimized'; the 'auto'
+profile encodes each meme with several candidates and keeps the smallest
+acceptable one. Byte counts and encode times are totalled per profile and
+format by `encoding_stats`.
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+import io
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import BinaryIO, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from .image_cache import ImageCache, default_cache
+from .output_store import OutputStore
+from .fonts import LINE_SPACING
+from .layout import fit_text
+
+
+class MemeJob(NamedTuple):
+    """A single meme to render with `MemeEngine.make_memes`."""
+
+    img_path: str
+    text: str
+    author: str
+    width: int = 500
+
+
+class EncodeResult(NamedTuple):
+    """An encoded meme and what it cost to encode."""
+
+    data: bytes
+    format: str
+    profile: str
+    seconds: float
+    candidates: Tuple[Tuple[str, int, float], ...] = ()
+
+    @property
+    def bytes(self) -> int:
+        """The size of the encoded meme in bytes."""
+        return len(self.data)
+
+    @property
+    def mimetype(self) -> str:
+        """The MIME type of the encoded meme."""
+        return Image.MIME.get(self.format, 'application/octet-stream')
+
+
+_worker_engines = {}
+
+
+def _render_jobs(engine_cls, output_dir: str, settings: dict,
+                 jobs: List[MemeJob]) -> List[Tuple[MemeJob, Optional[str]]]:
+    """
+    Render a chunk of jobs inside a worker process.
+
+    The engine is created once per worker process and reused, so its image
+    cache decodes each source image only once per worker.
+
+    Args:
+        engine_cls (type): The MemeEngine class (or subclass) to render with.
+        output_dir (str): The directory where memes will be saved.
+        settings (dict): The keyword arguments the engine was created with.
+        jobs (List[MemeJob]): The jobs to render.
+
+    Returns:
+        List[Tuple[MemeJob, Optional[str]]]: Each job with the path of its
+        meme, or None if it could not be rendered.
+    """
+    key = (engine_cls, output_dir, tuple(sorted(settings.items())))
+    engine = _worker_engines.get(key)
+    if engine is None:
+        engine = _worker_engines[key] = engine_cls(output_dir, **settings)
+
+    results = []
+    for job in jobs:
+        try:
+            path = engine.make_meme(job.img_path, job.text, job.author, job.width)
+        except Exception as ex:
+            print(f"error rendering meme for {job.img_path}, meme_engine.py: {ex}")
+            path = None
+        results.append((job, path))
+    return results
 
 
 class MemeEngine:
@@ -32,26 +121,104 @@ class MemeEngine:
 
     Attributes:
         output_dir (str): The directory where generated memes will be saved.
+        image_cache (ImageCache): The cache of decoded and resized source
+                                  images shared between renders.
+        store (OutputStore): The content-addressed store that names the
+                             output files and keeps the directory bounded.
+        position (str): Where the text is placed, 'top' or 'bottom'.
+        stroke_width (int): The width of the outline drawn around the text.
+        resample (int): The Pillow filter used to resize source images, or
+                        None for Pillow's default.
+        profile (str): The name of the encoder profile memes are saved with.
     """
 
-    def __init__(self, output_dir: str):
+    font_path = "arial.ttf"
+    min_font_size = 12
+    max_font_size = 48
+    fill = "white"
+    stroke_fill = "black"
+    # Bump when the drawing code changes so stored outputs are re-rendered
+    render_version = 3
+    # File extensions of output formats, and the profile make_variants
+    # encodes each format with
+    variant_extensions = {'JPEG': 'jpg', 'WEBP': 'webp', 'PNG': 'png', 'AVIF': 'avif'}
+    variant_profiles = {'JPEG': 'jpeg', 'WEBP': 'webp', 'PNG': 'png-optimized', 'AVIF': 'avif'}
+    # Encoder profiles: name -> (Pillow format, save options)
+    profiles = {
+        'png': ('PNG', {}),
+        'png-fast': ('PNG', {'compress_level': 1}),
+        'png-optimized': ('PNG', {'optimize': True}),
+        'jpeg': ('JPEG', {'quality': 85, 'optimize': True, 'progressive': True}),
+        'jpeg-small': ('JPEG', {'quality': 70, 'optimize': True, 'progressive': True}),
+        'webp': ('WEBP', {'quality': 80, 'method': 4}),
+        'webp-lossless': ('WEBP', {'lossless': True, 'quality': 80, 'method': 4}),
+        # Needs a Pillow build or plugin with AVIF support
+        'avif': ('AVIF', {'quality': 60}),
+    }
+    # The profiles tried by the 'auto' profile, which keeps the smallest
+    auto_profiles = ('webp', 'jpeg', 'png')
+
+    def __init__(self, output_dir: str, image_cache: ImageCache = None,
+                 position: str = 'bottom', stroke_width: int = 2,
+                 resample: int = None, profile: str = 'png'):
         """
         Initialize the MemeEngine with the specified output directory.
 
         Args:
             output_dir (str): The directory where memes will be saved.
             If the directory does not exist, it will be created.
+            image_cache (ImageCache, optional): The cache used for source
+                                                images. Defaults to the
+                                                process-wide shared cache.
+            position (str, optional): Where to place the text, 'top' or
+                                      'bottom'. Defaults to 'bottom'.
+            stroke_width (int, optional): The width of the text outline in
+                                          pixels; 0 disables it. Defaults
+                                          to 2.
+            resample (int, optional): The resampling filter for resizing,
+                                      e.g. Image.Resampling.LANCZOS. Defaults to
+                                      Pillow's default.
+            profile (str, optional): The encoder profile, a key of
+                                     `profiles` or 'auto'. Defaults to
+                                     'png'.
+
+        Raises:
+            ValueError: If profile is not a known encoder profile.
         """
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
+        self.image_cache = image_cache if image_cache is not None else default_cache
+        self.store = OutputStore(output_dir)
+        self.position = position
+        self.stroke_width = stroke_width
+        self.resample = None if resample is None else int(resample)
+        self.profile = self._check_profile(profile)
+        self._encode_totals = {}
+        self._encode_lock = threading.Lock()
+
+    @property
+    def settings(self) -> dict:
+        """The keyword arguments needed to recreate this engine's rendering."""
+        return {'position': self.position, 'stroke_width': self.stroke_width,
+                'resample': self.resample, 'profile': self.profile}
+
+    def _check_profile(self, profile: str) -> str:
+        """Return profile if it names an encoder profile, else raise ValueError."""
+        if profile != 'auto' and profile not in self.profiles:
+            raise ValueError(f'Unknown encoder profile {profile}')
+        return profile
 
     def make_meme(self, img_path: str, text: str, author: str, width: int = 500) -> str:
         """
         Create a meme from a specified image by adding a quote and author.
 
         This method opens the image, resizes it while maintaining the aspect
-        ratio, and draws the specified quote and author onto the image. 
-        The final meme is saved to the output directory.
+        ratio (reusing a cached copy when the same image and width were
+        rendered before), and draws the specified quote and author onto the image. 
+        The final meme is encoded with the engine's profile and saved to
+        the output directory under a name derived from the image, the text
+        and the render settings; if that file already exists it is reused
+        without rendering again, and its modification time is refreshed so
+        the output sweeper evicts unused memes first.
 
         Args:
             img_path (str): The path to the input image file.
@@ -67,36 +234,373 @@ class MemeEngine:
             IOError: If the input image cannot be opened or the output
                       directory cannot be written to.
         """
-        # Load the image
-        img = Image.open(img_path)
+        key = self._output_key(img_path, text, author, width)
+        for fmt in self._profile_formats(self.profile):
+            output_path = self.store.path_for(key, self.variant_extensions[fmt])
+            if self.store.reuse(output_path):
+                return output_path
+
+        # Load the image resized to the requested width (cached)
+        img = self.load_image(img_path, width)
+        self.draw_text(img, text, author)
+
+        # Encode and save the manipulated image
+        result = self.encode(img)
+        output_path = self.store.path_for(key, self.variant_extensions[result.format])
+        self._write(result.data, output_path)
+        self.store.maybe_sweep()
+
+        return output_path
+
+    def _output_key(self, img_path: str, text: str, author: str, width: int, *extra) -> str:
+        """Return the output store key for a render of img_path with these settings."""
+        return self.store.key(self.store.image_identity(img_path), text, author,
+                              width, self.font_path, self.min_font_size,
+                              self.max_font_size, self.fill, self.stroke_fill,
+                              sorted(self.settings.items()), self.render_version, *extra)
+
+    @staticmethod
+    def _write(data: bytes, output_path: str):
+        """
+        Write encoded data to output_path atomically.
+
+        The data is written to a private file first and renamed into
+        place, so a concurrent request never reads a half-written meme.
+        """
+        tmp_path = f"{output_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as file:
+                file.write(data)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _profile_formats(self, profile: str) -> List[str]:
+        """Return the formats a profile may produce."""
+        names = self.auto_profiles if profile == 'auto' else (profile,)
+        return list(OrderedDict.fromkeys(self.profiles[name][0] for name in names))
+
+    @staticmethod
+    def _has_transparency(img: Image.Image) -> bool:
+        """Return True if any pixel of img is not fully opaque."""
+        if img.mode in ('RGBA', 'LA', 'PA'):
+            return img.getchannel('A').getextrema()[0] < 255
+        return 'transparency' in img.info
+
+    def _encode_with(self, img: Image.Image, name: str) -> Tuple[bytes, float]:
+        """Encode img with one named profile and return the data and time taken."""
+        fmt, options = self.profiles[name]
+        if fmt == 'JPEG' and img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        output = io.BytesIO()
+        start = time.perf_counter()
+        img.save(output, format=fmt, **options)
+        return output.getvalue(), time.perf_counter() - start
+
+    def encode(self, img: Image.Image, profile: str = None) -> EncodeResult:
+        """
+        Encode a finished meme with an encoder profile.
+
+        The 'auto' profile encodes the meme with each of `auto_profiles`
+        and keeps the smallest result. JPEG is not acceptable for an image
+        with transparent pixels, so it is skipped for those. The size and
+        encode time are added to `encoding_stats`.
+
+        Args:
+            img (Image.Image): The meme to encode.
+            profile (str, optional): The encoder profile. Defaults to the
+                                     engine's profile.
+
+        Returns:
+            EncodeResult: The encoded data, its format and encode timings.
+
+        Raises:
+            ValueError: If profile is not a known encoder profile.
+        """
+        profile = self._check_profile(profile or self.profile)
+        if profile != 'auto':
+            data, seconds = self._encode_with(img, profile)
+            result = EncodeResult(data, self.profiles[profile][0], profile, seconds)
+        else:
+            names = list(self.auto_profiles)
+            if self._has_transparency(img):
+                names = [name for name in names if self.profiles[name][0] != 'JPEG']
+            candidates, best = [], None
+            for name in names:
+                data, seconds = self._encode_with(img, name)
+                candidates.append((self.profiles[name][0], len(data), seconds))
+                if best is None or len(data) < len(best):
+                    best, best_format = data, self.profiles[name][0]
+            result = EncodeResult(best, best_format, profile,
+                                  sum(seconds for _, _, seconds in candidates),
+                                  tuple(candidates))
+
+        with self._encode_lock:
+            totals = self._encode_totals.setdefault((profile, result.format), [0, 0, 0.0])
+            totals[0] += 1
+            totals[1] += result.bytes
+            totals[2] += result.seconds
+        return result
+
+    def encoding_stats(self) -> dict:
+        """
+        Return the encoded sizes and encode times per profile and format.
+
+        Returns:
+            dict: Keyed by 'profile:FORMAT', the number of 'renders', the
+            total and mean 'bytes' and the total and mean encode time.
+        """
+        with self._encode_lock:
+            totals = {key: list(value) for key, value in self._encode_totals.items()}
+        return {
+            f"{profile}:{fmt}": {
+                'renders': count,
+                'bytes': size,
+                'mean_bytes': size / count,
+                'seconds': seconds,
+                'mean_ms': seconds * 1000 / count,
+            }
+            for (profile, fmt), (count, size, seconds) in sorted(totals.items())
+        }
 
-        # Resize the image while maintaining the aspect ratio
-        aspect_ratio = img.height / img.width
-        new_height = int(width * aspect_ratio)
-        img = img.resize((width, new_height))
+    def make_variants(self, img_path: str, text: str, author: str,
+                      widths: Iterable[int] = (1080, 640, 320),
+                      formats: Iterable[str] = ('WEBP', 'JPEG')) -> List[dict]:
+        """
+        Render a meme at several widths and in several formats in one pass.
+
+        The source image is decoded once at the largest width and the text
+        is drawn once on it. Each smaller width is derived by downscaling
+        the previous one, and all variants are encoded in parallel threads
+        with `encode`, using the profile of their format from
+        `variant_profiles`, so they count towards `encoding_stats`.
+        Variants that already exist in the output store are not encoded
+        again.
+
+        Args:
+            img_path (str): The path to the input image file.
+            text (str): The quote text to be drawn on the meme.
+            author (str): The author of the quote to be included in the meme.
+            widths (Iterable[int], optional): The output widths. Defaults
+                                              to (1080, 640, 320).
+            formats (Iterable[str], optional): The Pillow formats to encode
+                                               each width in, e.g. 'WEBP',
+                                               'JPEG', 'PNG' or 'AVIF' when
+                                               a plugin provides it.
+                                               Defaults to ('WEBP', 'JPEG').
 
+        Returns:
+            List[dict]: A manifest with one entry per variant, holding its
+            'width', 'height', 'format', 'path', size in 'bytes' and the
+            encode time in 'encode_ms' (0 when an existing file was reused).
+
+        Raises:
+            ValueError: If no widths or no formats are given, a width is not
+                        positive, Pillow cannot write one of the formats,
+                        or no encoder profile produces it.
+            IOError: If the input image cannot be opened.
+        """
+        widths = sorted(set(widths), reverse=True)
+        formats = list(dict.fromkeys(fmt.upper() for fmt in formats))
+        if not widths:
+            raise ValueError('make_variants needs at least one width')
+        if not formats:
+            raise ValueError('make_variants needs at least one format')
+        if widths[-1] <= 0:
+            raise ValueError(f'Cannot render memes {widths[-1]} pixels wide')
+        Image.init()
+        for fmt in formats:
+            if fmt not in Image.SAVE or fmt not in self.variant_profiles:
+                raise ValueError(f'Cannot encode memes as {fmt}')
+
+        targets = [(width, fmt, self.store.path_for(
+                        self._output_key(img_path, text, author, width, fmt),
+                        self.variant_extensions.get(fmt, fmt.lower())))
+                   for width in widths for fmt in formats]
+
+        reused = {path for _, _, path in targets if self.store.reuse(path)}
+        images = {}
+        if len(reused) < len(targets):
+            img = self.load_image(img_path, widths[0])
+            self.draw_text(img, text, author)
+            img = img.convert('RGBA' if img.mode in ('RGBA', 'LA', 'P') else 'RGB')
+            for width in widths:
+                if width != img.width:
+                    img = ImageCache.resize(img, width, self.resample)
+                images[width] = img
+
+        def encode(target):
+            width, fmt, path = target
+            encode_ms = 0.0
+            if path not in reused:
+                result = self.encode(images[width], self.variant_profiles[fmt])
+                self._write(result.data, path)
+                encode_ms = result.seconds * 1000
+            if width in images:
+                height = images[width].height
+            else:
+                with Image.open(path) as encoded:  # reads the header only
+                    height = encoded.height
+            return {'width': width, 'height': height, 'format': fmt,
+                    'path': path, 'bytes': os.path.getsize(path),
+                    'encode_ms': encode_ms}
+
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            manifest = list(executor.map(encode, targets))
+        self.store.maybe_sweep()
+        return manifest
+
+    def load_image(self, source: Union[str, bytes, BinaryIO, Image.Image],
+                   width: int) -> Image.Image:
+        """
+        Load an image from any supported source, resized to the given width.
+
+        Paths go through the image cache; bytes, file-like objects and PIL
+        images are decoded (or copied) in memory.
+
+        Args:
+            source (str, bytes, file-like or Image.Image): The image.
+            width (int): The desired width; the height keeps the aspect ratio.
+
+        Returns:
+            Image.Image: A resized image that the caller may draw on.
+
+        Raises:
+            IOError: If the image cannot be decoded.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            return self.image_cache.get(source, width, self.resample)
+        if isinstance(source, Image.Image):
+            return ImageCache.resize(source, width, self.resample)
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        with Image.open(source) as img:
+            size = ImageCache.target_size(img, width)
+            if img.format == 'JPEG' and img.mode in ('RGB', 'L'):
+                img.draft(img.mode, size)
+            return ImageCache.resize(img, width, self.resample, size)
+
+    def draw_text(self, img: Image.Image, text: str, author: str):
+        """
+        Draw a quote and its author centred at the top or bottom of an image.
+
+        The text is wrapped to the image width at the largest font size
+        that fits (see `layout.fit_text`) and outlined so it stays readable
+        on any background. Layouts are cached, so repeated quotes cost no
+        font loading or text measurement.
+
+        Args:
+            img (Image.Image): The image to draw on; it is modified in place.
+            text (str): The quote text to be drawn on the meme.
+            author (str): The author of the quote to be included in the meme.
+        """
         # Prepare to draw on the image
         draw = ImageDraw.Draw(img)
 
-        # Load a default font
-        try:
-            font = ImageFont.truetype("arial.ttf", 20)
-        except IOError:
-            font = ImageFont.load_default()
+        # Wrap the text and pick the largest font size that fits (cached)
+        layout = fit_text(text, author, img.width, img.height, self.font_path,
+                          self.min_font_size, self.max_font_size, self.position)
 
-        # Prepare the text to be drawn
-        full_text = f"{text}\n- {author}"
-        text_width, text_height = draw.textsize(full_text, font=font)
+        # Draw the outlined text onto the image
+        draw.multiline_text((layout.x, layout.y), '\n'.join(layout.lines),
+                            font=layout.font, fill=self.fill, align='center',
+                            spacing=LINE_SPACING, stroke_width=self.stroke_width,
+                            stroke_fill=self.stroke_fill)
 
-        # Calculate text position (centered)
-        text_x = (img.width - text_width) / 2
-        text_y = img.height - text_height - 10  # 10 pixels from the bottom
+    def render(self, source: Union[str, bytes, BinaryIO, Image.Image], text: str,
+               author: str, width: int = 500, format: str = None) -> io.BytesIO:
+        """
+        Render a meme entirely in memory.
 
-        # Draw the text onto the image
-        draw.text((text_x, text_y), full_text, font=font, fill="white")
+        Args:
+            source (str, bytes, file-like or Image.Image): The input image.
+            text (str): The quote text to be drawn on the meme.
+            author (str): The author of the quote to be included in the meme.
+            width (int, optional): The desired width of the output meme.
+                                   Defaults to 500 pixels.
+            format (str, optional): The Pillow format to encode with, using
+                                    its default options. Defaults to the
+                                    engine's encoder profile.
+
+        Returns:
+            io.BytesIO: The encoded meme, positioned at the start.
+
+        Raises:
+            IOError: If the input image cannot be decoded.
+        """
+        if format is None:
+            return io.BytesIO(self.render_encoded(source, text, author, width).data)
 
-        # Save the manipulated image
-        output_path = os.path.join(self.output_dir, "meme.png")
-        img.save(output_path)
+        img = self.load_image(source, width)
+        self.draw_text(img, text, author)
+        if format.upper() == 'JPEG' and img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+
+        output = io.BytesIO()
+        img.save(output, format=format)
+        output.seek(0)
+        return output
+
+    def render_encoded(self, source: Union[str, bytes, BinaryIO, Image.Image],
+                       text: str, author: str, width: int = 500,
+                       profile: str = None) -> EncodeResult:
+        """
+        Render a meme in memory and encode it with an encoder profile.
+
+        Args:
+            source (str, bytes, file-like or Image.Image): The input image.
+            text (str): The quote text to be drawn on the meme.
+            author (str): The author of the quote to be included in the meme.
+            width (int, optional): The desired width of the output meme.
+                                   Defaults to 500 pixels.
+            profile (str, optional): The encoder profile. Defaults to the
+                                     engine's profile.
+
+        Returns:
+            EncodeResult: The encoded meme with its format and timings.
+
+        Raises:
+            IOError: If the input image cannot be decoded.
+            ValueError: If profile is not a known encoder profile.
+        """
+        img = self.load_image(source, width)
+        self.draw_text(img, text, author)
+        return self.encode(img, profile)
+
+    def make_memes(self, jobs: Iterable, workers: int = None,
+                   chunk_size: int = 64) -> Iterator[Tuple[MemeJob, Optional[str]]]:
+        """
+        Render many memes in parallel with a process pool.
+
+        Jobs are grouped by source image and sent to the workers in chunks,
+        so each image is decoded at most once per worker. Results are
+        yielded as soon as a chunk finishes, not in submission order.
+
+        Args:
+            jobs (Iterable): MemeJob instances, or tuples of
+                             (img_path, text, author[, width]).
+            workers (int, optional): The number of worker processes.
+                                     Defaults to the number of CPUs.
+            chunk_size (int, optional): The maximum number of jobs sent to
+                                        a worker at once. Defaults to 64.
+
+        Yields:
+            Tuple[MemeJob, Optional[str]]: Each job with the path of its
+            meme, or None if it could not be rendered.
+        """
+        groups = OrderedDict()
+        for job in jobs:
+            job = MemeJob(*job)
+            groups.setdefault(job.img_path, []).append(job)
 
-        return output_path
\ No newline at end of file
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_render_jobs, type(self), self.output_dir,
+                                self.settings, group[i:i + chunk_size])
+                for group in groups.values()
+                for i in range(0, len(group), chunk_size)
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
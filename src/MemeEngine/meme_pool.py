@@ -0,0 +1,147 @@
+"""
+Meme Pool Module.
+
+This module provides the MemePool class, which keeps a pool of
+pre-rendered random memes so the random meme route does not have to
+render inside the request. A background producer thread tops the pool
+up whenever memes are taken out of it.
+
+Classes:
+- MemePool: A bounded pool of pre-rendered (image, quote) memes filled by
+  a background thread.
+
+Usage:
+Create a MemePool with a MemeEngine, the list of image paths and the list
+of quotes (or a QuoteSampler), call `start` once, and call `get` to take a
+rendered meme path.
+When the pool is empty `get` renders synchronously instead.
+"""
+
+import os
+import random
+import threading
+from collections import deque
+from typing import Callable, List, Union
+
+
+class MemePool:
+    """
+    A pool of pre-rendered random memes.
+
+    Attributes:
+        engine (MemeEngine): The engine used to render memes.
+        size (int): The number of memes the producer keeps ready.
+        hits (int): The number of memes served from the pool.
+        misses (int): The number of memes rendered synchronously because
+                      the pool was empty.
+    """
+
+    def __init__(self, engine, imgs: Union[List[str], Callable[[], List[str]]],
+                 quotes: Union[list, Callable[[], list]], size: int = 16):
+        """
+        Initialize a MemePool.
+
+        Args:
+            engine (MemeEngine): The engine used to render memes.
+            imgs (list or callable): The image paths to choose from, or a
+                                     callable returning them.
+            quotes (list or callable): The QuoteModel instances to choose
+                                       from, or a sampler with a `choice`
+                                       method such as QuoteSampler, or a
+                                       callable returning either.
+            size (int, optional): The number of memes to keep ready.
+                                  Defaults to 16.
+        """
+        self.engine = engine
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._imgs = imgs
+        self._quotes = quotes
+        self._pool = deque()
+        self._wakeup = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    def _choices(self):
+        """Return the current image and quote lists."""
+        imgs = self._imgs() if callable(self._imgs) else self._imgs
+        quotes = self._quotes() if callable(self._quotes) else self._quotes
+        return imgs, quotes
+
+    def render_one(self) -> str:
+        """
+        Render a single random meme.
+
+        Returns:
+            str: The path to the rendered meme.
+        """
+        imgs, quotes = self._choices()
+        img = random.choice(imgs)
+        quote = quotes.choice() if hasattr(quotes, 'choice') else random.choice(quotes)
+        return self.engine.make_meme(img, quote.body, quote.author)
+
+    def start(self):
+        """Start the background producer thread if it is not running yet."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._produce, name='meme-pool',
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Ask the background producer thread to exit."""
+        with self._wakeup:
+            self._stopped = True
+            self._wakeup.notify()
+
+    def get(self) -> str:
+        """
+        Take a pre-rendered meme from the pool.
+
+        The pool is refilled in the background. When the pool is empty,
+        or the pooled file has been swept from disk in the meantime, a meme
+        is rendered synchronously instead.
+
+        Returns:
+            str: The path to a rendered meme.
+        """
+        path = None
+        with self._wakeup:
+            while self._pool:
+                candidate = self._pool.popleft()
+                if os.path.exists(candidate):
+                    path = candidate
+                    break
+            self._wakeup.notify()
+
+        if path is not None:
+            self.hits += 1
+            return path
+
+        self.misses += 1
+        return self.render_one()
+
+    def __len__(self):
+        """Return the number of memes currently ready."""
+        return len(self._pool)
+
+    def _produce(self):
+        """Keep the pool filled until `stop` is called."""
+        while True:
+            with self._wakeup:
+                while not self._stopped and len(self._pool) >= self.size:
+                    self._wakeup.wait()
+                if self._stopped:
+                    return
+
+            try:
+                path = self.render_one()
+            except Exception as ex:
+                print(f"error rendering pooled meme, meme_pool.py: {ex}")
+                with self._wakeup:
+                    self._wakeup.wait(timeout=1)
+                continue
+
+            with self._wakeup:
+                self._pool.append(path)
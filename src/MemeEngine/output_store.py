@@ -0,0 +1,172 @@
+"""
+Output Store Module.
+
+This module provides the OutputStore class, a content-addressed store for
+rendered memes. Output file names are derived from a hash of everything
+that influences the rendered pixels, so concurrent requests never overwrite
+each other's files, browsers never see a stale image under a reused name,
+and an identical request can reuse the file that is already on disk.
+
+Classes:
+- OutputStore: Maps render parameters to stable file names inside a
+  directory and keeps the directory bounded with a size/age sweeper.
+
+Usage:
+Create an OutputStore for a directory, call `path_for` with the render
+parameters to get the output path, and only render when `reuse` reports
+that the path does not exist yet. Call `sweep` (or `maybe_sweep` after
+each write) to evict old files once the directory grows beyond its
+limits. The meme engine sweeps its output directory this way; remote
+images are fetched into memory, so there is no download directory to
+sweep.
+"""
+
+import hashlib
+import os
+import threading
+import time
+
+
+class OutputStore:
+    """
+    A content-addressed directory of rendered memes.
+
+    Attributes:
+        directory (str): The directory that holds the output files.
+        max_bytes (int): The total size the directory may grow to before
+                         the oldest files are evicted.
+        max_age (float): The age in seconds after which files are evicted.
+        sweep_interval (float): The minimum number of seconds between two
+                                automatic sweeps.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024,
+                 max_age: float = 24 * 60 * 60, sweep_interval: float = 60):
+        """
+        Initialize an OutputStore for the given directory.
+
+        Args:
+            directory (str): The directory to store files in. It is created
+                             if it does not exist.
+            max_bytes (int, optional): The size budget for the directory.
+                                       Defaults to 256 MiB.
+            max_age (float, optional): The maximum file age in seconds.
+                                       Defaults to one day.
+            sweep_interval (float, optional): Seconds between automatic
+                                              sweeps. Defaults to 60.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def image_identity(img_path: str) -> str:
+        """
+        Describe a source image by its path, size and modification time.
+
+        Args:
+            img_path (str): The path to the source image.
+
+        Returns:
+            str: A string that changes whenever the image file changes.
+        """
+        stat = os.stat(img_path)
+        return f"{os.path.abspath(img_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    @staticmethod
+    def key(*parts) -> str:
+        """
+        Hash the given render parameters into a hex digest.
+
+        Args:
+            *parts: The values that determine the rendered output.
+
+        Returns:
+            str: A hex digest that is stable for identical parameters.
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(repr(part).encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()[:32]
+
+    def path_for(self, key: str, ext: str = 'png') -> str:
+        """
+        Return the output path for a key.
+
+        Args:
+            key (str): The key returned by `key`.
+            ext (str, optional): The file extension. Defaults to 'png'.
+
+        Returns:
+            str: The path inside the store directory.
+        """
+        return os.path.join(self.directory, f"{key}.{ext}")
+
+    def reuse(self, path: str) -> bool:
+        """
+        Mark an existing output as used, so the sweeper keeps it.
+
+        The sweeper evicts by modification time, so the time is refreshed
+        on every reuse; frequently requested memes stay, unused ones age
+        out.
+
+        Args:
+            path (str): The path returned by `path_for`.
+
+        Returns:
+            bool: True if the output exists and can be reused, False if it
+            has to be rendered.
+        """
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def maybe_sweep(self):
+        """Run `sweep` if at least sweep_interval seconds passed since the last one."""
+        now = time.monotonic()
+        if now - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = now
+        self.sweep()
+
+    def sweep(self) -> int:
+        """
+        Evict files older than max_age, then the oldest files until the
+        directory fits into max_bytes.
+
+        Returns:
+            int: The number of files removed.
+        """
+        with self._lock:
+            now = time.time()
+            entries = []
+            for entry in os.scandir(self.directory):
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            entries.sort()
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for mtime, size, path in entries:
+                if now - mtime <= self.max_age and total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError as ex:
+                    print(f"error removing output file, output_store.py: {ex}")
+                    continue
+                total -= size
+                removed += 1
+            return removed
@@ -7,7 +7,30 @@ quotes from various file formats and defining quote models.
 Modules:
 - Ingestor: Responsible for parsing different quote file formats.
 - QuoteModel: Defines the structure for quote objects.
+- QuoteCache: Persists parsed quotes so unchanged files are not re-parsed.
+- QuoteStore: A compact columnar container for large numbers of quotes.
+- QuoteIndex: Indexes quotes for fast lookup by author or body and completion.
+- FileWatcher: Polls quote files for changes so they can be reloaded.
+- register_ingestor: Registers an ingestor for more file extensions.
+- QuoteFile: A memory-mapped binary columnar quote file, compiled from
+  any ingestible sources for fast loading.
+- QuoteSampler: Draws random quotes in constant time, weighted per source
+  or author, without repeating recent quotes.
+- QuoteDeduplicator: Drops repeated quotes after parsing, by a hash of the
+  normalized body and author, and optionally near duplicates.
+
+Quote files are dispatched by extension (CSV, DOCX, PDF, TXT, JSON Lines,
+Parquet, compiled .qbin quote files and gzip-compressed TXT/CSV/JSON
+Lines), or by content when the extension is missing or unknown.
 """
 
 from .ingestor import Ingestor
-from .models import QuoteModel
\ No newline at end of file
+from .models import QuoteModel
+from .quote_cache import QuoteCache
+from .quote_store import QuoteStore
+from .quote_index import QuoteIndex
+from .file_watcher import FileWatcher
+from .registry import register_ingestor
+from .quote_file import QuoteFile
+from .quote_sampler import QuoteSampler
+from .quote_dedup import QuoteDeduplicator, DedupStats
@@ -0,0 +1,10 @@
+"""
+Compile quote files into a binary quote file.
+
+Usage (from the src directory):
+    python -m QuoteEngine -o ./_data/quotes.qbin ./_data/DogQuotes/*
+"""
+
+from .quote_file import main
+
+main()
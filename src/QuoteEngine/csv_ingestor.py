@@ -13,12 +13,12 @@ Classes:
 Usage:
 To use the CSVIngestor, call the `can_ingest` method to check if a given 
 file is a CSV file, and then use the `parse` method to read the file 
-and extract quotes.
+and extract quotes, or `iter_parse` to stream them one row at a time.
 """
 
 import csv
-from typing import List
-from .ingestor import IngestorInterface
+from typing import Iterator, List
+from .ingestor import IngestorInterface, report_error
 from .models import QuoteModel
 
 
@@ -47,7 +47,7 @@ class CSVIngestor(IngestorInterface):
         Returns:
             bool: True if the file can be ingested, False otherwise.
         """
-        return path.endswith('.csv')
+        return path.lower().endswith('.csv')
 
     @classmethod
     def parse(cls, path: str) -> List[QuoteModel]:
@@ -68,14 +68,44 @@ class CSVIngestor(IngestorInterface):
         Logs any exceptions that occur during file processing to the
         error log file specified by error_file.
         """
-        quotes = []
+        return list(cls.iter_parse(path))
+
+    @classmethod
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """
+        Stream the quotes of a CSV file one row at a time.
+
+        Args:
+            path (str): The path to the CSV file to be parsed.
+
+        Yields:
+            QuoteModel: A QuoteModel instance for each quote-author row.
+
+        Logs any exceptions that occur during file processing; quotes
+        yielded before the error are kept.
+        """
         try:
             with open(path, 'r', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip the header row
-                for row in reader:
-                    if len(row) == 2:
-                        quotes.append(QuoteModel(body=row[0], author=row[1]))
+                yield from cls.iter_parse_stream(file)
         except Exception as ex:
-            print(f"error with open error, csv_ingestor line 19: {ex}")
-        return quotes
+            report_error(f"error with open error, csv_ingestor line 19: {ex}")
+
+    @classmethod
+    def iter_parse_stream(cls, file) -> Iterator[QuoteModel]:
+        """
+        Stream the quotes of an open CSV text stream one row at a time.
+
+        Used for CSV files and for compressed CSV files opened by the
+        gzip ingestor.
+
+        Args:
+            file: A text stream holding CSV with a header row.
+
+        Yields:
+            QuoteModel: A QuoteModel instance for each quote-author row.
+        """
+        reader = csv.reader(file)
+        next(reader, None)  # Skip the header row
+        for row in reader:
+            if len(row) == 2:
+                yield QuoteModel(body=row[0], author=row[1])
@@ -14,13 +14,14 @@ Classes:
 Usage:
 To use the DOCXIngestor, check if a .docx file can be ingested using
 the `can_ingest` method. If the file can be ingested, call the `parse`
-method to extract quotes in the format "quote - author".
+method to extract quotes in the format "quote - author", or `iter_parse`
+to stream them paragraph by paragraph.
 """
 
-from typing import List
-from docx import Document
-from .ingestor import IngestorInterface
+from typing import Iterator, List
+from .ingestor import IngestorInterface, report_error
 from .models import QuoteModel
+from .quote_lines import parse_lines
 
 class DOCXIngestor(IngestorInterface):
     """
@@ -36,6 +37,9 @@ class DOCXIngestor(IngestorInterface):
         
         parse(cls, path: str) -> List[QuoteModel]:
             Parses the .docx file and returns a list of QuoteModel instances.
+
+        iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+            Yields the QuoteModel instances of the .docx file one at a time.
     """
     
     @classmethod
@@ -50,16 +54,17 @@ class DOCXIngestor(IngestorInterface):
         Returns:
             bool: True if the file can be ingested (i.e., it ends with .docx), False otherwise.
         """
-        return path.endswith('.docx')
+        return path.lower().endswith('.docx')
 
     @classmethod
     def parse(cls, path: str) -> List[QuoteModel]:
         """
         Parse the specified .docx file to extract quotes.
 
-        The method reads the document, splits each paragraph by the 
-        delimiter ' - ', and creates QuoteModel instances from the 
-        resulting body and author.
+        The method reads the document, splits each paragraph at its last
+        ' - ' delimiter, and creates QuoteModel instances from the
+        resulting body and author. Malformed paragraphs are skipped and
+        reported with their paragraph numbers.
 
         Args:
             cls: The class itself.
@@ -71,13 +76,28 @@ class DOCXIngestor(IngestorInterface):
         Raises:
             Exception: Any exceptions raised during file reading are logged to an error file.
         """
-        quotes = []
+        return list(cls.iter_parse(path))
+
+    @classmethod
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """
+        Stream the quotes of the specified .docx file paragraph by paragraph.
+
+        Args:
+            cls: The class itself.
+            path (str): The path to the .docx file to be parsed.
+
+        Yields:
+            QuoteModel: A QuoteModel instance for each "quote - author" paragraph.
+
+        Raises:
+            Exception: Any exceptions raised during file reading are logged
+                       and end the stream.
+        """
         try:
+            # Imported here so python-docx is only loaded when a .docx is read
+            from docx import Document
             doc = Document(path)
-            for para in doc.paragraphs:
-                if para.text:
-                    body, author = para.text.split(' - ')  # Assuming format "quote - author"
-                    quotes.append(QuoteModel(body=body, author=author))
+            yield from parse_lines((para.text for para in doc.paragraphs), path)
         except Exception as ex:
-            print(f"error with open error, docx_ingestor line 19: {ex}")
-        return quotes
\ No newline at end of file
+            report_error(f"error with open error, docx_ingestor line 19: {ex}")
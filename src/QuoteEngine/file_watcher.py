@@ -0,0 +1,101 @@
+"""
+File Watcher Module.
+
+This module provides the FileWatcher class, which polls a set of files
+for changes from a background thread and reports the files that were
+added, modified or removed. Polling only calls `os.stat`, so it works on
+every platform and costs next to nothing for the handful of quote files
+the application reads.
+
+Classes:
+- FileWatcher: Polls files for changes and calls back with the changed
+  paths.
+
+Usage:
+Create a FileWatcher with the paths to watch (or a callable returning
+them) and a callback taking the list of changed paths, then call `start`.
+Call `check` directly to poll once without a thread.
+"""
+
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+
+class FileWatcher:
+    """
+    Poll files for changes from a background thread.
+
+    A file counts as changed when its size or modification time changes,
+    when it appears, or when it disappears.
+
+    Attributes:
+        interval (float): The number of seconds between polls.
+        callback (Callable): Called with the list of changed paths.
+    """
+
+    def __init__(self, paths: Union[Iterable[str], Callable[[], Iterable[str]]],
+                 callback: Callable[[List[str]], None], interval: float = 2.0):
+        """
+        Initialize the FileWatcher, recording the current state of the files.
+
+        Args:
+            paths (Iterable[str] or callable): The files to watch, or a
+                                               callable returning them.
+            callback (Callable[[List[str]], None]): Called from the watcher
+                                                    thread with the paths
+                                                    that changed.
+            interval (float, optional): The seconds between polls.
+                                        Defaults to 2.
+        """
+        self._paths = paths if callable(paths) else list(paths)
+        self.callback = callback
+        self.interval = interval
+        self._state = self._snapshot()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def _snapshot(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        """Return the (size, mtime) of each watched file, None if missing."""
+        paths = self._paths() if callable(self._paths) else self._paths
+        state = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                state[path] = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                state[path] = None
+        return state
+
+    def check(self) -> List[str]:
+        """
+        Poll the files once and call the callback if any changed.
+
+        Returns:
+            List[str]: The paths that changed since the previous poll.
+        """
+        state = self._snapshot()
+        changed = [path for path in state.keys() | self._state.keys()
+                   if state.get(path) != self._state.get(path)]
+        self._state = state
+        if changed:
+            try:
+                self.callback(sorted(changed))
+            except Exception as ex:
+                print(f"error reloading changed files, file_watcher.py: {ex}")
+        return changed
+
+    def _run(self):
+        """Poll until stopped."""
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def start(self):
+        """Start polling in a daemon thread; calling it twice is harmless."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='file-watcher', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop polling."""
+        self._stopped.set()
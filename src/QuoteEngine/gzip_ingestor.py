@@ -0,0 +1,117 @@
+"""
+Gzip Ingestor Module.
+
+This module contains the GzipIngestor class, which ingests gzip-compressed
+quote files (.txt.gz, .csv.gz, .jsonl.gz). The file is decompressed while
+it is read and handed to the ingestor of the inner format, so a compressed
+file never has to be unpacked to disk or held in memory.
+
+Classes:
+- GzipIngestor: A class for handling the ingestion of compressed text
+  quote files.
+
+Usage:
+Call `parse` or `iter_parse` with the path of a compressed file. The inner
+format is taken from the name without '.gz', or sniffed from the
+decompressed content when the name does not tell.
+"""
+
+import gzip
+from typing import Iterator, List
+from .ingestor import IngestorInterface, report_error
+from .models import QuoteModel
+
+
+class GzipIngestor(IngestorInterface):
+    """
+    GzipIngestor is a class for ingesting gzip-compressed quote files.
+
+    The inner ingestor must provide `iter_parse_stream`, which the TXT,
+    CSV and JSON Lines ingestors do.
+
+    Methods:
+        can_ingest(path: str) -> bool:
+            Determines if the file at the given path is gzip-compressed.
+
+        parse(path: str) -> List[QuoteModel]:
+            Parses the file and returns a list of QuoteModel instances.
+
+        inner_ingestor(path: str) -> type:
+            Returns the ingestor of the compressed content.
+    """
+
+    @classmethod
+    def can_ingest(cls, path: str) -> bool:
+        """
+        Check if the specified file can be ingested.
+
+        Args:
+            path (str): The path to the file being checked.
+
+        Returns:
+            bool: True if the file name ends with '.gz', False otherwise.
+        """
+        return path.lower().endswith('.gz')
+
+    @classmethod
+    def inner_ingestor(cls, path: str):
+        """
+        Return the ingestor for the decompressed content of a file.
+
+        Args:
+            path (str): The path to the compressed file.
+
+        Returns:
+            type: An ingestor class with an `iter_parse_stream` method.
+
+        Raises:
+            Exception: If the compressed content cannot be ingested.
+        """
+        from .registry import registry
+
+        extension = None
+        if path.lower().endswith('.gz'):
+            extension = registry.extension_for(path[:-3])
+        if extension is None:
+            with gzip.open(path, 'rb') as file:
+                extension = registry.sniff_bytes(file.read(2048))
+
+        ingestor = registry.get(extension) if extension else None
+        if ingestor is None or not hasattr(ingestor, 'iter_parse_stream'):
+            raise Exception(f'Cannot ingest compressed file at {path}')
+        return ingestor
+
+    @classmethod
+    def parse(cls, path: str) -> List[QuoteModel]:
+        """
+        Parse quotes from a gzip-compressed file.
+
+        Args:
+            path (str): The path to the file to be parsed.
+
+        Returns:
+            List[QuoteModel]: A list of QuoteModel instances.
+        """
+        return list(cls.iter_parse(path))
+
+    @classmethod
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """
+        Stream the quotes of a gzip-compressed file while decompressing it.
+
+        Args:
+            path (str): The path to the file to be parsed.
+
+        Yields:
+            QuoteModel: The quotes of the decompressed content.
+
+        Raises:
+            Exception: Errors opening or reading the file are logged and
+                       end the stream.
+        """
+        try:
+            ingestor = cls.inner_ingestor(path)
+            with gzip.open(path, 'rt', encoding='utf-8-sig') as file:
+                yield from ingestor.iter_parse_stream(file)
+        except Exception as ex:
+            report_error(f"error with open error, gzip_ingestor: {ex}")
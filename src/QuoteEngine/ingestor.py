@@ -15,19 +15,74 @@ Classes:
 
 - Ingestor: A class that manages the ingestion process by selecting the
   appropriate ingestor implementation based on the file type and calling
-  its parsing method.
+  its parsing method. It can also ingest many files concurrently.
 
 Usage:
 To use the ingestion framework, create a new ingestor class that inherits
 from IngestorInterface and implements the required methods. Then, use the
 Ingestor class to parse files by providing the file path. The correct
-ingestor will be selected automatically based on the file type.
+ingestor will be selected automatically based on the file type. Register
+the new class for its extensions with `registry.register_ingestor`, or
+declare it as a "quote_engine.ingestors" entry point of a package.
+Ingestors that catch errors reading a file pass them to `report_error`,
+so `Ingestor.parse_each` can still report them per file.
 """
 
+import random
 from abc import ABC, abstractmethod
-from typing import List
+from contextvars import ContextVar
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Tuple
 from .models import QuoteModel
 
+# Set while `Ingestor.parse` runs with raise_errors, in that thread or process
+_raise_errors = ContextVar('raise_errors', default=False)
+
+
+def report_error(message: str):
+    """
+    Report an error an ingestor caught while reading a file.
+
+    Call it from the ingestor's except block. It prints the message, or
+    re-raises the exception being handled when `Ingestor.parse` was asked
+    to raise errors, so `parse_each` can record the error for the file.
+
+    Args:
+        message (str): The message printed when errors are not raised.
+    """
+    if _raise_errors.get():
+        raise
+    print(message)
+
+
+def reservoir_sample(items: Iterable, k: int = 1, rng: random.Random = None) -> List:
+    """
+    Pick k items uniformly at random from an iterable of unknown length.
+
+    Only the k picked items are kept in memory, so this works on streams
+    that are far too large to materialize.
+
+    Args:
+        items (Iterable): The items to sample from.
+        k (int, optional): The number of items to pick. Defaults to 1.
+        rng (random.Random, optional): The random number generator to use.
+                                       Defaults to the random module.
+
+    Returns:
+        List: Up to k items, fewer if the iterable is shorter than k.
+    """
+    rng = rng or random
+    reservoir = []
+    for seen, item in enumerate(items):
+        if seen < k:
+            reservoir.append(item)
+        else:
+            slot = rng.randint(0, seen)
+            if slot < k:
+                reservoir[slot] = item
+    return reservoir
+
+
 class IngestorInterface(ABC):
     """
     Abstract base class for defining the interface for ingestor classes.
@@ -42,8 +97,18 @@ class IngestorInterface(ABC):
         
         parse(cls, path: str) -> List[QuoteModel]:
             Parses the given file and returns a list of QuoteModel instances.
+
+        iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+            Yields the QuoteModel instances of the given file lazily.
+
+    Attributes:
+        cacheable (bool): Whether parsed quotes are worth keeping in the
+                          quote cache. Ingestors of formats that open
+                          faster than a cache entry set it to False.
     """
 
+    cacheable = True
+
     @classmethod
     @abstractmethod
     def can_ingest(cls, path: str) -> bool:
@@ -74,6 +139,22 @@ class IngestorInterface(ABC):
         """
         pass
 
+    @classmethod
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """
+        Yield the quotes of the specified file one at a time.
+
+        Ingestors that can read their format incrementally override this
+        to keep memory bounded; the default falls back to `parse`.
+
+        Args:
+            cls: The class itself.
+            path (str): The path to the file to parse.
+
+        Yields:
+            QuoteModel: The quotes extracted from the file.
+        """
+        yield from cls.parse(path)
 
 
 class Ingestor:
@@ -86,35 +167,178 @@ class Ingestor:
     Methods:
         parse(cls, path: str) -> List:
             Parses the given file path using the appropriate ingestor.
+
+        iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+            Streams the quotes of the given file using the appropriate ingestor.
+
+        sample(cls, path: str, k: int = 1) -> List[QuoteModel]:
+            Picks random quotes from a file without loading all of it.
+
+        parse_each(cls, paths, workers=None, processes=False) -> List[Tuple]:
+            Parses several files concurrently, returning each file's result.
+
+        parse_many(cls, paths, workers=None, processes=False) -> Tuple[List, Dict]:
+            Parses several files concurrently and merges the results.
     """
     
     @classmethod
-    def parse(cls, path: str) -> List:
+    def ingestor_for(cls, path: str):
+        """
+        Return the ingestor class that can handle the specified file.
+
+        The ingestor is looked up by the file's extension, ignoring case,
+        in the ingestor registry; files with an unknown or missing
+        extension are identified by their content. Ingestor modules are
+        imported on first use (see `registry`).
+
+        Args:
+            cls: The class itself.
+            path (str): The path to the file.
+
+        Returns:
+            type: The IngestorInterface implementation for the file.
+
+        Raises:
+            Exception: If no ingestor can handle the specified file type.
+        """
+        from .registry import registry
+
+        return registry.ingestor_for(path)
+
+    @classmethod
+    def parse(cls, path: str, raise_errors: bool = False) -> List:
         """
         Parse the specified file using the appropriate ingestor.
 
-        This method checks the file path against known ingestor classes
-        and uses the first one that can handle the file type.
+        Ingestors print the errors they catch reading a file and return
+        the quotes read so far; with raise_errors the error is raised
+        instead (see `report_error`).
 
         Args:
             cls: The class itself.
             path (str): The path to the file to be parsed.
+            raise_errors (bool, optional): Raise errors reading the file
+                                           instead of printing them.
+                                           Defaults to False.
 
         Returns:
             List: A list of quotes extracted from the file.
 
+        Raises:
+            Exception: If no ingestor can handle the specified file type,
+                       or, with raise_errors, if the file cannot be read.
+        """
+        token = _raise_errors.set(raise_errors)
+        try:
+            return cls.ingestor_for(path).parse(path)
+        finally:
+            _raise_errors.reset(token)
+
+    @classmethod
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """
+        Stream the quotes of the specified file using the appropriate ingestor.
+
+        Quotes are yielded as they are read (page by page for PDFs), so
+        memory use stays bounded however large the file is.
+
+        Args:
+            cls: The class itself.
+            path (str): The path to the file to be parsed.
+
+        Returns:
+            Iterator[QuoteModel]: The quotes extracted from the file.
+
         Raises:
             Exception: If no ingestor can handle the specified file type.
         """
-        from .csv_ingestor import CSVIngestor
-        from .docx_ingestor import DOCXIngestor
-        from .pdf_ingestor import PDFIngestor
-        from .txt_ingestor import TXTIngestor
-        
-        ingestors = [CSVIngestor, DOCXIngestor, PDFIngestor, TXTIngestor]
-        
-        for ingestor in ingestors:
-            if ingestor.can_ingest(path):
-                return ingestor.parse(path)
-        raise Exception(f'Cannot ingest file at {path}')
-    
\ No newline at end of file
+        return cls.ingestor_for(path).iter_parse(path)
+
+    @classmethod
+    def sample(cls, path: str, k: int = 1, rng: random.Random = None) -> List[QuoteModel]:
+        """
+        Pick k random quotes from a file without loading all of it.
+
+        The file is streamed through `iter_parse` and reservoir sampling,
+        so only the picked quotes are kept in memory.
+
+        Args:
+            cls: The class itself.
+            path (str): The path to the file to sample from.
+            k (int, optional): The number of quotes to pick. Defaults to 1.
+            rng (random.Random, optional): The random number generator.
+
+        Returns:
+            List[QuoteModel]: Up to k quotes picked uniformly at random.
+
+        Raises:
+            Exception: If no ingestor can handle the specified file type.
+        """
+        return reservoir_sample(cls.iter_parse(path), k, rng)
+
+    @classmethod
+    def parse_each(cls, paths: Iterable[str], workers: int = None,
+                   processes: bool = False) -> List[Tuple[str, List, Exception]]:
+        """
+        Parse several files concurrently and return the result of each file.
+
+        Files are parsed by a thread pool, or a process pool when processes
+        is True. A file that fails does not abort the others, and the
+        error is returned for it even if its ingestor would only print it.
+
+        Args:
+            cls: The class itself.
+            paths (Iterable[str]): The paths of the files to be parsed.
+            workers (int, optional): The number of threads or processes.
+                                     Defaults to the executor's default.
+            processes (bool, optional): Use a process pool instead of a
+                                        thread pool. Defaults to False.
+
+        Returns:
+            List[Tuple[str, List, Exception]]: One (path, quotes, error)
+            tuple per file in the order of paths; quotes is empty and error
+            is set for a file that could not be parsed.
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+
+        results = []
+        executor_cls = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with executor_cls(max_workers=workers) as executor:
+            futures = [executor.submit(cls.parse, path, True) for path in paths]
+            for path, future in zip(paths, futures):
+                try:
+                    results.append((path, future.result(), None))
+                except Exception as ex:
+                    print(f"error parsing {path}, ingestor.py: {ex}")
+                    results.append((path, [], ex))
+        return results
+
+    @classmethod
+    def parse_many(cls, paths: Iterable[str], workers: int = None,
+                   processes: bool = False) -> Tuple[List, Dict[str, Exception]]:
+        """
+        Parse several files concurrently and merge their quotes.
+
+        The quotes are merged in the order of paths, whatever order the
+        files finish in, and a file that fails does not abort the others.
+
+        Args:
+            cls: The class itself.
+            paths (Iterable[str]): The paths of the files to be parsed.
+            workers (int, optional): The number of threads or processes.
+                                     Defaults to the executor's default.
+            processes (bool, optional): Use a process pool instead of a
+                                        thread pool. Defaults to False.
+
+        Returns:
+            Tuple[List, Dict[str, Exception]]: The quotes of all files, and
+            the error raised for each file that could not be parsed.
+        """
+        quotes, errors = [], {}
+        for path, parsed, error in cls.parse_each(paths, workers, processes):
+            quotes.extend(parsed)
+            if error is not None:
+                errors[path] = error
+        return quotes, errors
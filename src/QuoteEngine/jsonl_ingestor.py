@@ -0,0 +1,109 @@
+"""
+JSONL Ingestor Module.
+
+This module contains the JSONLIngestor class, which is responsible for
+ingesting quotes from JSON Lines (.jsonl, .ndjson) files, where every line
+is a JSON object with a "body" and an "author".
+
+Classes:
+- JSONLIngestor: A class for handling the ingestion of JSON Lines files.
+
+Usage:
+To use the JSONLIngestor, check if the file can be ingested using the
+`can_ingest` method, then call `parse` to extract the quotes, or
+`iter_parse` to stream them line by line.
+"""
+
+import json
+from typing import Iterator, List
+from .ingestor import IngestorInterface, report_error
+from .models import QuoteModel
+
+
+class JSONLIngestor(IngestorInterface):
+    """
+    JSONLIngestor is a class for ingesting quotes from JSON Lines files.
+
+    Lines that are blank, are not JSON objects or lack a body or author
+    are skipped.
+
+    Methods:
+        can_ingest(path: str) -> bool:
+            Determines if the file at the given path is a JSON Lines file.
+
+        parse(path: str) -> List[QuoteModel]:
+            Parses the file and returns a list of QuoteModel instances.
+
+        iter_parse_stream(file) -> Iterator[QuoteModel]:
+            Yields the quotes of an open text stream one line at a time.
+    """
+
+    @classmethod
+    def can_ingest(cls, path: str) -> bool:
+        """
+        Check if the specified file can be ingested.
+
+        Args:
+            path (str): The path to the file being checked.
+
+        Returns:
+            bool: True if the file is a JSON Lines file, False otherwise.
+        """
+        return path.lower().endswith(('.jsonl', '.ndjson'))
+
+    @classmethod
+    def parse(cls, path: str) -> List[QuoteModel]:
+        """
+        Parse quotes from a JSON Lines file.
+
+        Args:
+            path (str): The path to the file to be parsed.
+
+        Returns:
+            List[QuoteModel]: A list of QuoteModel instances.
+        """
+        return list(cls.iter_parse(path))
+
+    @classmethod
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """
+        Stream the quotes of a JSON Lines file one line at a time.
+
+        Args:
+            path (str): The path to the file to be parsed.
+
+        Yields:
+            QuoteModel: A QuoteModel instance for each quote object.
+
+        Raises:
+            Exception: Errors opening or reading the file are logged and
+                       end the stream.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8-sig') as file:
+                yield from cls.iter_parse_stream(file)
+        except Exception as ex:
+            report_error(f"error with open error, jsonl_ingestor: {ex}")
+
+    @classmethod
+    def iter_parse_stream(cls, file) -> Iterator[QuoteModel]:
+        """
+        Stream the quotes of an open JSON Lines text stream.
+
+        Args:
+            file: A text stream with one JSON object per line.
+
+        Yields:
+            QuoteModel: A QuoteModel instance for each quote object.
+        """
+        for number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as ex:
+                print(f"error with line {number}, jsonl_ingestor: {ex}")
+                continue
+            if isinstance(record, dict) and record.get('body') and record.get('author'):
+                yield QuoteModel(body=str(record['body']), author=str(record['author']))
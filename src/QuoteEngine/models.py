@@ -18,8 +18,23 @@ the quote.
 Example:
     quote = QuoteModel("To be, or not to be.", "William Shakespeare")
     print(quote)  # Output: "To be, or not to be." - William Shakespeare
+
+QuoteModel instances use __slots__ and intern author names, so large
+numbers of quotes stay compact in memory.
 """
 
+import sys
+
+# Unicode characters replaced with their ASCII equivalents by clean_text
+_REPLACEMENTS = (
+    ('\u201c', '"'),  # Left double quotation mark
+    ('\u201d', '"'),  # Right double quotation mark
+    ('\u2018', "'"),  # Left single quotation mark
+    ('\u2019', "'"),  # Right single quotation mark
+    # Add more replacements as needed
+)
+
+
 class QuoteModel:
     """
     Represents a quote with its associated author.
@@ -39,7 +54,12 @@ class QuoteModel:
         clean_text(text: str) -> str:
             Cleans the provided text by replacing specific unicode characters 
             with their ASCII equivalents.
+
+        from_clean(body: str, author: str) -> QuoteModel:
+            Creates a QuoteModel from text that has already been cleaned.
     """
+
+    __slots__ = ('body', 'author')
     
     def __init__(self, body: str, author: str):
         """
@@ -50,7 +70,27 @@ class QuoteModel:
             author (str): The author of the quote.
         """
         self.body = self.clean_text(body.strip())
-        self.author = self.clean_text(author.strip())
+        self.author = sys.intern(self.clean_text(author.strip()))
+
+    @classmethod
+    def from_clean(cls, body: str, author: str) -> 'QuoteModel':
+        """
+        Create a QuoteModel from a body and author that are already clean.
+
+        This skips stripping and cleaning, for quotes that were cleaned
+        when they were first parsed (e.g. quotes loaded from a cache).
+
+        Args:
+            body (str): The cleaned text of the quote.
+            author (str): The cleaned author of the quote.
+
+        Returns:
+            QuoteModel: The quote.
+        """
+        quote = cls.__new__(cls)
+        quote.body = body
+        quote.author = sys.intern(author)
+        return quote
 
     def __str__(self):
         """
@@ -61,25 +101,24 @@ class QuoteModel:
         """
         return f'"{self.body}" - {self.author}'
     
-    def clean_text(self, text):
+    @staticmethod
+    def clean_text(text):
         """
         Clean the given text by replacing specific unicode characters with ASCII equivalents.
 
+        Pure ASCII text, the common case, is returned as is. Otherwise the
+        module-level replacement table is applied; chained str.replace
+        calls are several times faster than str.translate for the short
+        strings quotes are made of.
+
         Args:
             text (str): The text to be cleaned.
 
         Returns:
             str: The cleaned text with replacements made.
         """
-        replacements = {
-            '\u201c': '"',  # Left double quotation mark
-            '\u201d': '"',  # Right double quotation mark
-            '\u2018': "'",  # Left single quotation mark
-            '\u2019': "'",  # Right single quotation mark
-            # Add more replacements as needed
-        }
-
-        for old_char, new_char in replacements.items():
+        if text.isascii():
+            return text
+        for old_char, new_char in _REPLACEMENTS:
             text = text.replace(old_char, new_char)
-
-        return text
\ No newline at end of file
+        return text
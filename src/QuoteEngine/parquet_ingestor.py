@@ -0,0 +1,92 @@
+"""
+Parquet Ingestor Module.
+
+This module contains the ParquetIngestor class, which ingests quotes from
+Parquet files with "body" and "author" columns. It needs the optional
+pyarrow package, which is imported only when a Parquet file is read.
+
+Classes:
+- ParquetIngestor: A class for handling the ingestion of Parquet files.
+
+Usage:
+Install pyarrow, then call `parse` or `iter_parse` with the path of a
+Parquet file. Row groups are read one batch at a time.
+"""
+
+from typing import Iterator, List
+from .ingestor import IngestorInterface, report_error
+from .models import QuoteModel
+
+
+class ParquetIngestor(IngestorInterface):
+    """
+    ParquetIngestor is a class for ingesting quotes from Parquet files.
+
+    Attributes:
+        batch_size (int): The number of rows read at a time.
+
+    Methods:
+        can_ingest(path: str) -> bool:
+            Determines if the file at the given path is a Parquet file.
+
+        parse(path: str) -> List[QuoteModel]:
+            Parses the file and returns a list of QuoteModel instances.
+    """
+
+    batch_size = 10000
+
+    @classmethod
+    def can_ingest(cls, path: str) -> bool:
+        """
+        Check if the specified file can be ingested.
+
+        Args:
+            path (str): The path to the file being checked.
+
+        Returns:
+            bool: True if the file is a Parquet file, False otherwise.
+        """
+        return path.lower().endswith('.parquet')
+
+    @classmethod
+    def parse(cls, path: str) -> List[QuoteModel]:
+        """
+        Parse quotes from a Parquet file.
+
+        Args:
+            path (str): The path to the file to be parsed.
+
+        Returns:
+            List[QuoteModel]: A list of QuoteModel instances.
+        """
+        return list(cls.iter_parse(path))
+
+    @classmethod
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """
+        Stream the quotes of a Parquet file one batch of rows at a time.
+
+        Args:
+            path (str): The path to the file to be parsed.
+
+        Yields:
+            QuoteModel: A QuoteModel instance for each row with a body and
+                        an author.
+
+        Raises:
+            Exception: Errors opening or reading the file, including a
+                       missing pyarrow, are logged and end the stream.
+        """
+        try:
+            # Optional dependency, only needed for Parquet files
+            import pyarrow.parquet as pq
+
+            parquet = pq.ParquetFile(path)
+            for batch in parquet.iter_batches(batch_size=cls.batch_size,
+                                              columns=['body', 'author']):
+                columns = batch.to_pydict()
+                for body, author in zip(columns['body'], columns['author']):
+                    if body and author:
+                        yield QuoteModel(body=body, author=author)
+        except Exception as ex:
+            report_error(f"error with open error, parquet_ingestor: {ex}")
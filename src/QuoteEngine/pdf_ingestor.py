@@ -15,16 +15,103 @@ Usage:
 To use the PDFIngestor, first check if the file can be ingested using
 the `can_ingest` method. If the file can be ingested, call the `parse`
 method to extract quotes in the format "quote - author".
+
+Text is extracted in-process with PyPDF2 by default. The pdftotext CLI
+utility can still be selected as a fallback by setting
+`PDFIngestor.backend = 'pdftotext'` or passing `backend='pdftotext'` to
+`parse`.
 """
 
-from typing import List
+from typing import Dict, Iterator, List, Tuple
+import io
+import re
 import subprocess
-import os
-from .ingestor import IngestorInterface
+from .ingestor import IngestorInterface, report_error
 from .models import QuoteModel
+from .quote_lines import parse_lines
 
 error_file = './_data/errorFile.txt'
 
+_BFCHAR = re.compile(rb'beginbfchar(.*?)endbfchar', re.S)
+_BFRANGE = re.compile(rb'beginbfrange(.*?)endbfrange', re.S)
+_CODESPACE = re.compile(rb'begincodespacerange\s*<([0-9A-Fa-f]+)>')
+_HEX = re.compile(rb'<([0-9A-Fa-f]*)>')
+_RANGE = re.compile(rb'<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>\s*(<[0-9A-Fa-f]+>|\[[^\]]*\])')
+
+# A TJ adjustment below this (in thousandths of an em) is treated as a space
+_TJ_SPACE = -200
+
+
+def _hex_to_text(value: bytes) -> str:
+    """Decode a hex string from a ToUnicode CMap into text."""
+    return bytes.fromhex(value.decode('ascii')).decode('utf-16-be', 'replace')
+
+
+def _parse_cmap(data: bytes) -> Tuple[int, Dict[int, str]]:
+    """
+    Parse a ToUnicode CMap into a code width and a code-to-text table.
+
+    Args:
+        data (bytes): The decoded CMap stream.
+
+    Returns:
+        Tuple[int, Dict[int, str]]: The number of bytes per character code
+        and the mapping from character codes to text.
+    """
+    match = _CODESPACE.search(data)
+    width = len(match.group(1)) // 2 if match else 1
+    table = {}
+
+    for block in _BFCHAR.findall(data):
+        codes = _HEX.findall(block)
+        for src, dst in zip(codes[::2], codes[1::2]):
+            table[int(src, 16)] = _hex_to_text(dst)
+
+    for block in _BFRANGE.findall(data):
+        for lo, hi, dst in _RANGE.findall(block):
+            lo, hi = int(lo, 16), int(hi, 16)
+            if dst.startswith(b'['):
+                for code, value in zip(range(lo, hi + 1), _HEX.findall(dst)):
+                    table[code] = _hex_to_text(value)
+            else:
+                start = bytes.fromhex(dst[1:-1].decode('ascii'))
+                prefix, last = start[:-2], int.from_bytes(start[-2:], 'big')
+                for offset in range(hi - lo + 1):
+                    char = prefix + (last + offset).to_bytes(2, 'big')
+                    table[lo + offset] = char.decode('utf-16-be', 'replace')
+
+    return width, table
+
+
+def _as_bytes(value) -> bytes:
+    """Return the raw bytes of a string operand from a content stream."""
+    if isinstance(value, bytes):
+        return value
+    try:
+        return value.original_bytes
+    except Exception:
+        return value.encode('latin-1', 'replace')
+
+
+class _Font:
+    """Decodes the character codes of one font into text."""
+
+    def __init__(self, font):
+        self.width, self.table = 1, None
+        if '/ToUnicode' in font:
+            cmap = font['/ToUnicode'].getObject().getData()
+            self.width, self.table = _parse_cmap(cmap)
+
+    def decode(self, data: bytes) -> str:
+        if self.table is None:
+            return data.decode('latin-1')
+        width = self.width
+        return ''.join(
+            self.table.get(int.from_bytes(data[i:i + width], 'big'), '')
+            for i in range(0, len(data), width)
+        )
+
+
 class PDFIngestor(IngestorInterface):
     """
     PDFIngestor is a class for ingesting quotes from PDF files.
@@ -33,6 +120,11 @@ class PDFIngestor(IngestorInterface):
     check if a given file can be ingested based on its file extension and to
     parse quotes from the PDF file format.
 
+    Attributes:
+        backend (str): The text extraction backend, either 'pypdf2'
+                       (in-process, the default) or 'pdftotext' (the CLI
+                       utility).
+
     Methods:
         can_ingest(path: str) -> bool:
             Determines if the file at the given path can be ingested by checking
@@ -41,7 +133,15 @@ class PDFIngestor(IngestorInterface):
         parse(path: str) -> List[QuoteModel]:
             Parses the specified PDF file and extracts quotes in the format 
             "quote - author". Returns a list of QuoteModel instances.
+
+        iter_parse(path: str) -> Iterator[QuoteModel]:
+            Streams the quotes of the PDF file page by page.
+
+        extract_text(path: str) -> str:
+            Returns the text of the PDF file using the selected backend.
     """
+
+    backend = 'pypdf2'
     
     @classmethod
     def can_ingest(cls, path: str) -> bool:
@@ -54,51 +154,205 @@ class PDFIngestor(IngestorInterface):
         Returns:
             bool: True if the file is a PDF file, False otherwise.
         """
-        return path.endswith('.pdf')
+        return path.lower().endswith('.pdf')
 
     @classmethod
-    def parse(cls, path: str) -> List[QuoteModel]:
+    def parse(cls, path: str, backend: str = None) -> List[QuoteModel]:
         """
         Parse quotes from a PDF file.
 
-        This method invokes the pdftotext CLI utility to convert the PDF file to
-        text. It then processes the extracted text to find quotes and their
+        This method extracts the text of the PDF file, in-process with
+        PyPDF2 or with the pdftotext CLI utility depending on the backend.
+        It then processes the extracted text to find quotes and their
         authors in the format "quote - author". A list of QuoteModel instances
         representing each parsed quote is returned.
 
         Args:
             path (str): The path to the PDF file to be parsed.
+            backend (str, optional): 'pypdf2' or 'pdftotext'. Defaults to
+                                     the class-level `backend`.
 
         Returns:
             List[QuoteModel]: A list of QuoteModel instances containing the 
                               extracted quotes.
 
         Raises:
-            Exception: If an error occurs while invoking pdftotext or processing
-                        the extracted text.
+            Exception: If an error occurs while extracting or processing
+                        the text, it is logged to an error file.
         """
-        quotes = []
-        tmp = './_data/SimpleLines/temp.txt'
+        return list(cls.iter_parse(path, backend))
+
+    @classmethod
+    def iter_parse(cls, path: str, backend: str = None) -> Iterator[QuoteModel]:
+        """
+        Stream the quotes of a PDF file page by page.
+
+        Only a page or a batch of lines of text is held in memory at a
+        time. Malformed lines are skipped and reported with their line
+        numbers.
 
+        Args:
+            path (str): The path to the PDF file to be parsed.
+            backend (str, optional): 'pypdf2' or 'pdftotext'. Defaults to
+                                     the class-level `backend`.
+
+        Yields:
+            QuoteModel: A QuoteModel instance for each "quote - author" line.
+
+        Raises:
+            Exception: If an error occurs while extracting or processing
+                        the text, it is logged to an error file and the
+                        stream ends.
+        """
         try:
-            # Invoke the pdftotext CLI utility
-            subprocess.call(['pdftotext', path, tmp])
-
-            # Read the extracted text
-            with open(tmp, 'r', encoding='utf-8') as file:
-                for line in file:
-                    if ' - ' in line:
-                        body, author = line.split(' - ')
-                        quotes.append(QuoteModel(body=body.strip(), author=author.strip()))
-                        if os.path.exists(tmp):
-                            os.remove(tmp)
+            yield from parse_lines(cls.iter_lines(path, backend), path)
         except Exception as ex:
-            print(f"Error while processing PDF: {ex}")
             with open(error_file, 'a') as f:
                 f.write(f"\nerror with open, pdf_ingestor.py: {ex}")
-        finally:
-            # Clean up the temporary file
-            if os.path.exists(tmp):
-                os.remove(tmp)
+            report_error(f"Error while processing PDF: {ex}")
+
+    @classmethod
+    def iter_lines(cls, path: str, backend: str = None) -> Iterator[str]:
+        """
+        Stream the lines of text of a PDF file.
+
+        Args:
+            path (str): The path to the PDF file.
+            backend (str, optional): 'pypdf2' or 'pdftotext'. Defaults to
+                                     the class-level `backend`.
+
+        Yields:
+            str: Each line of text in the PDF.
+
+        Raises:
+            ValueError: If the backend is unknown.
+        """
+        backend = backend or cls.backend
+        if backend == 'pypdf2':
+            with open(path, 'rb') as file:
+                yield from cls.iter_lines_pypdf2(file)
+        elif backend == 'pdftotext':
+            with subprocess.Popen(['pdftotext', path, '-'], stdout=subprocess.PIPE,
+                                  encoding='utf-8') as process:
+                for line in process.stdout:
+                    yield line.rstrip('\n')
+            if process.returncode:
+                raise subprocess.CalledProcessError(process.returncode, 'pdftotext')
+        else:
+            raise ValueError(f'Unknown PDF backend {backend}')
+
+    @classmethod
+    def extract_text(cls, path: str, backend: str = None) -> str:
+        """
+        Extract the text of a PDF file.
+
+        Args:
+            path (str): The path to the PDF file.
+            backend (str, optional): 'pypdf2' or 'pdftotext'. Defaults to
+                                     the class-level `backend`.
+
+        Returns:
+            str: The text of the PDF, one line of text per line.
+
+        Raises:
+            ValueError: If the backend is unknown.
+        """
+        backend = backend or cls.backend
+        if backend == 'pypdf2':
+            with open(path, 'rb') as file:
+                return cls.extract_text_pypdf2(file.read())
+        return '\n'.join(cls.iter_lines(path, backend))
+
+    @staticmethod
+    def extract_text_pypdf2(data: bytes) -> str:
+        """
+        Extract the text of a PDF document held in memory.
+
+        Args:
+            data (bytes): The contents of the PDF file.
+
+        Returns:
+            str: The text of the PDF, one line of text per line.
+        """
+        return '\n'.join(PDFIngestor.iter_lines_pypdf2(io.BytesIO(data)))
+
+    @staticmethod
+    def iter_lines_pypdf2(stream) -> Iterator[str]:
+        """
+        Stream the lines of text of a PDF document with PyPDF2.
+
+        Walks the content stream of every page, decoding text through each
+        font's ToUnicode map, and starts a new line whenever the text
+        position moves vertically. Pages are read one at a time.
+
+        Args:
+            stream: A seekable binary file-like object holding the PDF.
+
+        Yields:
+            str: Each line of text in the PDF.
+        """
+        # Imported here so PyPDF2 is only loaded when a PDF is read
+        import PyPDF2
+        reader = PyPDF2.PdfFileReader(stream, strict=False)
+        for page_number in range(reader.getNumPages()):
+            yield from PDFIngestor._page_lines(reader, reader.getPage(page_number))
+
+    @staticmethod
+    def _page_lines(reader, page) -> List[str]:
+        """Return the lines of text on a single page."""
+        from PyPDF2.pdf import ContentStream
+        contents = page.getContents()
+        if contents is None:
+            return []
+
+        fonts = {}
+        resources = page['/Resources'].getObject() if '/Resources' in page else {}
+        page_fonts = resources['/Font'].getObject() if '/Font' in resources else {}
+
+        lines, line = [], []
+        font = _Font({})
+        y = line_y = 0.0
+        leading = 0.0
+
+        for operands, operator in ContentStream(contents, reader).operations:
+            if operator == b'Tf':
+                name = operands[0]
+                if name not in fonts:
+                    fonts[name] = _Font(page_fonts[name].getObject()
+                                        if name in page_fonts else {})
+                font = fonts[name]
+                continue
+            if operator == b'BT':
+                y = 0.0
+            elif operator in (b'Td', b'TD'):
+                y += float(operands[1])
+                if operator == b'TD':
+                    leading = -float(operands[1])
+            elif operator == b'TL':
+                leading = float(operands[0])
+            elif operator == b'Tm':
+                y = float(operands[5])
+            elif operator in (b'T*', b"'", b'"'):
+                y -= leading or 1.0
+
+            if operator not in (b'Tj', b'TJ', b"'", b'"'):
+                continue
+
+            if y != line_y and line:
+                lines.append(''.join(line))
+                line = []
+            line_y = y
+
+            if operator == b'TJ':
+                for item in operands[0]:
+                    if isinstance(item, (int, float)):
+                        if item < _TJ_SPACE and line and not line[-1].endswith(' '):
+                            line.append(' ')
+                    else:
+                        line.append(font.decode(_as_bytes(item)))
+            else:
+                line.append(font.decode(_as_bytes(operands[-1])))
 
-        return quotes
\ No newline at end of file
+        if line:
+            lines.append(''.join(line))
+        return lines
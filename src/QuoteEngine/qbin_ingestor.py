@@ -0,0 +1,82 @@
+"""
+Quote File Ingestor Module.
+
+This module contains the QuoteFileIngestor class, the fast path for
+compiled binary quote files (.qbin, see `quote_file`). Nothing is parsed:
+the file is memory-mapped and quotes are decoded only when accessed.
+
+Classes:
+- QuoteFileIngestor: A class for handling the ingestion of compiled
+  quote files.
+
+Usage:
+Call `Ingestor.parse('quotes.qbin')` to get a QuoteFile, which behaves
+like a read-only list of QuoteModel instances.
+"""
+
+from typing import Iterator
+from .ingestor import IngestorInterface
+from .models import QuoteModel
+from .quote_file import QuoteFile
+
+
+class QuoteFileIngestor(IngestorInterface):
+    """
+    QuoteFileIngestor opens compiled quote files.
+
+    Compiled quote files are already faster to open than a cache entry,
+    so their quotes are not stored in the quote cache.
+
+    Methods:
+        can_ingest(path: str) -> bool:
+            Determines if the file at the given path is a quote file.
+
+        parse(path: str) -> QuoteFile:
+            Opens the quote file as a memory-mapped sequence of quotes.
+    """
+
+    cacheable = False
+
+    @classmethod
+    def can_ingest(cls, path: str) -> bool:
+        """
+        Check if the specified file can be ingested.
+
+        Args:
+            path (str): The path to the file being checked.
+
+        Returns:
+            bool: True if the file is a compiled quote file, False otherwise.
+        """
+        return path.lower().endswith(QuoteFile.suffix)
+
+    @classmethod
+    def parse(cls, path: str) -> QuoteFile:
+        """
+        Open a compiled quote file.
+
+        Args:
+            path (str): The path to the quote file.
+
+        Returns:
+            QuoteFile: The memory-mapped quotes, usable as a list of
+            QuoteModel instances.
+
+        Raises:
+            ValueError: If the file is not a compiled quote file.
+        """
+        return QuoteFile(path)
+
+    @classmethod
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """
+        Stream the quotes of a compiled quote file.
+
+        Args:
+            path (str): The path to the quote file.
+
+        Yields:
+            QuoteModel: Each quote in the file, in order.
+        """
+        with QuoteFile(path) as quotes:
+            yield from quotes
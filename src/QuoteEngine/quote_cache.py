@@ -0,0 +1,238 @@
+"""
+Quote Cache Module.
+
+This module provides the QuoteCache class, a persistent on-disk cache of
+parsed quote files. Parsing DOCX and PDF files is slow, and the same files
+are parsed on every start of the web application and every run of the
+command line tool, so the parsed quotes are kept in a single pickle file
+and only re-parsed when their source file changes.
+
+Classes:
+- QuoteCache: A pickle-backed cache of parsed quotes keyed by file path,
+  validated by file size, modification time and content hash, and
+  discarded as a whole when the quote parser version changes.
+
+Usage:
+Create a QuoteCache with the path of the cache file, call `parse` instead
+of `Ingestor.parse` for each quote file (or `parse_many` instead of
+`Ingestor.parse_many`), then call `save` to write any changes back to disk.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from .ingestor import Ingestor
+from .models import QuoteModel
+from .quote_lines import PARSER_VERSION
+
+
+class QuoteCache:
+    """
+    A persistent cache of parsed quote files.
+
+    An entry is reused without reading the source when its size and
+    modification time are unchanged. If only the modification time changed
+    the content hash is compared, so touching a file does not force a
+    re-parse.
+
+    Attributes:
+        cache_path (str): The path of the pickle file holding the cache.
+        hits (int): The number of files served from the cache.
+        misses (int): The number of files that had to be parsed.
+    """
+
+    version = 2
+
+    def __init__(self, cache_path: str = './_data/.quote_cache.pkl'):
+        """
+        Initialize the QuoteCache, loading the cache file if it exists.
+
+        Args:
+            cache_path (str, optional): The path of the cache file.
+                                        Defaults to './_data/.quote_cache.pkl'.
+        """
+        self.cache_path = cache_path
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load the cache file, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.cache_path, 'rb') as file:
+                data = pickle.load(file)
+            # Entries parsed by an older parser may hold different quotes
+            if (data.get('version') == self.version
+                    and data.get('parser') == PARSER_VERSION):
+                self._entries = data['entries']
+        except FileNotFoundError:
+            pass
+        except Exception as ex:
+            print(f"error loading quote cache, quote_cache.py: {ex}")
+
+    def save(self):
+        """Write the cache file if any entry changed since it was loaded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {'version': self.version, 'parser': PARSER_VERSION,
+                    'entries': dict(self._entries)}
+            self._dirty = False
+
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, 'wb') as file:
+                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.cache_path)
+        except Exception as ex:
+            print(f"error saving quote cache, quote_cache.py: {ex}")
+
+    @staticmethod
+    def file_hash(path: str) -> str:
+        """
+        Return the SHA-256 digest of a file's contents.
+
+        Args:
+            path (str): The path to the file.
+
+        Returns:
+            str: The hex digest of the file contents.
+        """
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def lookup(self, path: str) -> Optional[List[QuoteModel]]:
+        """
+        Return the cached quotes of a file if the file is unchanged.
+
+        Args:
+            path (str): The path to the quote file.
+
+        Returns:
+            Optional[List[QuoteModel]]: The cached quotes, or None if the
+            file is not cached, has changed or does not exist.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(path))
+        if entry is None or entry['size'] != stat.st_size:
+            return None
+
+        if entry['mtime'] != stat.st_mtime_ns:
+            if self.file_hash(path) != entry['hash']:
+                return None
+            with self._lock:
+                entry['mtime'] = stat.st_mtime_ns
+                self._dirty = True
+
+        with self._lock:
+            self.hits += 1
+        return [QuoteModel.from_clean(body, author) for body, author in entry['quotes']]
+
+    def store(self, path: str, quotes: List[QuoteModel]):
+        """
+        Remember the parsed quotes of a file.
+
+        Empty results are not stored: ingestors report failures by
+        returning no quotes, and a failure should not be remembered as if
+        it were the file's content. Neither are the quotes of formats whose
+        ingestor is not `cacheable`, such as compiled quote files.
+
+        Args:
+            path (str): The path to the quote file.
+            quotes (List[QuoteModel]): The quotes parsed from the file.
+        """
+        with self._lock:
+            self.misses += 1
+        if not quotes:
+            return
+        try:
+            if not Ingestor.ingestor_for(path).cacheable:
+                return
+        except Exception:
+            return
+
+        try:
+            stat = os.stat(path)
+            content_hash = self.file_hash(path)
+        except OSError:
+            return
+
+        entry = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'hash': content_hash,
+            'quotes': [(quote.body, quote.author) for quote in quotes],
+        }
+        with self._lock:
+            self._entries[os.path.abspath(path)] = entry
+            self._dirty = True
+
+    def parse(self, path: str) -> List[QuoteModel]:
+        """
+        Return the quotes in a file, parsing it only if it changed.
+
+        Args:
+            path (str): The path to the quote file.
+
+        Returns:
+            List[QuoteModel]: The quotes in the file.
+
+        Raises:
+            Exception: If no ingestor can handle the specified file type.
+        """
+        quotes = self.lookup(path)
+        if quotes is None:
+            quotes = Ingestor.parse(path)
+            self.store(path, quotes)
+        return quotes
+
+    def parse_many(self, paths: Iterable[str], workers: int = None,
+                   processes: bool = False) -> Tuple[List[QuoteModel], Dict[str, Exception]]:
+        """
+        Return the quotes in several files, parsing changed files concurrently.
+
+        Cached files are served directly; the remaining files are parsed
+        with `Ingestor.parse_many`. Quotes are merged in the order of paths.
+
+        Args:
+            paths (Iterable[str]): The paths of the quote files.
+            workers (int, optional): The number of threads or processes.
+            processes (bool, optional): Use a process pool instead of a
+                                        thread pool. Defaults to False.
+
+        Returns:
+            Tuple[List[QuoteModel], Dict[str, Exception]]: The quotes of all
+            files, and the error raised for each file that failed.
+        """
+        paths = list(paths)
+        cached = {path: self.lookup(path) for path in paths}
+        missing = [path for path in paths if cached[path] is None]
+
+        errors = {}
+        for path, parsed, error in Ingestor.parse_each(missing, workers, processes):
+            if error is None:
+                self.store(path, parsed)
+            else:
+                errors[path] = error
+            cached[path] = parsed
+
+        quotes = []
+        for path in paths:
+            quotes.extend(cached[path])
+        return quotes, errors
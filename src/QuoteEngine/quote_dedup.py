@@ -0,0 +1,248 @@
+"""
+Quote Deduplication Module.
+
+This module provides the QuoteDeduplicator class, which drops repeated
+quotes after parsing. The same quotes are often shipped in several
+formats (the DogQuotes TXT, DOCX, PDF and CSV files hold the same
+quotes), so loading all of them would keep every quote several times and
+make it more likely to be drawn at random.
+
+Quotes are compared by a 64-bit hash of their normalized body and author:
+case-folded, with whitespace collapsed and quotation marks removed. Only
+the hashes are kept, so the check stays cheap for millions of quotes.
+
+An optional near-duplicate mode also drops quotes whose character
+shingles, ignoring punctuation, are similar enough to a quote already kept
+(for example the same quote with a typo or different punctuation). It
+uses one-permutation MinHash signatures and locality-sensitive hashing,
+so each quote is compared only with the few kept quotes that share a
+signature band.
+
+Classes:
+- DedupStats: The number of quotes seen, kept and dropped.
+- QuoteDeduplicator: Filters duplicate and, optionally, near-duplicate
+  quotes.
+
+Functions:
+- normalize: Return the normalized form of text that quotes are compared by.
+
+Usage:
+Pass parsed quotes through `QuoteDeduplicator().dedup(quotes)` (or
+`filter` for a stream), then read `stats` for the number of duplicates
+dropped. Use `QuoteDeduplicator(near=True, threshold=0.8)` to drop near
+duplicates as well.
+"""
+
+import hashlib
+import re
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple
+from .models import QuoteModel
+
+# Quotation marks ignored when comparing quotes, straight and curly
+_QUOTE_MARKS = dict.fromkeys(map(ord, '"\'`“”‘’«»'))
+# Punctuation ignored when looking for near duplicates
+_PUNCTUATION = re.compile(r'[^\w\s]+')
+_MASK = (1 << 64) - 1
+
+
+def normalize(text: str) -> str:
+    """
+    Return the normalized form of text that quotes are compared by.
+
+    Args:
+        text (str): The body or author of a quote.
+
+    Returns:
+        str: The text without quotation marks, case-folded and with runs
+        of whitespace collapsed to single spaces.
+    """
+    return ' '.join(text.translate(_QUOTE_MARKS).casefold().split())
+
+
+class DedupStats(NamedTuple):
+    """The outcome of deduplicating quotes."""
+
+    seen: int
+    kept: int
+    duplicates: int
+    near_duplicates: int
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of quotes dropped for any reason."""
+        return self.duplicates + self.near_duplicates
+
+    def __str__(self):
+        """Return a one-line summary of the counts."""
+        return (f"kept {self.kept} of {self.seen} quotes, dropped {self.duplicates} "
+                f"duplicates and {self.near_duplicates} near duplicates")
+
+
+class QuoteDeduplicator:
+    """
+    Drops quotes that repeat a quote already kept.
+
+    The deduplicator remembers the quotes it has kept across calls, so
+    several batches can be filtered against each other.
+
+    Attributes:
+        near (bool): Whether near duplicates are dropped as well.
+        threshold (float): The estimated Jaccard similarity of shingles
+                           from which two quotes are near duplicates.
+        shingle (int): The length of the character shingles compared.
+        stats (DedupStats): The counts so far.
+    """
+
+    # MinHash signature length and LSH bands; rows per band is their ratio
+    permutations = 32
+    bands = 8
+
+    def __init__(self, near: bool = False, threshold: float = 0.8, shingle: int = 4):
+        """
+        Initialize a QuoteDeduplicator.
+
+        Args:
+            near (bool, optional): Also drop near duplicates. Defaults to
+                                   False.
+            threshold (float, optional): The similarity, from 0 to 1, from
+                                         which quotes are near duplicates.
+                                         Defaults to 0.8.
+            shingle (int, optional): The length of the character shingles.
+                                     Defaults to 4.
+        """
+        self.near = near
+        self.threshold = threshold
+        self.shingle = shingle
+        self._keys = set()
+        self._seen = 0
+        self._duplicates = 0
+        self._near_duplicates = 0
+        # Signatures of kept quotes, flat, and band hash -> kept quote numbers
+        self._signatures = array('Q')
+        self._buckets: Dict[int, List[int]] = {}
+
+    @property
+    def stats(self) -> DedupStats:
+        """Return the number of quotes seen, kept and dropped so far."""
+        kept = self._seen - self._duplicates - self._near_duplicates
+        return DedupStats(self._seen, kept, self._duplicates, self._near_duplicates)
+
+    @staticmethod
+    def key(quote: QuoteModel) -> int:
+        """
+        Return the 64-bit hash of a quote's normalized body and author.
+
+        Args:
+            quote (QuoteModel): The quote.
+
+        Returns:
+            int: The hash; equal for quotes that differ only in case,
+            whitespace or quotation marks.
+        """
+        text = f"{normalize(quote.body)}\x00{normalize(quote.author)}"
+        return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(),
+                              'little')
+
+    def _signature(self, text: str) -> List[int]:
+        """
+        Return the one-permutation MinHash signature of text's shingles.
+
+        Each shingle hash falls into one of `permutations` bins by its low
+        bits and the minimum of the rest is kept per bin; empty bins borrow
+        the value of the next non-empty bin so short quotes still fill the
+        signature. Shingles are hashed with the built-in, per-process salted
+        `hash`, so signatures are only comparable within one process.
+        """
+        size, bins = self.shingle, self.permutations
+        shingles = {text[i:i + size] for i in range(max(1, len(text) - size + 1))}
+        signature = [_MASK] * bins
+        for shingle in shingles:
+            value = hash(shingle) & _MASK
+            slot = value % bins
+            value //= bins
+            if value < signature[slot]:
+                signature[slot] = value
+
+        for slot in range(bins):
+            if signature[slot] == _MASK:
+                for step in range(1, bins):
+                    borrowed = signature[(slot + step) % bins]
+                    if borrowed != _MASK and borrowed < _MASK - step:
+                        signature[slot] = borrowed + step
+                        break
+        return signature
+
+    def _is_near_duplicate(self, quote: QuoteModel) -> bool:
+        """Return True if quote is similar to a kept quote, else remember it."""
+        text = normalize(_PUNCTUATION.sub('', f"{quote.body} {quote.author}"))
+        signature = self._signature(text)
+        rows = self.permutations // self.bands
+        bands = [hash((band, *signature[band * rows:(band + 1) * rows]))
+                 for band in range(self.bands)]
+
+        signatures, bins = self._signatures, self.permutations
+        checked = set()
+        for band in bands:
+            for number in self._buckets.get(band, ()):
+                if number in checked:
+                    continue
+                checked.add(number)
+                start = number * bins
+                same = sum(a == b for a, b in zip(signature, signatures[start:start + bins]))
+                if same >= self.threshold * bins:
+                    return True
+
+        number = len(signatures) // bins
+        signatures.extend(signature)
+        for band in bands:
+            self._buckets.setdefault(band, []).append(number)
+        return False
+
+    def is_duplicate(self, quote: QuoteModel) -> bool:
+        """
+        Return True if quote repeats a kept quote; otherwise keep it.
+
+        Args:
+            quote (QuoteModel): The quote to check.
+
+        Returns:
+            bool: True if the quote should be dropped.
+        """
+        self._seen += 1
+        key = self.key(quote)
+        if key in self._keys:
+            self._duplicates += 1
+            return True
+        self._keys.add(key)
+        if self.near and self._is_near_duplicate(quote):
+            self._near_duplicates += 1
+            return True
+        return False
+
+    def filter(self, quotes: Iterable[QuoteModel]) -> Iterator[QuoteModel]:
+        """
+        Yield the quotes that do not repeat an earlier quote.
+
+        Args:
+            quotes (Iterable[QuoteModel]): The quotes, e.g. a stream from
+                                           `Ingestor.iter_parse`.
+
+        Yields:
+            QuoteModel: The first occurrence of each quote.
+        """
+        for quote in quotes:
+            if not self.is_duplicate(quote):
+                yield quote
+
+    def dedup(self, quotes: Iterable[QuoteModel]) -> List[QuoteModel]:
+        """
+        Return the quotes without duplicates, keeping the first of each.
+
+        Args:
+            quotes (Iterable[QuoteModel]): The quotes to deduplicate.
+
+        Returns:
+            List[QuoteModel]: The kept quotes in their original order.
+        """
+        return list(self.filter(quotes))
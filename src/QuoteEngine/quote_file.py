@@ -0,0 +1,410 @@
+"""
+Quote File Module.
+
+This module provides QuoteFile, a compact binary columnar file format for
+large quote corpora, and the compile step that produces it from any
+ingestible sources. Parsing DOCX and PDF files is slow; compiling them
+once into a quote file lets the application open millions of quotes in
+milliseconds, because the file is memory-mapped and a quote is only
+decoded when it is accessed.
+
+File layout (all integers little-endian, sections 8-byte aligned):
+- A header: the magic bytes, the format version, the number of quotes,
+  authors and sources, and the offset of every section.
+- Quote bodies: count + 1 uint64 offsets into a blob of UTF-8 text.
+- Author ids and source ids: count uint32 values each.
+- Author and source names: uint64 offsets into a blob of UTF-8 text.
+
+Classes:
+- QuoteFile: A read-only, memory-mapped sequence of quotes with their
+  authors and sources.
+
+Functions:
+- main: The command line compile step, run as `python -m QuoteEngine`. It
+  drops duplicate quotes unless `--keep-duplicates` is given.
+
+Usage:
+Compile sources with `QuoteFile.compile(['a.docx', 'b.pdf'], 'quotes.qbin')`
+or `python -m QuoteEngine -o quotes.qbin a.docx b.pdf`, then
+open the result with `QuoteFile('quotes.qbin')` (or `Ingestor.parse`) and
+use it like a list of QuoteModel instances.
+"""
+
+import argparse
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import weakref
+from array import array
+from typing import Iterable, Iterator, List, Tuple
+from .ingestor import Ingestor
+from .models import QuoteModel
+from .quote_dedup import QuoteDeduplicator
+
+MAGIC = b'QTEBIN\x00\x01'
+VERSION = 1
+# magic, version, count, authors, sources, then nine section offsets
+_HEADER = struct.Struct('<8sI4xQQQ9Q')
+
+
+def _pad(file, position: int) -> int:
+    """Write zero bytes up to the next multiple of 8 and return the new position."""
+    padding = -position % 8
+    file.write(b'\x00' * padding)
+    return position + padding
+
+
+def _write_array(file, position: int, values: array) -> int:
+    """Write an array of integers little-endian and return the new position."""
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    data = values.tobytes()
+    file.write(data)
+    return _pad(file, position + len(data))
+
+
+def _write_strings(file, position: int, strings: List[str]) -> Tuple[int, int, int]:
+    """Write a string table; return the offsets and blob positions and the end."""
+    blobs = [string.encode('utf-8') for string in strings]
+    offsets = array('Q', [0])
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    offsets_position = position
+    position = _write_array(file, position, offsets)
+    blob_position = position
+    data = b''.join(blobs)
+    file.write(data)
+    return offsets_position, blob_position, _pad(file, position + len(data))
+
+
+def _release(memory_map: mmap.mmap, views: List[memoryview]):
+    """Release the views of a quote file and unmap it if nothing else exports it."""
+    for view in views:
+        view.release()
+    try:
+        memory_map.close()
+    except BufferError:
+        # A slice is still exported; the map goes when its last view does
+        pass
+
+
+class QuoteFile:
+    """
+    A memory-mapped, read-only sequence of quotes.
+
+    Indexing returns QuoteModel instances decoded on demand; `body`,
+    `author` and `source` return single fields without creating a
+    QuoteModel. Author and source names are decoded once, when the file
+    is opened. The file stays mapped until it is closed or, when it is
+    simply dropped, garbage collected.
+
+    Attributes:
+        path (str): The path of the quote file.
+        authors (List[str]): The distinct author names, by author id.
+        sources (List[str]): The distinct source names, by source id.
+    """
+
+    suffix = '.qbin'
+
+    def __init__(self, path: str):
+        """
+        Open and memory-map a quote file.
+
+        Args:
+            path (str): The path of the quote file.
+
+        Raises:
+            ValueError: If the file is not a quote file of this version.
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        if len(view) < _HEADER.size:
+            view.release()
+            self._mmap.close()
+            raise ValueError(f'Not a quote file: {path}')
+
+        (magic, version, self._count, author_count, source_count,
+         *sections) = _HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            view.release()
+            self._mmap.close()
+            raise ValueError(f'Not a quote file: {path}')
+        (body_offsets, body_blob, author_ids, source_ids, author_offsets,
+         author_blob, source_offsets, source_blob, end) = sections
+
+        self._view = view
+        self._body_offsets = self._column(view, body_offsets, self._count + 1, 'Q')
+        self._body_blob = view[body_blob:author_ids]
+        self._author_ids = self._column(view, author_ids, self._count, 'I')
+        self._source_ids = self._column(view, source_ids, self._count, 'I')
+        self.authors = [sys.intern(name) for name in
+                        self._strings(view, author_offsets, author_blob, author_count)]
+        self.sources = self._strings(view, source_offsets, source_blob, source_count)
+        # Unmap the file when the QuoteFile is garbage collected, or on close
+        views = [column for column in (self._body_offsets, self._author_ids,
+                                       self._source_ids) if isinstance(column, memoryview)]
+        self._finalizer = weakref.finalize(self, _release, self._mmap,
+                                           views + [self._body_blob, view])
+
+    @staticmethod
+    def _column(view: memoryview, position: int, count: int, typecode: str):
+        """Return a column of integers, zero-copy on little-endian hosts."""
+        size = array(typecode).itemsize
+        column = view[position:position + count * size]
+        if sys.byteorder == 'little':
+            return column.cast(typecode)
+        values = array(typecode, column.tobytes())
+        values.byteswap()
+        return values
+
+    @classmethod
+    def _strings(cls, view: memoryview, offsets: int, blob: int, count: int) -> List[str]:
+        """Decode a whole string table."""
+        ends = cls._column(view, offsets, count + 1, 'Q')
+        return [str(view[blob + ends[i]:blob + ends[i + 1]], 'utf-8') for i in range(count)]
+
+    def close(self):
+        """
+        Release the memory map; the file can no longer be read.
+
+        A quote file that is simply dropped is unmapped when it is garbage
+        collected, so only close it when nothing else may still read it.
+        """
+        self._finalizer()
+
+    def __enter__(self):
+        """Return the open quote file."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the quote file."""
+        self.close()
+
+    def __len__(self):
+        """Return the number of quotes in the file."""
+        return self._count
+
+    def body(self, index: int) -> str:
+        """Return the body of the quote at index without creating a QuoteModel."""
+        offsets = self._body_offsets
+        return str(self._body_blob[offsets[index]:offsets[index + 1]], 'utf-8')
+
+    def author_id(self, index: int) -> int:
+        """Return the author id of the quote at index."""
+        return self._author_ids[index]
+
+    def author(self, index: int) -> str:
+        """Return the author of the quote at index without creating a QuoteModel."""
+        return self.authors[self._author_ids[index]]
+
+    def source_id(self, index: int) -> int:
+        """Return the source id of the quote at index."""
+        return self._source_ids[index]
+
+    def source(self, index: int) -> str:
+        """Return the source file the quote at index was compiled from."""
+        return self.sources[self._source_ids[index]]
+
+    def ids(self, field: str):
+        """
+        Return the whole author or source id column without copying it.
+
+        Args:
+            field (str): 'author' or 'source'.
+
+        Returns:
+            Sequence[int]: The id of every quote, indexing `authors` or
+            `sources`.
+        """
+        if field == 'author':
+            return self._author_ids
+        if field == 'source':
+            return self._source_ids
+        raise ValueError(f'Unknown quote file column: {field}')
+
+    def __getitem__(self, index):
+        """
+        Return the quote at index, or a list of quotes for a slice.
+
+        Args:
+            index (int or slice): The position of the quote(s).
+
+        Returns:
+            QuoteModel or List[QuoteModel]: The quote(s) at index.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('quote index out of range')
+        return QuoteModel.from_clean(self.body(index), self.author(index))
+
+    def __iter__(self) -> Iterator[QuoteModel]:
+        """Yield every quote in the file in order."""
+        for index in range(self._count):
+            yield QuoteModel.from_clean(self.body(index), self.author(index))
+
+    @staticmethod
+    def write(path: str, records: Iterable[Tuple[QuoteModel, str]],
+              sources: Iterable[str] = ()) -> int:
+        """
+        Write quotes and their sources to a quote file.
+
+        Bodies are streamed to a temporary file as they arrive, so only
+        the integer columns are held in memory. The file is written to a
+        private name and renamed into place.
+
+        Args:
+            path (str): The path of the quote file to write.
+            records (Iterable[Tuple[QuoteModel, str]]): Each quote with the
+                                                        name of its source.
+            sources (Iterable[str], optional): Source names recorded first,
+                                               in order, even if none of
+                                               their quotes are written.
+
+        Returns:
+            int: The number of quotes written.
+        """
+        offsets = array('Q', [0])
+        author_ids, source_ids = array('I'), array('I')
+        authors = {}
+        sources = {source: number for number, source in enumerate(dict.fromkeys(sources))}
+
+        with tempfile.TemporaryFile() as blob:
+            for quote, source in records:
+                data = quote.body.encode('utf-8')
+                blob.write(data)
+                offsets.append(offsets[-1] + len(data))
+                author_ids.append(authors.setdefault(quote.author, len(authors)))
+                source_ids.append(sources.setdefault(source, len(sources)))
+            count = len(author_ids)
+
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp, 'wb') as file:
+                    file.write(b'\x00' * _HEADER.size)
+                    position = _pad(file, _HEADER.size)
+
+                    body_offsets = position
+                    position = _write_array(file, position, offsets)
+                    body_blob = position
+                    blob.seek(0)
+                    shutil.copyfileobj(blob, file)
+                    position = _pad(file, position + offsets[-1])
+                    author_column = position
+                    position = _write_array(file, position, author_ids)
+                    source_column = position
+                    position = _write_array(file, position, source_ids)
+                    author_offsets, author_blob, position = _write_strings(
+                        file, position, list(authors))
+                    source_offsets, source_blob, position = _write_strings(
+                        file, position, list(sources))
+
+                    file.seek(0)
+                    file.write(_HEADER.pack(MAGIC, VERSION, count, len(authors), len(sources),
+                                            body_offsets, body_blob, author_column,
+                                            source_column, author_offsets, author_blob,
+                                            source_offsets, source_blob, position))
+                os.replace(tmp, path)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                raise
+        return count
+
+    @classmethod
+    def compile(cls, paths: Iterable[str], output_path: str,
+                deduplicator: QuoteDeduplicator = None) -> int:
+        """
+        Compile quote files of any ingestible format into a quote file.
+
+        Each source is streamed with `Ingestor.iter_parse`, and its path
+        is recorded as the source of its quotes. Every path is recorded in
+        the sources table, in order, so `is_current` can tell which files
+        the quote file was compiled from.
+
+        Args:
+            paths (Iterable[str]): The quote files to compile.
+            output_path (str): The path of the quote file to write.
+            deduplicator (QuoteDeduplicator, optional): Drops repeated
+                quotes, keeping the first source of each. Defaults to
+                keeping every quote.
+
+        Returns:
+            int: The number of quotes written.
+
+        Raises:
+            Exception: If no ingestor can handle one of the files.
+        """
+        paths = list(paths)
+
+        def records():
+            for path in paths:
+                quotes = Ingestor.iter_parse(path)
+                if deduplicator is not None:
+                    quotes = deduplicator.filter(quotes)
+                for quote in quotes:
+                    yield quote, path
+
+        return cls.write(output_path, records(), paths)
+
+    @classmethod
+    def is_current(cls, output_path: str, paths: Iterable[str]) -> bool:
+        """
+        Return True if a quote file was compiled from paths and is up to date.
+
+        Args:
+            output_path (str): The path of the compiled quote file.
+            paths (Iterable[str]): The quote files it should be compiled
+                                   from, in order.
+
+        Returns:
+            bool: False if the quote file is missing or unreadable, records
+            a different list of sources, or a source is missing or newer.
+        """
+        paths = [os.path.normpath(path) for path in paths]
+        try:
+            compiled = os.stat(output_path).st_mtime_ns
+            with cls(output_path) as quote_file:
+                recorded = [os.path.normpath(source) for source in quote_file.sources]
+        except (OSError, ValueError):
+            return False
+        if recorded != paths:
+            return False
+        for path in paths:
+            try:
+                if os.stat(path).st_mtime_ns > compiled:
+                    return False
+            except OSError:
+                return False
+        return True
+
+
+def main():
+    """Compile the quote files given on the command line into a quote file."""
+    parser = argparse.ArgumentParser(description="Compile quote files into a binary quote file")
+    parser.add_argument('paths', nargs='+', help="quote files in any ingestible format")
+    parser.add_argument('-o', '--output', required=True, help="the quote file to write")
+    parser.add_argument('--keep-duplicates', action='store_true',
+                        help="keep quotes that repeat an earlier quote")
+    parser.add_argument('--near', action='store_true', help="also drop near-duplicate quotes")
+    args = parser.parse_args()
+
+    deduplicator = None if args.keep_duplicates else QuoteDeduplicator(near=args.near)
+    start = time.perf_counter()
+    count = QuoteFile.compile(args.paths, args.output, deduplicator)
+    print(f"compiled {count} quotes into {args.output} "
+          f"({os.path.getsize(args.output)} bytes, {time.perf_counter() - start:.2f} s)")
+    if deduplicator is not None:
+        print(deduplicator.stats)
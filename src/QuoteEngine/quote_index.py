@@ -0,0 +1,224 @@
+"""
+Quote Index Module.
+
+This module provides the QuoteIndex class, which indexes a collection of
+quotes once so that looking quotes up by author or body, and completing
+partial input, does not require scanning every quote on every request.
+
+Classes:
+- QuoteIndex: Case-folded hash maps from author to quotes and from body to
+  quote, a sorted prefix index and a trigram index for partial matches,
+  with positions stored in compact arrays.
+
+Usage:
+Build a QuoteIndex from the loaded quotes (a list or a QuoteFile), then
+use `by_author` and `by_body` for exact (case-insensitive) lookups,
+`complete` for prefix completion and `search` for substring matches.
+"""
+
+import bisect
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set
+from .models import QuoteModel
+
+
+def _fold(text: str) -> str:
+    """Return the case-folded, stripped form of text used as an index key."""
+    return text.strip().casefold()
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Return the set of three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _contains(postings: array, number: int) -> bool:
+    """Return True if the sorted postings array holds number."""
+    position = bisect.bisect_left(postings, number)
+    return position < len(postings) and postings[position] == number
+
+
+def _field_reader(quotes: Sequence[QuoteModel], field: str) -> Callable[[int], str]:
+    """
+    Return a function reading one field of the quote at a position.
+
+    A QuoteFile or QuoteStore provides `body(index)` and `author(index)`,
+    which read the field without creating a QuoteModel; other sequences
+    are indexed.
+    """
+    reader = getattr(quotes, field, None)
+    if callable(reader):
+        return reader
+    return lambda number: getattr(quotes[number], field)
+
+
+class QuoteIndex:
+    """
+    An index over a sequence of quotes for fast lookup and completion.
+
+    The index is built once, when it is created, so build it where the
+    quotes are loaded rather than in a request. It holds quote positions,
+    not quotes: the sorted keys of each field with their positions in an
+    array, and for each trigram the sorted positions of the quotes holding
+    it in an array('I'). Over a QuoteFile the fields are read without
+    creating QuoteModel instances, so only the quotes returned are ever
+    decoded.
+
+    Attributes:
+        quotes (Sequence[QuoteModel]): The indexed quotes.
+    """
+
+    fields = ('body', 'author')
+
+    def __init__(self, quotes: Iterable[QuoteModel]):
+        """
+        Build the index.
+
+        Args:
+            quotes (Iterable[QuoteModel]): The quotes to index. Sequences,
+                                           such as a list or a QuoteFile,
+                                           are used as they are.
+        """
+        if not (hasattr(quotes, '__getitem__') and hasattr(quotes, '__len__')):
+            quotes = list(quotes)
+        self.quotes = quotes
+        self._authors: Dict[str, List[int]] = {}
+        self._bodies: Dict[str, int] = {}
+        # field -> (sorted keys, positions in key order)
+        self._sorted: Dict[str, tuple] = {}
+        # field -> trigram -> sorted positions of the quotes holding it
+        self._trigrams: Dict[str, Dict[str, array]] = {}
+        for field in self.fields:
+            self._index_field(field)
+
+    def _index_field(self, field: str):
+        """Index one field: exact lookup, sorted keys and trigram postings."""
+        read = _field_reader(self.quotes, field)
+        keys = [_fold(read(number)) for number in range(len(self.quotes))]
+        if field == 'author':
+            for number, key in enumerate(keys):
+                self._authors.setdefault(key, []).append(number)
+        else:
+            for number, key in enumerate(keys):
+                self._bodies.setdefault(key, number)
+
+        postings = {}
+        for number, key in enumerate(keys):
+            for trigram in _trigrams(key):
+                matches = postings.get(trigram)
+                if matches is None:
+                    postings[trigram] = matches = array('I')
+                matches.append(number)
+        self._trigrams[field] = postings
+
+        order = array('I', sorted(range(len(keys)), key=keys.__getitem__))
+        self._sorted[field] = ([keys[number] for number in order], order)
+
+    def __len__(self):
+        """Return the number of indexed quotes."""
+        return len(self.quotes)
+
+    def by_author(self, author: str) -> List[QuoteModel]:
+        """
+        Return every quote by the given author, ignoring case.
+
+        Args:
+            author (str): The author to look up.
+
+        Returns:
+            List[QuoteModel]: The author's quotes, in load order.
+        """
+        return [self.quotes[number] for number in self._authors.get(_fold(author), ())]
+
+    def by_body(self, body: str) -> Optional[QuoteModel]:
+        """
+        Return the first quote with the given body, ignoring case.
+
+        Args:
+            body (str): The quote text to look up.
+
+        Returns:
+            Optional[QuoteModel]: The quote, or None if there is none.
+        """
+        number = self._bodies.get(_fold(body))
+        return None if number is None else self.quotes[number]
+
+    def _check_field(self, field: str):
+        """Raise ValueError for a field that is not indexed."""
+        if field not in self.fields:
+            raise ValueError(f'Cannot index quotes by {field}')
+
+    def complete(self, prefix: str, field: str = 'body',
+                 limit: int = 10) -> List[QuoteModel]:
+        """
+        Return quotes whose body or author starts with prefix, ignoring case.
+
+        Args:
+            prefix (str): The text typed so far.
+            field (str, optional): 'body' or 'author'. Defaults to 'body'.
+            limit (int, optional): The maximum number of results.
+                                   Defaults to 10.
+
+        Returns:
+            List[QuoteModel]: Up to limit matching quotes in sorted order;
+            for 'author' only one quote per author is returned.
+        """
+        self._check_field(field)
+        prefix = _fold(prefix)
+        keys, order = self._sorted[field]
+        results, seen = [], set()
+        position = bisect.bisect_left(keys, prefix)
+        while position < len(keys) and len(results) < limit:
+            key = keys[position]
+            if not key.startswith(prefix):
+                break
+            if key not in seen:
+                seen.add(key)
+                results.append(self.quotes[order[position]])
+            position += 1
+        return results
+
+    def search(self, fragment: str, field: str = 'body',
+               limit: int = 10) -> List[QuoteModel]:
+        """
+        Return quotes whose body or author contains fragment, ignoring case.
+
+        Candidates are the quotes holding the fragment's rarest trigram,
+        narrowed by binary searches in the postings of its other trigrams,
+        so only quotes sharing every trigram are compared.
+
+        Args:
+            fragment (str): The text to search for.
+            field (str, optional): 'body' or 'author'. Defaults to 'body'.
+            limit (int, optional): The maximum number of results.
+                                   Defaults to 10.
+
+        Returns:
+            List[QuoteModel]: Up to limit matching quotes in load order.
+        """
+        self._check_field(field)
+        fragment = _fold(fragment)
+        if len(fragment) < 3:
+            return self.complete(fragment, field, limit)
+        read = _field_reader(self.quotes, field)
+
+        postings = self._trigrams[field]
+        candidates = None
+        for trigram in sorted(_trigrams(fragment), key=lambda t: len(postings.get(t, ()))):
+            matches = postings.get(trigram)
+            if not matches:
+                return []
+            if candidates is None:
+                candidates = matches
+            else:
+                candidates = [number for number in candidates if _contains(matches, number)]
+            if not candidates:
+                return []
+
+        results = []
+        for number in candidates:
+            if fragment in _fold(read(number)):
+                results.append(self.quotes[number])
+                if len(results) == limit:
+                    break
+        return results
@@ -0,0 +1,171 @@
+"""
+Quote Lines Module.
+
+This module provides the parsing core shared by the TXT, PDF and DOCX
+ingestors, which all read "quote - author" lines. Lines are split at the
+last " - ", so a quote that contains " - " itself keeps it in its body,
+and lines are processed in large batches: each batch is checked for
+characters that need cleaning once, instead of once per line and field,
+and clean lines become quotes without being cleaned again.
+
+A line that cannot be parsed is skipped on its own with a diagnostic
+naming the file and line number; it never aborts the rest of the file.
+
+Classes:
+- LineError: A line that was skipped, with its file, number and reason.
+
+Functions:
+- read_batches: Read a text stream in large chunks as batches of lines.
+- batched: Group any iterable of lines into batches.
+- parse_batches: Parse batches of lines into quotes.
+- parse_lines: Parse an iterable of lines into quotes.
+
+Usage:
+Call `parse_lines(lines, path)` for lines produced one at a time (PDF
+lines, DOCX paragraphs), or `parse_batches(read_batches(file), path)` for
+a text stream. Pass a list as `errors` to collect the skipped lines
+instead of printing them.
+"""
+
+from itertools import islice
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+from .models import QuoteModel
+
+SEPARATOR = ' - '
+# Bumped whenever parsing changes which quotes a file yields; caches of
+# parsed quotes written by another parser version are discarded
+PARSER_VERSION = 2
+# Lines per batch for line iterables, and characters per read for streams
+BATCH_LINES = 8192
+CHUNK_SIZE = 1 << 20
+# Skipped lines printed per file when no errors list is given
+MAX_REPORTED = 10
+
+
+class LineError(NamedTuple):
+    """A line skipped while parsing quotes."""
+
+    path: str
+    line_number: int
+    reason: str
+    line: str
+
+    def __str__(self):
+        """Return the diagnostic as 'path:line: reason: text'."""
+        return f"{self.path}:{self.line_number}: {self.reason}: {self.line!r}"
+
+
+def read_batches(file, size: int = CHUNK_SIZE) -> Iterator[List[str]]:
+    """
+    Read a text stream in chunks of characters and yield them as lines.
+
+    A line cut by the end of a chunk is carried over to the next batch,
+    so every batch holds whole lines without their '\n' endings.
+
+    Args:
+        file: A text stream.
+        size (int, optional): The number of characters read at a time.
+                              Defaults to 1 MiB.
+
+    Yields:
+        List[str]: The lines of each chunk.
+    """
+    tail = ''
+    while True:
+        chunk = file.read(size)
+        if not chunk:
+            break
+        lines = (tail + chunk).split('\n')
+        # The last piece is unfinished (or empty after a final newline)
+        tail = lines.pop()
+        yield lines
+    if tail:
+        yield [tail]
+
+
+def batched(lines: Iterable[str], size: int = BATCH_LINES) -> Iterator[List[str]]:
+    """
+    Group an iterable of lines into lists of up to size lines.
+
+    Args:
+        lines (Iterable[str]): The lines.
+        size (int, optional): The number of lines per batch.
+
+    Yields:
+        List[str]: The batches of lines.
+    """
+    lines = iter(lines)
+    while True:
+        batch = list(islice(lines, size))
+        if not batch:
+            return
+        yield batch
+
+
+def parse_batches(batches: Iterable[List[str]], path: str = '<text>',
+                  errors: Optional[List[LineError]] = None) -> Iterator[QuoteModel]:
+    """
+    Parse batches of "quote - author" lines into quotes.
+
+    Blank lines are ignored. Other lines without a separator, or with an
+    empty body or author, are skipped and reported.
+
+    Args:
+        batches (Iterable[List[str]]): The lines, in batches.
+        path (str, optional): The name of the file, for diagnostics.
+        errors (List[LineError], optional): Collects the skipped lines. If
+                                            not given, the first few are
+                                            printed and the rest counted.
+
+    Yields:
+        QuoteModel: A quote for each well-formed line.
+    """
+    clean, from_clean = QuoteModel.clean_text, QuoteModel.from_clean
+    skipped = 0
+    line_number = 0
+    for batch in batches:
+        text = '\n'.join(batch)
+        if not text.isascii():
+            # Clean the whole batch at once unless a line holds a newline
+            if text.count('\n') == len(batch) - 1:
+                batch = clean(text).split('\n')
+            else:
+                batch = [clean(line) for line in batch]
+        for line_number, line in enumerate(batch, line_number + 1):
+            body, separator, author = line.rpartition(SEPARATOR)
+            if separator:
+                body, author = body.strip(), author.strip()
+                if body and author:
+                    yield from_clean(body, author)
+                    continue
+                reason = 'empty author' if body else 'empty quote'
+            elif line.strip():
+                reason = f'no {SEPARATOR.strip()!r} separator'
+            else:
+                continue
+            error = LineError(path, line_number, reason, line)
+            if errors is not None:
+                errors.append(error)
+            elif skipped < MAX_REPORTED:
+                print(f"skipped line, quote_lines.py: {error}")
+            skipped += 1
+
+    if errors is None and skipped > MAX_REPORTED:
+        print(f"skipped {skipped - MAX_REPORTED} more lines of {path}, quote_lines.py")
+
+
+def parse_lines(lines: Iterable[str], path: str = '<text>',
+                errors: Optional[List[LineError]] = None) -> Iterator[QuoteModel]:
+    """
+    Parse "quote - author" lines into quotes, a batch at a time.
+
+    Args:
+        lines (Iterable[str]): The lines, e.g. PDF text lines or DOCX
+                               paragraphs.
+        path (str, optional): The name of the file, for diagnostics.
+        errors (List[LineError], optional): Collects the skipped lines.
+
+    Yields:
+        QuoteModel: A quote for each well-formed line.
+    """
+    return parse_batches(batched(lines), path, errors)
@@ -0,0 +1,223 @@
+"""
+Quote Sampler Module.
+
+This module provides the QuoteSampler class, which draws random quotes
+from any sequence of quotes in constant time. Over a memory-mapped
+QuoteFile a draw decodes only the quote it returns, so picking a quote
+from millions never materializes the others.
+
+Draws can be weighted by source file or by author: a group is picked by
+weight first, then a quote uniformly within the group, so a file with a
+thousand quotes is not picked a thousand times more often than a file
+with one. A no-repeat window keeps the most recently drawn quotes from
+coming up again, either for the whole sampler or per session.
+
+Classes:
+- QuoteSampler: A random quote sampler with optional group weights and a
+  no-repeat window.
+
+Usage:
+Create a QuoteSampler over the loaded quotes, e.g.
+`QuoteSampler(quotes, weight_by='source', window=20)`, and call `choice`
+for a quote. Pass a list as `recent` to keep a separate no-repeat window,
+for example one stored in a user's session.
+"""
+
+import bisect
+import random
+import threading
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+from .models import QuoteModel
+
+
+class QuoteSampler:
+    """
+    Draws random quotes in constant time.
+
+    Attributes:
+        quotes (Sequence[QuoteModel]): The quotes drawn from.
+        weight_by (str): 'source', 'author' or None for uniform draws.
+        window (int): The number of recent quotes that are not repeated.
+        groups (List[str]): The source or author names when weighted.
+    """
+
+    weight_fields = ('source', 'author')
+    # Redraws allowed before a repeat is accepted, so tiny groups cannot stall
+    max_attempts = 32
+
+    def __init__(self, quotes: Sequence[QuoteModel], weight_by: Optional[str] = None,
+                 weights: Optional[Dict[str, float]] = None, window: int = 0,
+                 rng: Optional[random.Random] = None):
+        """
+        Initialize a QuoteSampler.
+
+        Grouping quotes for weighted draws takes one pass over the author
+        or source ids (the id columns of a QuoteFile, without decoding any
+        quote); uniform draws need no preparation at all.
+
+        Args:
+            quotes (Sequence[QuoteModel]): The quotes, e.g. a list or a
+                                           QuoteFile.
+            weight_by (str, optional): Weight draws per 'source' (QuoteFile
+                                       only) or per 'author'. Defaults to
+                                       uniform draws over all quotes.
+            weights (Dict[str, float], optional): The weight of each source
+                                                  or author name. Names not
+                                                  listed weigh 1.0.
+            window (int, optional): The number of most recent quotes not to
+                                    repeat. Defaults to 0.
+            rng (random.Random, optional): The random number generator.
+                                           Defaults to the random module.
+
+        Raises:
+            ValueError: If weight_by is unknown, or is 'source' for quotes
+                        that do not record their source.
+        """
+        if weight_by is not None and weight_by not in self.weight_fields:
+            raise ValueError(f'Cannot weight quotes by {weight_by}')
+        self.quotes = quotes
+        self.weight_by = weight_by
+        self.window = max(0, window)
+        self.groups: List[str] = []
+        self._rng = rng or random
+        self._recent = deque()
+        self._lock = threading.Lock()
+        self._order = None
+        if weight_by is not None:
+            self._group(weights or {})
+
+    def _group_ids(self):
+        """Return the group names and the group id of every quote."""
+        if hasattr(self.quotes, 'ids'):
+            names = self.quotes.authors if self.weight_by == 'author' else self.quotes.sources
+            return names, self.quotes.ids(self.weight_by)
+        if self.weight_by == 'source':
+            raise ValueError('Only compiled quote files record the source of each quote')
+
+        names, lookup = [], {}
+        ids = array('I', (lookup.setdefault(quote.author, len(lookup)) for quote in self.quotes))
+        names.extend(lookup)
+        return names, ids
+
+    def _group(self, weights: Dict[str, float]):
+        """Sort quote positions by group and build the cumulative weights."""
+        names, ids = self._group_ids()
+        counts = [0] * len(names)
+        for group in ids:
+            counts[group] += 1
+
+        # Counting sort: the positions of group g are order[starts[g]:starts[g + 1]]
+        starts = [0]
+        for count in counts:
+            starts.append(starts[-1] + count)
+        order = array('I', bytes(4 * starts[-1]))
+        cursor = starts[:-1]
+        for position, group in enumerate(ids):
+            order[cursor[group]] = position
+            cursor[group] += 1
+
+        cumulative, total = [], 0.0
+        for name, count in zip(names, counts):
+            if count:
+                total += max(0.0, float(weights.get(name, 1.0)))
+            cumulative.append(total)
+
+        self.groups = list(names)
+        self._order, self._starts, self._cumulative = order, starts, cumulative
+        if total <= 0 and len(self.quotes):
+            raise ValueError('Every quote group has a weight of zero')
+
+    def __len__(self):
+        """Return the number of quotes drawn from."""
+        return len(self.quotes)
+
+    def _draw(self) -> int:
+        """Return the position of one random quote, ignoring the window."""
+        if self._order is None:
+            return self._rng.randrange(len(self.quotes))
+        cumulative = self._cumulative
+        group = bisect.bisect_right(cumulative, self._rng.random() * cumulative[-1])
+        group = min(group, len(cumulative) - 1)
+        start, end = self._starts[group], self._starts[group + 1]
+        return self._order[start + self._rng.randrange(end - start)]
+
+    def index(self, recent: Optional[list] = None) -> int:
+        """
+        Return the position of a random quote outside the no-repeat window.
+
+        Args:
+            recent (list, optional): The positions drawn recently in a
+                                     session; it is updated in place and
+                                     kept to `window` entries. Defaults to
+                                     the sampler's own window.
+
+        Returns:
+            int: The position of the drawn quote in `quotes`.
+
+        Raises:
+            IndexError: If there are no quotes.
+        """
+        if not len(self.quotes):
+            raise IndexError('Cannot choose from an empty sequence')
+        window = min(self.window, len(self.quotes) - 1)
+        if recent is None:
+            with self._lock:
+                position = self._draw_avoiding(self._recent, window)
+                self._remember(self._recent, position, window)
+            return position
+
+        position = self._draw_avoiding(recent, window)
+        self._remember(recent, position, window)
+        return position
+
+    def _draw_avoiding(self, recent, window: int) -> int:
+        """Draw positions until one is not among the last window draws."""
+        position = self._draw()
+        if window:
+            attempts = 1
+            while position in recent and attempts < self.max_attempts:
+                position = self._draw()
+                attempts += 1
+        return position
+
+    @staticmethod
+    def _remember(recent, position: int, window: int):
+        """Append a drawn position and trim the window to its size."""
+        if not window:
+            return
+        recent.append(position)
+        while len(recent) > window:
+            if isinstance(recent, deque):
+                recent.popleft()
+            else:
+                del recent[0]
+
+    def choice(self, recent: Optional[list] = None) -> QuoteModel:
+        """
+        Return a random quote outside the no-repeat window.
+
+        Args:
+            recent (list, optional): The positions drawn recently in a
+                                     session, updated in place. Defaults to
+                                     the sampler's own window.
+
+        Returns:
+            QuoteModel: The drawn quote; only this quote is decoded.
+        """
+        return self.quotes[self.index(recent)]
+
+    def sample(self, k: int, recent: Optional[list] = None) -> List[QuoteModel]:
+        """
+        Return k random quotes, each drawn with `choice`.
+
+        Args:
+            k (int): The number of quotes to draw.
+            recent (list, optional): The positions drawn recently in a
+                                     session, updated in place.
+
+        Returns:
+            List[QuoteModel]: The drawn quotes.
+        """
+        return [self.choice(recent) for _ in range(k)]
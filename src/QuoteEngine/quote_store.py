@@ -0,0 +1,106 @@
+"""
+Quote Store Module.
+
+This module provides the QuoteStore class, a compact columnar container
+for large numbers of quotes. Instead of keeping one Python object per
+quote, the store keeps a list of body strings, one interned string per
+distinct author and an array of small integer author ids, and only
+creates QuoteModel instances when a quote is accessed.
+
+Classes:
+- QuoteStore: A sequence of quotes backed by columns.
+
+Usage:
+Create a QuoteStore, `extend` it with QuoteModel instances (for example
+the result of `Ingestor.parse`), and use it like a list: `len(store)`,
+`store[i]`, iteration and `random.choice(store)` all work.
+"""
+
+import sys
+from array import array
+from typing import Iterable, Iterator, List
+from .models import QuoteModel
+
+
+class QuoteStore:
+    """
+    A columnar, read-mostly sequence of quotes.
+
+    Attributes:
+        authors (List[str]): The distinct, interned author names, indexed
+                             by author id.
+    """
+
+    def __init__(self, quotes: Iterable[QuoteModel] = ()):
+        """
+        Initialize a QuoteStore, optionally filled with quotes.
+
+        Args:
+            quotes (Iterable[QuoteModel], optional): The initial quotes.
+        """
+        self.authors = []
+        self._author_ids = {}
+        self._bodies = []
+        self._authors_column = array('I')
+        self.extend(quotes)
+
+    def append(self, quote: QuoteModel):
+        """
+        Add a quote to the store.
+
+        Args:
+            quote (QuoteModel): The quote to add.
+        """
+        author_id = self._author_ids.get(quote.author)
+        if author_id is None:
+            author_id = self._author_ids[quote.author] = len(self.authors)
+            self.authors.append(sys.intern(quote.author))
+        self._bodies.append(quote.body)
+        self._authors_column.append(author_id)
+
+    def extend(self, quotes: Iterable[QuoteModel]):
+        """
+        Add several quotes to the store.
+
+        Args:
+            quotes (Iterable[QuoteModel]): The quotes to add.
+        """
+        for quote in quotes:
+            self.append(quote)
+
+    def body(self, index: int) -> str:
+        """Return the body of the quote at index without creating a QuoteModel."""
+        return self._bodies[index]
+
+    def author(self, index: int) -> str:
+        """Return the author of the quote at index without creating a QuoteModel."""
+        return self.authors[self._authors_column[index]]
+
+    def __len__(self):
+        """Return the number of quotes in the store."""
+        return len(self._bodies)
+
+    def __getitem__(self, index):
+        """
+        Return the quote at index, or a list of quotes for a slice.
+
+        Args:
+            index (int or slice): The position of the quote(s).
+
+        Returns:
+            QuoteModel or List[QuoteModel]: The quote(s) at index.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return QuoteModel.from_clean(self._bodies[index],
+                                     self.authors[self._authors_column[index]])
+
+    def __iter__(self) -> Iterator[QuoteModel]:
+        """Yield every quote in the store in insertion order."""
+        authors = self.authors
+        for body, author_id in zip(self._bodies, self._authors_column):
+            yield QuoteModel.from_clean(body, authors[author_id])
+
+    def to_list(self) -> List[QuoteModel]:
+        """Return every quote in the store as a list of QuoteModel instances."""
+        return list(self)
@@ -0,0 +1,292 @@
+"""
+Ingestor Registry Module.
+
+This module provides the IngestorRegistry class, which maps file
+extensions to ingestor classes so the ingestor for a file is found with a
+dictionary lookup instead of asking every ingestor in turn. Ingestors are
+registered by "module:Class" name and imported only when a file of their
+format is first parsed, so PDF, DOCX or Parquet support costs nothing
+until it is used. Files without a known extension are identified by
+sniffing their first bytes.
+
+Classes:
+- IngestorRegistry: Maps lowercase extensions to ingestors, loads
+  entry-point plugins and sniffs file contents.
+
+Functions:
+- register_ingestor: Register an ingestor with the default registry.
+
+Usage:
+`Ingestor` uses the default `registry`. To add a format, call
+`register_ingestor(('.ext',), 'package.module:ExtIngestor')` or, from an
+installed package, declare an entry point in the "quote_engine.ingestors"
+group whose name is the extension, e.g.
+`ext = "package.module:ExtIngestor"`.
+"""
+
+import importlib
+import threading
+import zipfile
+from importlib import metadata
+from typing import Dict, Iterable, List, Optional, Union
+
+ENTRY_POINT_GROUP = 'quote_engine.ingestors'
+
+# Built-in ingestors, imported on first use
+BUILTIN_INGESTORS = {
+    '.csv': f'{__package__}.csv_ingestor:CSVIngestor',
+    '.docx': f'{__package__}.docx_ingestor:DOCXIngestor',
+    '.pdf': f'{__package__}.pdf_ingestor:PDFIngestor',
+    '.txt': f'{__package__}.txt_ingestor:TXTIngestor',
+    '.jsonl': f'{__package__}.jsonl_ingestor:JSONLIngestor',
+    '.ndjson': f'{__package__}.jsonl_ingestor:JSONLIngestor',
+    '.parquet': f'{__package__}.parquet_ingestor:ParquetIngestor',
+    '.qbin': f'{__package__}.qbin_ingestor:QuoteFileIngestor',
+    '.gz': f'{__package__}.gzip_ingestor:GzipIngestor',
+    '.txt.gz': f'{__package__}.gzip_ingestor:GzipIngestor',
+    '.csv.gz': f'{__package__}.gzip_ingestor:GzipIngestor',
+    '.jsonl.gz': f'{__package__}.gzip_ingestor:GzipIngestor',
+}
+
+# Leading bytes of binary formats and the extension they identify
+MAGIC_BYTES = (
+    (b'%PDF', '.pdf'),
+    (b'QTEBIN', '.qbin'),
+    (b'\x1f\x8b', '.gz'),
+    (b'PAR1', '.parquet'),
+    (b'PK\x03\x04', '.docx'),
+)
+
+
+def _entry_points(group: str) -> List:
+    """Return the installed entry points of group."""
+    try:
+        return list(metadata.entry_points(group=group))
+    except TypeError:  # Python < 3.10
+        return list(metadata.entry_points().get(group, []))
+
+
+class IngestorRegistry:
+    """
+    A registry of ingestors keyed by lowercase file extension.
+
+    Entries hold either an ingestor class, a "module:Class" string or an
+    entry point; strings and entry points are resolved to the class on
+    first use and the class replaces them.
+
+    Attributes:
+        entry_point_group (str): The entry point group plugins are read
+                                 from, or None to ignore plugins.
+    """
+
+    def __init__(self, entry_point_group: Optional[str] = ENTRY_POINT_GROUP):
+        """
+        Initialize an empty registry.
+
+        Args:
+            entry_point_group (str, optional): The entry point group of
+                                               plugin ingestors. Defaults
+                                               to "quote_engine.ingestors".
+        """
+        self.entry_point_group = entry_point_group
+        self._entries: Dict[str, object] = {}
+        self._plugins_loaded = entry_point_group is None
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _normalize(extension: str) -> str:
+        """Return extension in lowercase with a leading dot."""
+        extension = extension.lower()
+        return extension if extension.startswith('.') else f'.{extension}'
+
+    def register(self, extensions: Union[str, Iterable[str]], ingestor):
+        """
+        Register an ingestor for one or more extensions.
+
+        A later registration for an extension replaces the earlier one, so
+        plugins can override the built-in ingestors.
+
+        Args:
+            extensions (str or Iterable[str]): The extensions, such as
+                                               '.csv' or 'txt.gz'.
+            ingestor: The ingestor class, or its "module:Class" name.
+        """
+        if isinstance(extensions, str):
+            extensions = (extensions,)
+        with self._lock:
+            for extension in extensions:
+                self._entries[self._normalize(extension)] = ingestor
+
+    def _load_plugins(self):
+        """Register the entry points of installed plugins, without importing them."""
+        with self._lock:
+            if self._plugins_loaded:
+                return
+            self._plugins_loaded = True
+            for entry_point in _entry_points(self.entry_point_group):
+                self._entries[self._normalize(entry_point.name)] = entry_point
+
+    def get(self, extension: str):
+        """
+        Return the ingestor class registered for an extension.
+
+        Args:
+            extension (str): The extension, such as '.pdf'.
+
+        Returns:
+            type: The ingestor class.
+
+        Raises:
+            KeyError: If no ingestor is registered for the extension.
+            ImportError: If the ingestor's module cannot be imported.
+        """
+        self._load_plugins()
+        extension = self._normalize(extension)
+        with self._lock:
+            entry = self._entries[extension]
+        if isinstance(entry, type):
+            return entry
+
+        if isinstance(entry, str):
+            module_name, _, attribute = entry.partition(':')
+            ingestor = getattr(importlib.import_module(module_name), attribute)
+        else:
+            ingestor = entry.load()
+        with self._lock:
+            self._entries[extension] = ingestor
+        return ingestor
+
+    def extensions(self) -> List[str]:
+        """Return the registered extensions."""
+        self._load_plugins()
+        with self._lock:
+            return sorted(self._entries)
+
+    def extension_for(self, path: str) -> Optional[str]:
+        """
+        Return the registered extension matching a file name, if any.
+
+        A double extension such as '.txt.gz' is preferred over its last
+        part; matching ignores case.
+
+        Args:
+            path (str): The path to the file.
+
+        Returns:
+            Optional[str]: The matching registered extension, or None.
+        """
+        self._load_plugins()
+        name = path.replace('\\', '/').rsplit('/', 1)[-1].lower()
+        parts = name.split('.')[1:]
+        with self._lock:
+            for count in (2, 1):
+                if len(parts) >= count:
+                    extension = '.' + '.'.join(parts[-count:])
+                    if extension in self._entries:
+                        return extension
+        return None
+
+    @staticmethod
+    def sniff_bytes(head: bytes) -> Optional[str]:
+        """
+        Identify a format from the first bytes of a file.
+
+        Binary formats are recognized by their magic bytes. Text is
+        identified by its first non-empty line: a JSON object means JSON
+        Lines, a "quote - author" line means TXT and a comma means CSV.
+
+        Args:
+            head (bytes): The first bytes of the file.
+
+        Returns:
+            Optional[str]: The extension of the format, or None if unknown.
+        """
+        for magic, extension in MAGIC_BYTES:
+            if head.startswith(magic):
+                return extension
+
+        text = head.decode('utf-8', errors='ignore').lstrip('\ufeff')
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('{'):
+                return '.jsonl'
+            if ' - ' in line:
+                return '.txt'
+            if ',' in line:
+                return '.csv'
+            return None
+        return None
+
+    def sniff(self, path: str, size: int = 2048) -> Optional[str]:
+        """
+        Identify the format of a file from its content.
+
+        Zip files are only reported as '.docx' if they hold a Word
+        document.
+
+        Args:
+            path (str): The path to the file.
+            size (int, optional): The number of bytes to read. Defaults
+                                  to 2048.
+
+        Returns:
+            Optional[str]: The extension of the format, or None if unknown.
+        """
+        try:
+            with open(path, 'rb') as file:
+                head = file.read(size)
+        except OSError:
+            return None
+
+        extension = self.sniff_bytes(head)
+        if extension == '.docx':
+            try:
+                with zipfile.ZipFile(path) as archive:
+                    if 'word/document.xml' not in archive.namelist():
+                        return None
+            except zipfile.BadZipFile:
+                return None
+        return extension
+
+    def ingestor_for(self, path: str):
+        """
+        Return the ingestor class for a file.
+
+        The file name's extension is looked up first; files with an
+        unknown or missing extension are identified by sniffing.
+
+        Args:
+            path (str): The path to the file.
+
+        Returns:
+            type: The ingestor class.
+
+        Raises:
+            Exception: If no ingestor can handle the file.
+        """
+        extension = self.extension_for(path) or self.sniff(path)
+        if extension is not None:
+            try:
+                return self.get(extension)
+            except KeyError:
+                pass
+        raise Exception(f'Cannot ingest file at {path}')
+
+
+registry = IngestorRegistry()
+for _extension, _spec in BUILTIN_INGESTORS.items():
+    registry.register(_extension, _spec)
+
+
+def register_ingestor(extensions: Union[str, Iterable[str]], ingestor):
+    """
+    Register an ingestor with the default registry.
+
+    Args:
+        extensions (str or Iterable[str]): The extensions it handles.
+        ingestor: The ingestor class, or its "module:Class" name.
+    """
+    registry.register(extensions, ingestor)
+
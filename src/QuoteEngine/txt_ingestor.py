@@ -14,12 +14,14 @@ Classes:
 Usage:
 To use the TXTIngestor, first check if the file can be ingested using
 the `can_ingest` method. If the file can be ingested, call the `parse`
-method to extract quotes.
+method to extract quotes, or `iter_parse` to stream them. The file is read
+in large chunks and parsed a batch of lines at a time by `quote_lines`.
 """
 
-from typing import List
-from .ingestor import IngestorInterface
+from typing import Iterator, List
+from .ingestor import IngestorInterface, report_error
 from .models import QuoteModel
+from .quote_lines import parse_batches, read_batches
 
 class TXTIngestor(IngestorInterface):
     """
@@ -50,15 +52,16 @@ class TXTIngestor(IngestorInterface):
         Returns:
             bool: True if the file is a TXT file, False otherwise.
         """
-        return path.endswith('.txt')
+        return path.lower().endswith('.txt')
 
     @classmethod
     def parse(cls, path: str) -> List[QuoteModel]:
         """
         Parse quotes from a TXT file.
 
-        This method reads the specified TXT file line by line, looking for lines 
-        that contain a quote and an author in the format "quote - author".
+        This method reads the specified TXT file in batches of lines, looking for
+        lines that contain a quote and an author in the format "quote - author";
+        malformed lines are skipped and reported with their line numbers.
         It creates and returns a list of QuoteModel instances representing each 
         parsed quote.
 
@@ -73,13 +76,42 @@ class TXTIngestor(IngestorInterface):
             Exception: If an error occurs while opening or reading the file, 
                         the error is logged to an error file.
         """
-        quotes = []
+        return list(cls.iter_parse(path))
+
+    @classmethod
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """
+        Stream the quotes of a TXT file a batch of lines at a time.
+
+        Args:
+            path (str): The path to the TXT file to be parsed.
+
+        Yields:
+            QuoteModel: A QuoteModel instance for each "quote - author" line.
+
+        Raises:
+            Exception: If an error occurs while opening or reading the file, 
+                        the error is logged and the stream ends.
+        """
         try:
             with open(path, 'r', encoding='utf-8-sig') as file:
-                for line in file:
-                    if ' - ' in line:
-                        body, author = line.split(' - ')
-                        quotes.append(QuoteModel(body=body.strip(), author=author.strip()))
+                yield from cls.iter_parse_stream(file, path)
         except Exception as ex:
-            print(f"error with open error, txt_ingestor: {ex}")
-        return quotes
+            report_error(f"error with open error, txt_ingestor: {ex}")
+
+    @classmethod
+    def iter_parse_stream(cls, file, path: str = '<stream>') -> Iterator[QuoteModel]:
+        """
+        Stream the quotes of an open text stream a batch of lines at a time.
+
+        Used for TXT files and for compressed TXT files opened by the
+        gzip ingestor.
+
+        Args:
+            file: A text stream of "quote - author" lines.
+            path (str, optional): The name of the stream, for diagnostics.
+
+        Yields:
+            QuoteModel: A QuoteModel instance for each "quote - author" line.
+        """
+        yield from parse_batches(read_batches(file), path)
@@ -5,79 +5,265 @@ It allows users to create memes by combining random quotes and images.
 The application can also generate memes based on user input, supporting
 image uploads and custom quotes.
 
+Quotes and images are loaded in a background thread on the first request
+(or when the server starts), so importing the module and binding the
+server are fast; routes that need them answer 503 until `/ready` reports
+that loading finished. A file watcher reloads changed quote files and
+rescans the image directory without a restart.
+
+Random quotes are drawn by a QuoteSampler, optionally weighted per source
+file or author (MEME_QUOTE_WEIGHT_BY), and a user does not see the same
+quote again within the last MEME_NO_REPEAT quotes of their session.
+
+Parsed quotes are deduplicated (MEME_DEDUP: 'exact', 'near' or 'off'), since
+the same quotes ship in several formats; compiled quote files are
+deduplicated when they are compiled.
+
 Modules:
 - setup: Load resources for the meme application.
+- make_sampler: Create the random quote sampler for the loaded quotes.
+- load_resources: Load resources in the background and mark the app ready.
+- start_loading: Start loading resources once, without waiting for them.
+- reload_resources: Reload changed quote files and rescan the images.
+- ready: Report whether resources have finished loading.
 - meme_rand: Generate and render a random meme.
 - meme_form: Render a form for user input.
 - meme_post: Create and render a user-defined meme.
+- meme_image: Render a meme in memory and stream it as an image.
+- quote_complete: Suggest quotes matching partial input.
 """
 
+import io
 import random
 import os
 import re
-import requests
-from flask import Flask, render_template, abort, request
-from meme import generate_meme
-from QuoteEngine import Ingestor  
-from MemeEngine import MemeEngine  
+import threading
+from flask import (Flask, render_template, abort, request, jsonify, send_file, url_for,
+                   session)
+from QuoteEngine import (QuoteCache, QuoteIndex, FileWatcher, QuoteFile, QuoteSampler,
+                         QuoteDeduplicator)
+from MemeEngine import MemeEngine, MemePool, ImageFetcher, FetchError, ImageCatalog
 from QuoteEngine.models import QuoteModel  
 
 app = Flask(__name__)
-meme = MemeEngine('./static')
-temp_dir = './tmp'
-if not os.path.exists(temp_dir):
-    os.makedirs(temp_dir)
+# Signs the session cookie that holds each user's recently shown quotes
+app.secret_key = os.environ.get('MEME_SECRET_KEY') or os.urandom(24)
+meme = MemeEngine('./static', profile=os.environ.get('MEME_PROFILE', 'png'))
+# Remote images are fetched into memory, in a cache bounded by total bytes
+fetcher = ImageFetcher(cache_bytes=int(os.environ.get('MEME_FETCH_CACHE_BYTES', 64 << 20)))
+images_path = './_data/photos/dog/'
+catalog = ImageCatalog(images_path)
+quote_files = ['./_data/DogQuotes/DogQuotesTXT.txt',
+               './_data/DogQuotes/DogQuotesDOCX.docx',
+               './_data/DogQuotes/DogQuotesPDF.pdf',
+               './_data/DogQuotes/DogQuotesCSV.csv',
+               './_data/SimpleLines/SimpleLinesTXT.txt',
+               './_data/SimpleLines/SimpleLinesDOCX.docx',
+               './_data/SimpleLines/SimpleLinesPDF.pdf',
+               './_data/SimpleLines/SimpleLinesCSV.csv',]
+# Compiled with `python -m QuoteEngine -o ./_data/quotes.qbin <quote files>`, listing
+# quote_files in order; a file compiled from other sources is not used
+compiled_quotes = os.environ.get('MEME_QUOTE_FILE', './_data/quotes.qbin')
+# 'source' (compiled quote files only), 'author' or empty for uniform draws
+quote_weight_by = os.environ.get('MEME_QUOTE_WEIGHT_BY') or None
+no_repeat_window = int(os.environ.get('MEME_NO_REPEAT', 20))
+# 'exact' drops repeated quotes, 'near' also near duplicates, 'off' keeps all
+dedup_mode = os.environ.get('MEME_DEDUP', 'exact')
+dedup_stats = None
+
+
+def load_quotes():
+    """Load the quotes from the compiled quote file or the quote files.
+
+    A compiled quote file that was compiled from the quote files and is
+    newer than each of them is opened memory-mapped, without parsing
+    anything. Otherwise the quote files are
+    parsed concurrently, reusing the parsed quotes of unchanged files from
+    the on-disk quote cache, and deduplicated according to `dedup_mode`;
+    the counts are kept in `dedup_stats`.
+
+    Returns:
+        Sequence[QuoteModel]: The quotes.
+    """
+    global dedup_stats
+    if QuoteFile.is_current(compiled_quotes, quote_files):
+        return QuoteFile(compiled_quotes)
+
+    quote_cache = QuoteCache()
+    quotes, errors = quote_cache.parse_many(quote_files)
+    quote_cache.save()
+    if dedup_mode != 'off':
+        deduplicator = QuoteDeduplicator(near=dedup_mode == 'near')
+        quotes = deduplicator.dedup(quotes)
+        dedup_stats = deduplicator.stats
+        print(f"deduplicated quotes, app.py: {dedup_stats}")
+    return quotes
+
 
 def setup():
     """Load all resources for the meme application.
 
-    This function reads quotes from specified text files and collects image paths
-    from the './_data/photos/dog/' directory. It filters for image files with 
-    common extensions (jpg, jpeg, png).
+    This function loads the quotes with `load_quotes` (from a compiled quote
+    file when one is up to date, else from the quote files) and
+    updates the image catalog of the './_data/photos/dog/' directory, which
+    keeps working-size copies of the images with common extensions (jpg,
+    jpeg, png).
 
     Returns:
         tuple: A tuple containing two lists:
             - List of QuoteModel instances.
-            - List of image file paths.
+            - List of working-size image file paths.
     """
-    quote_files = ['./_data/DogQuotes/DogQuotesTXT.txt',
-                   './_data/DogQuotes/DogQuotesDOCX.docx',
-                   './_data/DogQuotes/DogQuotesPDF.pdf',
-                   './_data/DogQuotes/DogQuotesCSV.csv',
-                   './_data/SimpleLines/SimpleLinesTXT.txt',
-                   './_data/SimpleLines/SimpleLinesDOCX.docx',
-                   './_data/SimpleLines/SimpleLinesPDF.pdf',
-                   './_data/SimpleLines/SimpleLinesCSV.csv',]
-
-    quotes = []
-    for file in quote_files:
-        quotes.extend(Ingestor.parse(file))
-
-    images_path = "./_data/photos/dog/"
-
-    imgs = [os.path.join(images_path, img) for img in os.listdir(images_path) if img.endswith(('.jpg', '.jpeg', '.png'))]
-    
+    quotes = load_quotes()
+
+    catalog.scan()
+    imgs = catalog.working_paths()
+
     return quotes, imgs
 
-quotes, imgs = setup()
+
+def make_sampler(quotes):
+    """Create the random quote sampler for the loaded quotes.
+
+    Draws are weighted by `quote_weight_by` and avoid the last
+    `no_repeat_window` quotes. Weighting by source needs a compiled quote
+    file; for parsed quotes the sampler falls back to uniform draws.
+
+    Args:
+        quotes (Sequence[QuoteModel]): The loaded quotes.
+
+    Returns:
+        QuoteSampler: The sampler over the quotes.
+    """
+    try:
+        return QuoteSampler(quotes, weight_by=quote_weight_by, window=no_repeat_window)
+    except ValueError as ex:
+        print(f"error weighting quotes, app.py: {ex}")
+        return QuoteSampler(quotes, window=no_repeat_window)
+
+
+quotes, imgs = [], []
+quote_index = QuoteIndex(quotes)
+quote_sampler = QuoteSampler(quotes)
+meme_pool = MemePool(meme, lambda: imgs, lambda: quote_sampler,
+                     size=int(os.environ.get('MEME_POOL_SIZE', 16)))
+resources_ready = threading.Event()
+load_error = None
+_loader = None
+_loader_lock = threading.Lock()
+
+
+def reload_resources(changed):
+    """Reload changed quote files and rescan the image directory.
+
+    Called by the file watcher with the paths that changed. Only quote
+    files whose content changed are parsed again; the others come from
+    the quote cache. The new quotes, index and images replace the old ones
+    in one assignment each, so requests never see a half-built index. A
+    replaced compiled quote file is not closed here, since requests and the
+    meme pool may still be drawing from it; it is unmapped when the last of
+    them lets go of it.
+
+    Args:
+        changed (list): The watched paths that changed.
+    """
+    global quotes, quote_index, quote_sampler, imgs
+
+    if images_path in changed:
+        catalog.scan()
+        imgs = catalog.working_paths()
+
+    if any(path in quote_files or path == compiled_quotes for path in changed):
+        new_quotes = load_quotes()
+        new_index, new_sampler = QuoteIndex(new_quotes), make_sampler(new_quotes)
+        quotes, quote_index, quote_sampler = new_quotes, new_index, new_sampler
+    print(f"reloaded resources, app.py: {', '.join(changed)}")
+
+
+watcher = FileWatcher(lambda: quote_files + [compiled_quotes, images_path], reload_resources,
+                      interval=float(os.environ.get('MEME_WATCH_INTERVAL', 2)))
+
+
+def load_resources():
+    """Load and index quotes and images, then start the meme pool and watcher.
+
+    The quote index is built here, before the app reports ready, so no
+    request waits for it.
+
+    Runs in a background thread started by `start_loading`. A failure is
+    kept in `load_error` and reported by `/ready`.
+    """
+    global quotes, imgs, quote_index, quote_sampler, load_error
+    try:
+        quotes, imgs = setup()
+        quote_index = QuoteIndex(quotes)
+        quote_sampler = make_sampler(quotes)
+        meme_pool.start()
+        watcher.start()
+        resources_ready.set()
+    except Exception as ex:
+        load_error = ex
+        print(f"error loading resources, app.py: {ex}")
+
+
+def start_loading():
+    """Start loading resources in the background, once per process."""
+    global _loader
+    with _loader_lock:
+        if _loader is None:
+            _loader = threading.Thread(target=load_resources, name='resource-loader',
+                                       daemon=True)
+            _loader.start()
+
+
+@app.before_request
+def require_resources():
+    """Start loading resources and answer 503 until they are loaded.
+
+    The readiness endpoint, static files and the creation form do not need
+    the quotes or images, so they are always served.
+
+    Returns:
+        Response or None: A 503 response while loading, otherwise None.
+    """
+    start_loading()
+    if resources_ready.is_set() or request.endpoint in ('ready', 'static', 'meme_form'):
+        return None
+    return 'Loading quotes and images, try again shortly', 503, {'Retry-After': '1'}
+
+
+@app.route('/ready', methods=['GET'])
+def ready():
+    """Report whether quotes and images have finished loading.
+
+    Returns:
+        Response: JSON with "ready", the number of quotes and images and
+        of duplicate quotes dropped, with status 200 when ready, 503 while
+        loading and 500 if loading failed.
+    """
+    if load_error is not None:
+        return jsonify({'ready': False, 'error': str(load_error)}), 500
+    if not resources_ready.is_set():
+        return jsonify({'ready': False}), 503
+    status = {'ready': True, 'quotes': len(quotes), 'images': len(imgs)}
+    if dedup_stats is not None:
+        status['duplicates_dropped'] = dedup_stats.dropped
+    return jsonify(status)
 
 
 @app.route('/')
 def meme_rand():
     """Generate and render a random meme.
 
-    This function selects a random image and a random quote from the pre-loaded
-    lists, generates a meme using the MemeEngine, and renders the meme in 
-    'meme.html'.
+    This function takes a meme pre-rendered from a random image and a
+    random quote out of the meme pool (rendering one on the spot only when
+    the pool is empty) and renders it in 'meme.html'.
 
     Returns:
         str: The rendered HTML template with the generated meme path.
     """
-    img = random.choice(imgs)
-    quote = random.choice(quotes)
-    
-    path = meme.make_meme(img, quote.body, quote.author)
-    
+    path = meme_pool.get()
+
     return render_template('meme.html', path=path)
 
 
@@ -98,9 +284,11 @@ def meme_form():
 def meme_post():
     """Create and render a user-defined meme.
 
-    This function processes the user's input from the form, either generating
-    a meme from a provided image URL or selecting a random image if no URL is
-    given. It can also fill in the quote or author based on user input.
+    This function processes the user's input from the form, either pointing
+    the page at the in-memory `/meme.png` route for a provided image URL or
+    generating a meme from a random image if no URL is given. It can also
+    fill in the quote or author based on user input; a random quote is not
+    one of the last quotes shown in the user's session.
 
     Returns:
         str: The rendered HTML template with the generated meme path.
@@ -114,53 +302,98 @@ def meme_post():
     if author in {'-', '', ' '}:
         author = None
 
-    if not image_url:
-        img = random.choice(imgs)
-        temp_image_path = None
-    else:
-        # Save the image from the image_url to a temp local file
-        response = requests.get(image_url)
-        temp_image_path = os.path.join(temp_dir, 'temp_image.jpg')
-
-        try:
-            with open(temp_image_path, 'wb') as f:
-                f.write(response.content)
-        except Exception as ex:
-            print(f"\nwith open error, app.py: {ex}")
-
     # Generate a random quote if both body and author are None
     if body is None and author is None:
-        quote = random.choice(quotes)
+        recent = session.get('recent_quotes', [])
+        quote = quote_sampler.choice(recent)
+        session['recent_quotes'] = recent
         body = quote.body
         author = quote.author
     else:
         if body and author is None:
-            matching_body = [q for q in quotes if q.body.lower() == body.lower()]
-            if matching_body:
-                quote = matching_body[0] 
+            quote = quote_index.by_body(body)
+            if quote:
                 author = quote.author  
             else:
                 author = None 
 
         if author and body is None:
-            matching_author = [q for q in quotes if q.author.lower() == author.lower()]
+            matching_author = quote_index.by_author(author)
             if matching_author:
                 quote = matching_author[0] 
                 body = quote.body
             else:
                 body = None
 
-    # Generate a meme using the temp file and the body and author
-    if temp_image_path is None:
-        path = meme.make_meme(img, body, author)
+    if not image_url:
+        path = meme.make_meme(random.choice(imgs), body, author)
     else:
-        path = meme.make_meme(temp_image_path, body, author)
-        os.remove(temp_image_path)
+        # Remote images are fetched and rendered in memory by /meme.png
+        path = url_for('meme_image', image_url=image_url, body=body, author=author)
 
     return render_template('meme.html', path=path)
 
 
+@app.route('/meme.png', methods=['GET'])
+def meme_image():
+    """Render a meme in memory and stream it as an image.
+
+    The image is downloaded from the `image_url` query parameter into
+    memory (or a random local image is used when it is missing), the
+    `body` and `author` parameters are drawn on it, and the result is
+    encoded with the `profile` parameter (the engine's encoder profile by
+    default) and streamed back without touching the disk.
+
+    Returns:
+        Response: The encoded image.
+    """
+    image_url = request.args.get('image_url')
+    body = request.args.get('body', '')
+    author = request.args.get('author', '')
+    profile = request.args.get('profile', meme.profile)
+    if profile != 'auto' and profile not in meme.profiles:
+        abort(400)
+
+    if image_url:
+        try:
+            source = fetcher.fetch_bytes(image_url)
+        except FetchError as ex:
+            print(f"\nimage fetch error, app.py: {ex}")
+            abort(400)
+    else:
+        source = random.choice(imgs)
+
+    try:
+        result = meme.render_encoded(source, body, author, profile=profile)
+    except IOError as ex:
+        print(f"\nimage decode error, app.py: {ex}")
+        abort(400)
+
+    return send_file(io.BytesIO(result.data), mimetype=result.mimetype)
+
+
+@app.route('/complete', methods=['GET'])
+def quote_complete():
+    """Suggest quotes matching partial input.
+
+    This function looks up the `q` query parameter in the quote index,
+    matching the start of the quote body (or author when `field=author`)
+    first and falling back to a substring search.
+
+    Returns:
+        Response: A JSON list of {"body", "author"} suggestions.
+    """
+    prefix = request.args.get('q', '')
+    field = request.args.get('field', 'body')
+    if field not in QuoteIndex.fields:
+        abort(400)
+
+    matches = quote_index.complete(prefix, field) or quote_index.search(prefix, field)
+    return jsonify([{'body': q.body, 'author': q.author} for q in matches])
+
+
 if __name__ == "__main__":
+    start_loading()
     app.run()
 
 
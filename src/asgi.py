@@ -0,0 +1,263 @@
+"""
+This module serves the meme web application asynchronously over ASGI.
+
+Remote images for `/meme.png` are downloaded concurrently from the event
+loop and rendering is offloaded to a bounded executor, so one slow
+`image_url` only holds up its own request. Every other route is served
+by the Flask application, also inside the bounded executor. Admission
+control answers 503 Service Unavailable once too many requests are in
+flight instead of queueing them without limit.
+
+Classes:
+- Admission: Counts in-flight requests and refuses new ones past a limit.
+
+Modules:
+- application: The ASGI application.
+- meme_image: Fetch, render and encode a meme without blocking the loop.
+
+Usage:
+Run it with any ASGI server from the src directory, for example
+`uvicorn asgi:application`. The limits are read from the environment:
+MEME_RENDER_WORKERS (render threads, default: CPU count),
+MEME_FETCH_WORKERS (concurrent downloads, default 16), MEME_MAX_PENDING
+(requests in flight before 503, default 64) and MEME_FETCH_DEADLINE
+(seconds allowed per download, default 15; the fetching thread gives up
+at the same deadline, so slow servers cannot hold fetch threads).
+"""
+
+import asyncio
+import io
+import os
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import parse_qs
+import app as web
+from MemeEngine import FetchError
+
+RENDER_WORKERS = int(os.environ.get('MEME_RENDER_WORKERS', os.cpu_count() or 1))
+FETCH_WORKERS = int(os.environ.get('MEME_FETCH_WORKERS', 16))
+MAX_PENDING = int(os.environ.get('MEME_MAX_PENDING', 64))
+FETCH_DEADLINE = float(os.environ.get('MEME_FETCH_DEADLINE', 15))
+
+# Pillow releases the GIL while decoding, resizing and encoding, so
+# rendering threads run in parallel; downloads wait on the network
+render_executor = ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix='render')
+fetch_executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix='fetch')
+
+
+class Admission:
+    """
+    Admission control for in-flight requests.
+
+    All requests are handled on the event loop thread, so the counters
+    need no lock.
+
+    Attributes:
+        limit (int): The number of requests allowed in flight at once.
+        in_flight (int): The number of requests currently being served.
+        rejected (int): The number of requests refused with 503.
+    """
+
+    def __init__(self, limit: int):
+        """
+        Initialize the Admission controller.
+
+        Args:
+            limit (int): The number of requests allowed in flight at once.
+        """
+        self.limit = limit
+        self.in_flight = 0
+        self.rejected = 0
+
+    def try_enter(self) -> bool:
+        """
+        Admit a request if there is room for it.
+
+        Returns:
+            bool: True if the request was admitted and must call `leave`.
+        """
+        if self.in_flight >= self.limit:
+            self.rejected += 1
+            return False
+        self.in_flight += 1
+        return True
+
+    def leave(self):
+        """Mark an admitted request as finished."""
+        self.in_flight -= 1
+
+
+admission = Admission(MAX_PENDING)
+
+# Headers of the plain text error responses
+TEXT = [(b'content-type', b'text/plain')]
+
+
+async def _read_body(receive) -> bytes:
+    """Read the complete request body from the ASGI receive channel."""
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            break
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            break
+    return b''.join(chunks)
+
+
+async def _respond(send, status: int, body: bytes, headers=()):
+    """Send a complete response over the ASGI send channel."""
+    headers = [(b'content-length', str(len(body)).encode('latin-1'))] + list(headers)
+    await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def _environ(scope: dict, body: bytes) -> dict:
+    """Translate an ASGI HTTP scope and body into a WSGI environ."""
+    server = scope.get('server') or ('localhost', 80)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    if scope.get('client'):
+        environ['REMOTE_ADDR'] = scope['client'][0]
+    for name, value in scope.get('headers', []):
+        name = name.decode('latin-1').upper().replace('-', '_')
+        key = name if name in ('CONTENT_TYPE', 'CONTENT_LENGTH') else f'HTTP_{name}'
+        value = value.decode('latin-1')
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+def _call_flask(environ: dict):
+    """Run the Flask application on environ and return the whole response."""
+    response = {}
+
+    def start_response(status, headers, exc_info=None):
+        response['status'] = int(status.split(' ', 1)[0])
+        response['headers'] = [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                               for name, value in headers
+                               if name.lower() != 'content-length']
+
+    chunks = web.app(environ, start_response)
+    try:
+        body = b''.join(chunks)
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+    return response['status'], response['headers'], body
+
+
+async def meme_image(query: dict):
+    """Fetch, render and encode a meme for the `/meme.png` route.
+
+    The query parameters are the same as for the Flask route. The download
+    runs in the fetch executor under a deadline and the rendering in the
+    bounded render executor; the event loop only waits for both.
+
+    Args:
+        query (dict): The first value of each query parameter.
+
+    Returns:
+        tuple: The status code, headers and body of the response.
+    """
+    if not web.resources_ready.is_set():
+        web.start_loading()
+        return 503, TEXT + [(b'retry-after', b'1')], b'Loading quotes and images'
+
+    loop = asyncio.get_running_loop()
+    image_url = query.get('image_url')
+    body = query.get('body', '')
+    author = query.get('author', '')
+    profile = query.get('profile', web.meme.profile)
+    if profile != 'auto' and profile not in web.meme.profiles:
+        return 400, TEXT, b'Unknown encoder profile'
+
+    if image_url:
+        try:
+            source = await asyncio.wait_for(
+                loop.run_in_executor(fetch_executor,
+                                     partial(web.fetcher.fetch_bytes, image_url,
+                                             deadline=FETCH_DEADLINE)),
+                FETCH_DEADLINE)
+        except asyncio.TimeoutError:
+            print(f"\nimage fetch timeout, asgi.py: {image_url}")
+            return 504, TEXT, b'Image download timed out'
+        except FetchError as ex:
+            print(f"\nimage fetch error, asgi.py: {ex}")
+            return 400, TEXT, b'Cannot fetch image'
+    else:
+        source = random.choice(web.imgs)
+
+    try:
+        result = await loop.run_in_executor(
+            render_executor,
+            partial(web.meme.render_encoded, source, body, author, profile=profile))
+    except IOError as ex:
+        print(f"\nimage decode error, asgi.py: {ex}")
+        return 400, TEXT, b'Cannot decode image'
+
+    return 200, [(b'content-type', result.mimetype.encode('latin-1'))], result.data
+
+
+async def _lifespan(receive, send):
+    """Start loading resources at startup and shut the executors down at exit."""
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            web.start_loading()
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            render_executor.shutdown(wait=False)
+            fetch_executor.shutdown(wait=False)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def application(scope, receive, send):
+    """Serve one ASGI connection.
+
+    `GET /meme.png` is handled natively on the event loop; every other
+    HTTP request is passed to the Flask application in the render
+    executor. Requests beyond the admission limit get 503 at once.
+    """
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    if not admission.try_enter():
+        await _respond(send, 503, b'Server is busy, try again shortly',
+                       TEXT + [(b'retry-after', b'1')])
+        return
+
+    try:
+        body = await _read_body(receive)
+        if scope['path'] == '/meme.png' and scope['method'] == 'GET':
+            query = {key: values[0] for key, values in
+                     parse_qs(scope.get('query_string', b'').decode('latin-1'),
+                              keep_blank_values=True).items()}
+            status, headers, content = await meme_image(query)
+        else:
+            loop = asyncio.get_running_loop()
+            status, headers, content = await loop.run_in_executor(
+                render_executor, _call_flask, _environ(scope, body))
+        await _respond(send, status, content, headers)
+    finally:
+        admission.leave()
@@ -0,0 +1 @@
+"""Benchmarks for the Meme Generator; run them with `python -m benchmarks.<name>` from src."""
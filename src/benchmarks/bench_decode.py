@@ -0,0 +1,91 @@
+"""
+Image decode benchmark.
+
+Times decoding and resizing each photo in _data/photos/dog to the meme
+width, once the way the engine used to (full decode, then a single
+resize) and once through ImageCache.load (JPEG draft decoding and an
+integer reduce before the final resample). Peak RSS is measured in a
+fresh process per photo and path, so one measurement does not inflate
+the next.
+
+Usage (from the src directory):
+    python -m benchmarks.bench_decode --width 500 --repeat 5
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import time
+from PIL import Image
+from MemeEngine.image_cache import ImageCache
+
+FILTERS = {
+    'default': None,
+    'nearest': Image.Resampling.NEAREST,
+    'bilinear': Image.Resampling.BILINEAR,
+    'bicubic': Image.Resampling.BICUBIC,
+    'lanczos': Image.Resampling.LANCZOS,
+}
+
+
+def legacy_load(img_path, width, resample):
+    """Decode the full image and resize it in one step, as before."""
+    with Image.open(img_path) as img:
+        height = int(width * img.height / img.width)
+        if resample is None:
+            return img.resize((width, height))
+        return img.resize((width, height), resample=resample)
+
+
+LOADERS = {'legacy': legacy_load, 'fast': ImageCache.load}
+
+
+def _peak_rss(loader, img_path, width, resample):
+    """Load one image and return the peak RSS of this process in KiB."""
+    LOADERS[loader](img_path, width, resample)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def peak_rss(pool, loader, img_path, width, resample):
+    """Return the peak RSS in MiB of a fresh process loading one image."""
+    return pool.apply(_peak_rss, (loader, img_path, width, resample)) / 1024
+
+
+def timed(loader, img_path, width, resample, repeat):
+    """Return the best wall time in ms of loading one image repeat times."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        LOADERS[loader](img_path, width, resample)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--dir', default='./_data/photos/dog')
+    parser.add_argument('--width', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--filter', choices=FILTERS, default='default')
+    args = parser.parse_args()
+    resample = FILTERS[args.filter]
+
+    context = multiprocessing.get_context('spawn')
+    print(f"{'image':>16} {'source':>11} {'legacy ms':>10} {'fast ms':>8} "
+          f"{'legacy MiB':>11} {'fast MiB':>9}")
+    for name in sorted(os.listdir(args.dir)):
+        img_path = os.path.join(args.dir, name)
+        with Image.open(img_path) as img:
+            source = f"{img.width}x{img.height}"
+        row = [timed(loader, img_path, args.width, resample, args.repeat)
+               for loader in LOADERS]
+        for loader in LOADERS:
+            with context.Pool(1, maxtasksperchild=1) as pool:
+                row.append(peak_rss(pool, loader, img_path, args.width, resample))
+        print(f"{name:>16} {source:>11} {row[0]:10.1f} {row[1]:8.1f} "
+              f"{row[2]:11.1f} {row[3]:9.1f}")
+
+
+if __name__ == '__main__':
+    main()
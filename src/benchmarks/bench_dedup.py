@@ -0,0 +1,54 @@
+"""
+Quote deduplication benchmark.
+
+Generates N quotes of which a share are exact repeats (differing only in
+case, whitespace and quotation marks) and a share are near repeats (with
+changed punctuation), and times QuoteDeduplicator in exact and near mode.
+
+Usage (from the src directory):
+    python -m benchmarks.bench_dedup --count 1000000
+"""
+
+import argparse
+import random
+import time
+from QuoteEngine import QuoteDeduplicator, QuoteModel
+
+
+def generate(count, repeats, seed=0):
+    """Return count quotes, a repeats share of them repeating earlier ones."""
+    rng = random.Random(seed)
+    words = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(2, 9)))
+             for _ in range(20_000)]
+    unique = int(count * (1 - repeats))
+    quotes = [QuoteModel(' '.join(rng.choices(words, k=rng.randint(5, 15))), f"Author {i % 500}")
+              for i in range(unique)]
+    for i in range(count - unique):
+        quote = quotes[rng.randrange(unique)]
+        if i % 2:
+            quotes.append(QuoteModel(f"“{quote.body.upper()}”", quote.author))
+        else:
+            quotes.append(QuoteModel(f"{quote.body}!", quote.author))
+    return quotes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--repeats', type=float, default=0.2)
+    args = parser.parse_args()
+
+    quotes = generate(args.count, args.repeats)
+    print(f"{len(quotes)} quotes, {args.repeats:.0%} repeated")
+    for near in (False, True):
+        deduplicator = QuoteDeduplicator(near=near)
+        start = time.perf_counter()
+        deduplicator.dedup(quotes)
+        elapsed = time.perf_counter() - start
+        mode = 'near' if near else 'exact'
+        print(f"{mode:>6}: {elapsed:7.2f} s "
+              f"({elapsed / len(quotes) * 1e6:5.1f} us/quote) {deduplicator.stats}")
+
+
+if __name__ == '__main__':
+    main()
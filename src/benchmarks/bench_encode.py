@@ -0,0 +1,40 @@
+"""
+Encoder profile benchmark.
+
+Renders a meme from every photo in _data/photos/dog and encodes it with
+each of MemeEngine's encoder profiles (and 'auto'), printing the encoded
+size and encode time per profile, so profiles can be tuned with data.
+
+Usage (from the src directory):
+    python -m benchmarks.bench_encode --width 500
+"""
+
+import argparse
+import os
+import tempfile
+from MemeEngine import MemeEngine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--dir', default='./_data/photos/dog')
+    parser.add_argument('--width', type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        engine = MemeEngine(output_dir)
+        profiles = list(engine.profiles) + ['auto']
+        for name in sorted(os.listdir(args.dir)):
+            img = engine.load_image(os.path.join(args.dir, name), args.width)
+            engine.draw_text(img, "To err is human, to forgive canine", "Anonymous")
+            for profile in profiles:
+                engine.encode(img, profile)
+
+        print(f"{'profile':>22} {'renders':>8} {'mean KiB':>9} {'mean ms':>8}")
+        for key, stats in engine.encoding_stats().items():
+            print(f"{key:>22} {stats['renders']:8d} {stats['mean_bytes'] / 1024:9.1f} "
+                  f"{stats['mean_ms']:8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Quote line-splitting benchmark.
+
+Writes N "quote - author" lines to a TXT file and compares the per-line
+loop the TXT ingestor used to run (split(' - '), one QuoteModel with its
+own replacements dict per line) against the batched parsing core in
+`QuoteEngine.quote_lines`. It then parses a copy in which some quotes
+contain " - " and some lines are malformed: the old loop aborts at the
+first of them, the new core skips only the bad lines.
+
+Usage (from the src directory):
+    python -m benchmarks.bench_line_split --count 1000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from QuoteEngine.txt_ingestor import TXTIngestor
+
+
+class LegacyQuoteModel:
+    """The QuoteModel as it was, with a replacements dict per cleaned field."""
+
+    def __init__(self, body, author):
+        self.body = self.clean_text(body.strip())
+        self.author = self.clean_text(author.strip())
+
+    def clean_text(self, text):
+        replacements = {
+            '“': '"',
+            '”': '"',
+            '‘': "'",
+            '’': "'",
+        }
+        for old_char, new_char in replacements.items():
+            text = text.replace(old_char, new_char)
+        return text
+
+
+def legacy_parse(path):
+    """Parse a TXT file with the old per-line loop."""
+    quotes = []
+    try:
+        with open(path, 'r', encoding='utf-8-sig') as file:
+            for line in file:
+                if ' - ' in line:
+                    body, author = line.split(' - ')
+                    quotes.append(LegacyQuoteModel(body=body.strip(), author=author.strip()))
+    except Exception as ex:
+        print(f"{'':>24}  legacy loop aborted after {len(quotes)} quotes: {ex}")
+    return quotes
+
+
+def write_lines(path, count, messy=False):
+    """Write count quote lines; messy files include hyphenated and bad lines."""
+    with open(path, 'w', encoding='utf-8') as file:
+        for i in range(count):
+            if messy and i % 1000 == 500:
+                file.write(f"Quote {i} - with an aside - about dogs - Author {i % 500}\n")
+            elif messy and i % 1000 == 900:
+                file.write(f"A line without an author {i}\n")
+            else:
+                file.write(f"“Quote {i} about dogs and cats” - Author {i % 500}\n")
+
+
+def measured(label, function):
+    """Call function, print its time and number of quotes, and return them."""
+    start = time.perf_counter()
+    quotes = function()
+    print(f"{label:>24}: {(time.perf_counter() - start) * 1000:9.1f} ms {len(quotes):9} quotes")
+    return quotes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        clean_path = os.path.join(directory, 'clean.txt')
+        messy_path = os.path.join(directory, 'messy.txt')
+        write_lines(clean_path, args.count)
+        write_lines(messy_path, args.count, messy=True)
+
+        print(f"{args.count} lines")
+        measured('legacy loop', lambda: legacy_parse(clean_path))
+        measured('batched core', lambda: TXTIngestor.parse(clean_path))
+        print("with hyphenated quotes and bad lines")
+        measured('legacy loop', lambda: legacy_parse(messy_path))
+        measured('batched core', lambda: TXTIngestor.parse(messy_path))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+PDF ingestion benchmark.
+
+Compares the in-process PyPDF2 backend of PDFIngestor with the pdftotext
+CLI backend on generated multi-page quote PDFs.
+
+Usage (from the src directory):
+    python -m benchmarks.bench_pdf_ingest --pages 200 --lines 40 --repeat 3
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from QuoteEngine.pdf_ingestor import PDFIngestor
+
+
+def write_quote_pdf(path, pages, lines_per_page):
+    """
+    Write a PDF with one "quote - author" line per text line.
+
+    Args:
+        path (str): Where to write the PDF.
+        pages (int): The number of pages.
+        lines_per_page (int): The number of quote lines on each page.
+    """
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        None,  # the page tree, filled in once the page ids are known
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    page_ids = []
+    for page in range(pages):
+        text = [b'BT /F1 10 Tf 14 TL 40 800 Td']
+        for line in range(lines_per_page):
+            number = page * lines_per_page + line
+            text.append(b'(Quote number %d is about dogs - Author %d) Tj T*'
+                        % (number, number % 97))
+        text.append(b'ET')
+        stream = b'\n'.join(text)
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] '
+                       b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>'
+                       % content_id)
+        page_ids.append(len(objects))
+    kids = b' '.join(b'%d 0 R' % page_id for page_id in page_ids)
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(page_ids))
+
+    with open(path, 'wb') as file:
+        file.write(b'%PDF-1.4\n')
+        offsets = []
+        for number, obj in enumerate(objects, start=1):
+            offsets.append(file.tell())
+            file.write(b'%d 0 obj\n%s\nendobj\n' % (number, obj))
+        xref = file.tell()
+        file.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+        for offset in offsets:
+            file.write(b'%010d 00000 n \n' % offset)
+        file.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+                   % (len(objects) + 1, xref))
+
+
+def bench(path, backend, repeat):
+    """Return the best wall time and the quote count for one backend."""
+    best, count = None, 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = len(PDFIngestor.parse(path, backend=backend))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--lines', type=int, default=40)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'quotes.pdf')
+        write_quote_pdf(path, args.pages, args.lines)
+        size = os.path.getsize(path)
+        print(f"{args.pages} pages, {args.pages * args.lines} quotes, {size / 1024:.0f} KiB")
+
+        backends = ['pypdf2']
+        if shutil.which('pdftotext'):
+            backends.append('pdftotext')
+        else:
+            print("pdftotext not found, skipping the CLI backend")
+
+        for backend in backends:
+            elapsed, count = bench(path, backend, args.repeat)
+            print(f"{backend:>10}: {elapsed * 1000:8.1f} ms  {count} quotes")
+
+
+if __name__ == '__main__':
+    main()
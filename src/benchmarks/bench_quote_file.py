@@ -0,0 +1,53 @@
+"""
+Quote file benchmark.
+
+Writes N generated quotes as a TXT file, compiles it into a binary quote
+file, and compares the time to load the TXT file with `Ingestor.parse`
+against the time to open the quote file and read random quotes from it.
+
+Usage (from the src directory):
+    python -m benchmarks.bench_quote_file --count 1000000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from QuoteEngine import Ingestor, QuoteFile
+
+
+def timed(label, function):
+    """Call function, print how long it took and return its result."""
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:>32}: {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--reads', type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        txt_path = os.path.join(directory, 'quotes.txt')
+        qbin_path = os.path.join(directory, 'quotes.qbin')
+        with open(txt_path, 'w', encoding='utf-8') as file:
+            for i in range(args.count):
+                file.write(f"Quote number {i} about dogs - Author {i % 500}\n")
+
+        print(f"{args.count} quotes")
+        timed('Ingestor.parse (TXT)', lambda: Ingestor.parse(txt_path))
+        timed('QuoteFile.compile', lambda: QuoteFile.compile([txt_path], qbin_path))
+        print(f"{'quote file size':>32}: {os.path.getsize(qbin_path) / 2 ** 20:9.1f} MiB")
+        quotes = timed('QuoteFile open', lambda: QuoteFile(qbin_path))
+        indexes = [random.randrange(len(quotes)) for _ in range(args.reads)]
+        timed(f'{args.reads} random quotes', lambda: [quotes[i] for i in indexes])
+        timed('iterate all quotes', lambda: sum(1 for _ in quotes))
+        quotes.close()
+
+
+if __name__ == '__main__':
+    main()
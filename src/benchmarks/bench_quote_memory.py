@@ -0,0 +1,71 @@
+"""
+Quote memory benchmark.
+
+Compares the memory used by N quotes held as the original dict-backed
+QuoteModel, the slotted QuoteModel and a columnar QuoteStore, and the time
+needed to construct them.
+
+Usage (from the src directory):
+    python -m benchmarks.bench_quote_memory --count 1000000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from QuoteEngine.models import QuoteModel
+from QuoteEngine.quote_store import QuoteStore
+
+
+class LegacyQuoteModel:
+    """The dict-backed QuoteModel as it was before __slots__ and interning."""
+
+    def __init__(self, body, author):
+        self.body = self.clean_text(body.strip())
+        self.author = self.clean_text(author.strip())
+
+    def clean_text(self, text):
+        replacements = {
+            '“': '"',
+            '”': '"',
+            '‘': "'",
+            '’': "'",
+        }
+        for old_char, new_char in replacements.items():
+            text = text.replace(old_char, new_char)
+        return text
+
+
+def raw_quotes(count, authors=500):
+    """Yield (body, author) pairs with freshly built strings, as a parser would."""
+    for i in range(count):
+        yield f"“Quote number {i} about dogs”", f"Author {i % authors}"
+
+
+def measure(label, build, count):
+    """Build the container and print the memory it holds and the build time."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    container = build(raw_quotes(count))
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:>18}: {current / 2 ** 20:8.1f} MiB  {elapsed:6.2f} s  "
+          f"({current / count:.0f} B/quote)")
+    del container
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{args.count} quotes")
+    measure('legacy QuoteModel', lambda rows: [LegacyQuoteModel(b, a) for b, a in rows], args.count)
+    measure('slotted QuoteModel', lambda rows: [QuoteModel(b, a) for b, a in rows], args.count)
+    measure('QuoteStore', lambda rows: QuoteStore(QuoteModel(b, a) for b, a in rows), args.count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Quote sampler benchmark.
+
+Compiles N generated quotes from several source files into a binary quote
+file and compares drawing random quotes with `random.choice` over a fully
+parsed list against a QuoteSampler over the memory-mapped file: the time
+and memory needed before the first draw, and the time of the draws.
+
+Usage (from the src directory):
+    python -m benchmarks.bench_sampler --count 1000000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from QuoteEngine import Ingestor, QuoteFile, QuoteSampler
+
+
+def measured(label, function, trace=False):
+    """Call function, print its time (and traced memory) and return its result."""
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    memory = ''
+    if trace:
+        memory = f" {tracemalloc.get_traced_memory()[0] / 2 ** 20:9.1f} MiB"
+        tracemalloc.stop()
+    print(f"{label:>36}: {elapsed * 1000:9.1f} ms{memory}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--sources', type=int, default=8)
+    parser.add_argument('--draws', type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for source in range(args.sources):
+            path = os.path.join(directory, f'quotes{source}.txt')
+            # Uneven sources: file k holds k + 1 shares of the quotes
+            share = args.count * (source + 1) // (args.sources * (args.sources + 1) // 2)
+            with open(path, 'w', encoding='utf-8') as file:
+                for i in range(share):
+                    file.write(f"Quote {i} of file {source} about dogs - Author {i % 500}\n")
+            paths.append(path)
+        qbin_path = os.path.join(directory, 'quotes.qbin')
+        QuoteFile.compile(paths, qbin_path)
+
+        print(f"{args.count} quotes in {args.sources} files, {args.draws} draws")
+        quotes = measured('parse all files into a list',
+                          lambda: [q for path in paths for q in Ingestor.parse(path)], trace=True)
+        measured('random.choice(list)',
+                 lambda quotes=quotes: [random.choice(quotes) for _ in range(args.draws)])
+        del quotes
+
+        quote_file = measured('open quote file', lambda: QuoteFile(qbin_path), trace=True)
+        uniform = QuoteSampler(quote_file)
+        measured('sampler.choice (uniform)',
+                 lambda sampler=uniform: [sampler.choice() for _ in range(args.draws)])
+        by_source = measured('weight by source',
+                             lambda: QuoteSampler(quote_file, weight_by='source'))
+        measured('sampler.choice (by source)',
+                 lambda sampler=by_source: [sampler.choice() for _ in range(args.draws)])
+        windowed = QuoteSampler(quote_file, weight_by='source', window=50)
+        measured('sampler.choice (by source, window)',
+                 lambda sampler=windowed: [sampler.choice() for _ in range(args.draws)])
+        del uniform, by_source, windowed
+        quote_file.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Startup time benchmark.
+
+Measures, each in a fresh interpreter, how long `import app` takes (the
+time before a server can bind), how long it takes until `/ready` reports
+the quotes and images loaded, and how long import plus a blocking
+`setup()` takes, which is what importing the module used to cost. It
+also lists which heavy dependencies are loaded by the import alone.
+
+Usage (from the src directory):
+    python -m benchmarks.bench_startup --repeat 5
+    python -m benchmarks.bench_startup --cold   # drop the quote and image caches first
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter() - start
+heavy = [name for name in ('docx', 'PyPDF2', 'requests') if name in sys.modules]
+if {mode!r} == 'lazy':
+    client = app.app.test_client()
+    client.get('/ready')
+    app.resources_ready.wait()
+else:
+    app.setup()
+loaded = time.perf_counter() - start
+print(json.dumps({{'import': imported, 'loaded': loaded, 'heavy': heavy}}))
+"""
+
+
+def run(mode, cold):
+    """Start a fresh interpreter and return its timings."""
+    if cold:
+        shutil.rmtree('./_data/.image_catalog', ignore_errors=True)
+        try:
+            os.remove('./_data/.quote_cache.pkl')
+        except OSError:
+            pass
+    output = subprocess.run([sys.executable, '-c', SCRIPT.format(mode=mode)],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--cold', action='store_true')
+    args = parser.parse_args()
+
+    for mode, label in (('lazy', 'import, then ready'), ('eager', 'import + setup()')):
+        runs = [run(mode, args.cold) for _ in range(args.repeat)]
+        imported = statistics.median(r['import'] for r in runs) * 1000
+        loaded = statistics.median(r['loaded'] for r in runs) * 1000
+        print(f"{label:>20}: import {imported:7.1f} ms, loaded {loaded:7.1f} ms "
+              f"(heavy modules at import: {', '.join(runs[0]['heavy']) or 'none'})")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,14 +8,14 @@ files. The generated meme is saved to a temporary directory.
 
 Functions:
 - generate_meme: Generates a meme given an image path, quote body, and author.
+- generate_batch: Generates every meme listed in a CSV file of jobs using a
+  pool of worker processes.
 """
 
-import os
-import random
+import csv
 import argparse
-from QuoteEngine.ingestor import Ingestor  # Ensure you import your Ingestor
-from MemeEngine import MemeEngine  # Correct import
-from QuoteEngine import QuoteModel  # Ensure you import QuoteModel
+from MemeEngine import MemeEngine, MemeJob, ImageCatalog  # Correct import
+from QuoteEngine import QuoteModel, QuoteCache, QuoteFile, QuoteSampler, QuoteDeduplicator
 
 
 def generate_meme(path=None, body=None, author=None):
@@ -24,8 +24,9 @@ def generate_meme(path=None, body=None, author=None):
 
     This function creates a meme by either selecting a random image from a
     predefined directory or using a specified image path. It also selects a
-    random quote if none is provided, or creates a QuoteModel object if a 
-    quote body and author are specified.
+    random quote if none is provided (from the compiled quote file
+    './_data/quotes.qbin' when it is up to date), or creates a QuoteModel
+    object if a quote body and author are specified.
 
     Args:
         path (str, optional): The path to the image file. If None, a random 
@@ -46,12 +47,9 @@ def generate_meme(path=None, body=None, author=None):
     quote = None
 
     if path is None:
-        images = "./_data/photos/dog/"
-        imgs = []
-        for root, dirs, files in os.walk(images):
-            imgs = [os.path.join(root, name) for name in files]
-
-        img = random.choice(imgs)
+        catalog = ImageCatalog("./_data/photos/dog/")
+        catalog.scan()
+        img = catalog.choice()
     else:
         img = path[0]
 
@@ -64,11 +62,16 @@ def generate_meme(path=None, body=None, author=None):
                    './_data/SimpleLines/SimpleLines.docx',
                    './_data/SimpleLines/SimpleLines.pdf',
                    './_data/SimpleLines/SimpleLines.csv',]
-        quotes = []
-        for f in quote_files:
-            quotes.extend(Ingestor.parse(f))
-
-        quote = random.choice(quotes)
+        compiled_quotes = './_data/quotes.qbin'
+        if QuoteFile.is_current(compiled_quotes, quote_files):
+            quotes = QuoteFile(compiled_quotes)
+        else:
+            quote_cache = QuoteCache()
+            quotes, errors = quote_cache.parse_many(quote_files)
+            quote_cache.save()
+            quotes = QuoteDeduplicator().dedup(quotes)
+
+        quote = QuoteSampler(quotes).choice()
     else:
         if author is None:
             raise Exception('Author Required if Body is Used')
@@ -79,19 +82,61 @@ def generate_meme(path=None, body=None, author=None):
     return path
 
 
+def generate_batch(jobs_path, workers=None):
+    """
+    Generate every meme listed in a CSV file of jobs.
+
+    The CSV file has a header row followed by rows of
+    `path,body,author` with an optional fourth `width` column. Memes are
+    rendered in parallel by MemeEngine.make_memes and reported as they
+    finish.
+
+    Args:
+        jobs_path (str): The path to the CSV file of jobs.
+        workers (int, optional): The number of worker processes. Defaults
+                                 to the number of CPUs.
+
+    Returns:
+        list: The file paths of the generated meme images.
+    """
+    jobs = []
+    with open(jobs_path, 'r', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        next(reader)  # Skip the header row
+        for row in reader:
+            if len(row) == 3:
+                jobs.append(MemeJob(row[0], row[1], row[2]))
+            elif len(row) == 4:
+                jobs.append(MemeJob(row[0], row[1], row[2], int(row[3])))
+
+    meme = MemeEngine('./tmp')
+    paths = []
+    for job, path in meme.make_memes(jobs, workers=workers):
+        if path is not None:
+            print(f"Meme generated at: {path}")
+            paths.append(path)
+    return paths
+
+
 if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description="Generate a meme from a quote.")
     parser.add_argument('--path', type=str, help='Path to an image file')
     parser.add_argument('--body', type=str, help='Quote body to add to the image')
     parser.add_argument('--author', type=str, help='Quote author to add to the image')
+    parser.add_argument('--batch', type=str,
+                        help='CSV file of path,body,author[,width] jobs to render')
+    parser.add_argument('--workers', type=int, help='Number of worker processes for --batch')
 
     args = parser.parse_args()
     
     # Generate and print the meme path
     try:
-        meme_path = generate_meme(args.path, args.body, args.author)
-        print(f"Meme generated at: {meme_path}")
+        if args.batch:
+            generate_batch(args.batch, args.workers)
+        else:
+            meme_path = generate_meme(args.path, args.body, args.author)
+            print(f"Meme generated at: {meme_path}")
     except Exception as e:
         print(f"Error: {e}")
 
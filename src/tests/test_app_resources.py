@@ -0,0 +1,82 @@
+"""Tests for how the web application loads its resources."""
+
+import gc
+import pytest
+
+pytest.importorskip('flask')
+pytest.importorskip('PIL')
+
+import app  # noqa: E402
+from QuoteEngine import QuoteFile, QuoteModel  # noqa: E402
+
+COUNT = 1000
+
+
+@pytest.fixture
+def compiled_app(tmp_path, monkeypatch):
+    """Point the app at a compiled quote file and stub out images and threads."""
+    source = tmp_path / 'quotes.txt'
+    source.write_text(''.join(f"Quote {i} - Author {i % 7}\n" for i in range(COUNT)),
+                      encoding='utf-8')
+    compiled = str(tmp_path / 'quotes.qbin')
+    QuoteFile.compile([str(source)], compiled)
+
+    monkeypatch.setattr(app, 'quote_files', [str(source)])
+    monkeypatch.setattr(app, 'compiled_quotes', compiled)
+    monkeypatch.setattr(app.catalog, 'scan', lambda: False)
+    monkeypatch.setattr(app.catalog, 'working_paths', lambda: ['dog.png'])
+    monkeypatch.setattr(app.meme_pool, 'start', lambda: None)
+    monkeypatch.setattr(app.watcher, 'start', lambda: None)
+    monkeypatch.setattr(app, 'resources_ready', app.threading.Event())
+    monkeypatch.setattr(app, 'quote_weight_by', 'source')
+    yield compiled
+    if isinstance(app.quotes, QuoteFile):
+        app.quotes.close()
+    monkeypatch.setattr(app, 'quotes', [])
+
+
+def count_quote_models(monkeypatch):
+    """Count the QuoteModel instances created from now on."""
+    created = []
+    init, from_clean = QuoteModel.__init__, QuoteModel.from_clean.__func__
+    monkeypatch.setattr(QuoteModel, '__init__', lambda self, body, author: (
+        created.append(body), init(self, body, author))[1])
+    monkeypatch.setattr(QuoteModel, 'from_clean', classmethod(
+        lambda cls, body, author: created.append(body) or from_clean(cls, body, author)))
+    return created
+
+
+def test_resources_from_quote_file_decode_only_drawn_quotes(compiled_app, monkeypatch):
+    """Loading, indexing and sampling a compiled file builds no QuoteModel list."""
+    created = count_quote_models(monkeypatch)
+
+    app.load_resources()
+
+    assert app.load_error is None
+    assert app.resources_ready.is_set()
+    assert isinstance(app.quotes, QuoteFile) and len(app.quotes) == COUNT
+    assert created == []
+
+    quote = app.quote_sampler.choice()
+    assert app.quote_index.by_body(quote.body).author == quote.author
+    assert len(created) == 2
+
+
+def test_reload_keeps_replaced_quote_file_until_released(compiled_app):
+    """A replaced quote file stays readable for its users, then is unmapped."""
+    app.load_resources()
+    old_quotes, old_sampler, old_index = app.quotes, app.quote_sampler, app.quote_index
+    old_map = old_quotes._mmap
+
+    app.reload_resources([compiled_app])
+
+    assert app.quotes is not old_quotes
+    # Requests that still hold the old sampler or index keep working
+    quote = old_sampler.choice()
+    assert old_index.by_body(quote.body).author == quote.author
+    assert not old_map.closed
+
+    del old_quotes, old_sampler, old_index, quote
+    gc.collect()
+    assert old_map.closed
+    assert not app.quotes._mmap.closed
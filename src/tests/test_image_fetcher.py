@@ -0,0 +1,96 @@
+"""Tests for the remote image fetcher."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+
+pytest.importorskip('requests')
+
+from MemeEngine import FetchError, ImageFetcher  # noqa: E402
+
+
+class DripHandler(BaseHTTPRequestHandler):
+    """Answers with a large image and sends it one byte every 50 ms."""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(1024 * 1024))
+        self.end_headers()
+        try:
+            for _ in range(200):
+                self.wfile.write(b'x')
+                self.wfile.flush()
+                time.sleep(0.05)
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    """Serves 1000-byte images with an ETag, and a 4000-byte one at /big.png."""
+
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == f'"{self.path}"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = b'x' * (4000 if self.path == '/big.png' else 1000)
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', f'"{self.path}"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(handler):
+    """Serve handler on a local port until the test finishes; yield its URL."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def drip_url():
+    for url in serve(DripHandler):
+        yield f'{url}/slow.png'
+
+
+@pytest.fixture
+def image_server():
+    yield from serve(ImageHandler)
+
+
+def test_deadline_aborts_dripping_download(drip_url):
+    """A server dripping bytes cannot hold the fetching thread past the deadline."""
+    fetcher = ImageFetcher()
+
+    start = time.monotonic()
+    with pytest.raises(FetchError, match='deadline'):
+        fetcher.fetch_bytes(drip_url, deadline=0.5)
+
+    assert time.monotonic() - start < 1.5
+
+
+def test_cache_is_bounded_by_bytes(image_server):
+    """Cached images are evicted, least recently used first, past cache_bytes."""
+    fetcher = ImageFetcher(cache_bytes=2500)
+    for name in ('a', 'b', 'c'):
+        assert len(fetcher.fetch_bytes(f'{image_server}/{name}.png')) == 1000
+    fetcher.fetch_bytes(f'{image_server}/big.png')
+
+    assert list(fetcher._cache) == [f'{image_server}/b.png', f'{image_server}/c.png']
+    assert fetcher._cached_bytes == 2000
+    fetcher.fetch_bytes(f'{image_server}/c.png')
+    assert fetcher.hits == 1
@@ -0,0 +1,33 @@
+"""Tests for the ingestion entry points."""
+
+from QuoteEngine import Ingestor, QuoteCache
+
+
+def test_parse_many_reports_missing_file(tmp_path):
+    """A file the ingestor cannot open is reported in errors, not dropped silently."""
+    present = tmp_path / 'present.txt'
+    present.write_text('a - b\n', encoding='utf-8')
+    missing = str(tmp_path / 'missing.txt')
+
+    quotes, errors = Ingestor.parse_many([str(present), missing])
+
+    assert [(quote.body, quote.author) for quote in quotes] == [('a', 'b')]
+    assert list(errors) == [missing]
+    assert isinstance(errors[missing], FileNotFoundError)
+
+
+def test_quote_cache_parse_many_reports_missing_file(tmp_path):
+    """The cached variant reports the same per-file errors."""
+    missing = str(tmp_path / 'missing.csv')
+
+    quotes, errors = QuoteCache(str(tmp_path / 'cache.pkl')).parse_many([missing])
+
+    assert quotes == []
+    assert isinstance(errors[missing], FileNotFoundError)
+
+
+def test_parse_prints_errors_by_default(tmp_path, capsys):
+    """Without raise_errors a missing file still yields no quotes and a message."""
+    assert Ingestor.parse(str(tmp_path / 'missing.txt')) == []
+    assert 'txt_ingestor' in capsys.readouterr().out
+
@@ -0,0 +1,61 @@
+"""Tests for meme rendering and encoding."""
+
+import os
+import pytest
+
+pytest.importorskip('PIL')
+
+from MemeEngine import MemeEngine  # noqa: E402
+from MemeEngine.image_cache import ImageCache  # noqa: E402
+
+IMAGE = os.path.join(os.path.dirname(__file__), '..', '_data', 'photos', 'dog', 'alice.png')
+
+
+def test_variants_are_encoded_with_profiles_and_counted(tmp_path):
+    """make_variants encodes through encode(), so its renders show in encoding_stats."""
+    engine = MemeEngine(str(tmp_path), image_cache=ImageCache())
+
+    manifest = engine.make_variants(IMAGE, 'To bork or not to bork', 'Bork',
+                                    widths=(320, 160), formats=('WEBP', 'JPEG'))
+
+    assert sorted((entry['width'], entry['format']) for entry in manifest) == [
+        (160, 'JPEG'), (160, 'WEBP'), (320, 'JPEG'), (320, 'WEBP')]
+    for entry in manifest:
+        assert os.path.getsize(entry['path']) == entry['bytes'] > 0
+    stats = engine.encoding_stats()
+    assert stats['jpeg:JPEG']['renders'] == 2
+    assert stats['webp:WEBP']['renders'] == 2
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_variants_reject_formats_without_a_profile(tmp_path):
+    """A format no encoder profile produces is refused up front."""
+    engine = MemeEngine(str(tmp_path), image_cache=ImageCache())
+
+    with pytest.raises(ValueError):
+        engine.make_variants(IMAGE, 'text', 'author', widths=(160,), formats=('GIF',))
+
+
+@pytest.mark.parametrize('widths, formats, message', [
+    ((), ('JPEG',), 'at least one width'),
+    ((160,), (), 'at least one format'),
+    ((160, 0), ('JPEG',), 'pixels wide'),
+])
+def test_variants_reject_empty_or_invalid_inputs(tmp_path, widths, formats, message):
+    """Empty widths or formats, or a width below one pixel, raise a clear ValueError."""
+    engine = MemeEngine(str(tmp_path), image_cache=ImageCache())
+
+    with pytest.raises(ValueError, match=message):
+        engine.make_variants(IMAGE, 'text', 'author', widths=widths, formats=formats)
+
+
+def test_reused_meme_is_kept_by_the_sweeper(tmp_path):
+    """Reusing an output refreshes its mtime, so the age sweeper keeps it."""
+    engine = MemeEngine(str(tmp_path), image_cache=ImageCache())
+    path = engine.make_meme(IMAGE, 'To bork or not to bork', 'Bork', width=160)
+    day_ago = os.stat(path).st_mtime - 2 * engine.store.max_age
+    os.utime(path, (day_ago, day_ago))
+
+    assert engine.make_meme(IMAGE, 'To bork or not to bork', 'Bork', width=160) == path
+    assert engine.store.sweep() == 0
+    assert os.path.exists(path)
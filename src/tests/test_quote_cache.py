@@ -0,0 +1,43 @@
+"""Tests for the on-disk quote cache."""
+
+import os
+import pickle
+from QuoteEngine import QuoteCache
+
+
+def test_cache_from_older_parser_is_rejected(tmp_path):
+    """Quotes cached by the parser before user-025 are parsed again."""
+    quote_file = tmp_path / 'quotes.txt'
+    quote_file.write_text('a - b\nwell - said - c\nd - e\n', encoding='utf-8')
+    stat = os.stat(quote_file)
+    cache_path = tmp_path / 'cache.pkl'
+    # The old parser stopped at "well - said - c" and cached only the first quote
+    old_entry = {
+        'size': stat.st_size,
+        'mtime': stat.st_mtime_ns,
+        'hash': QuoteCache.file_hash(str(quote_file)),
+        'quotes': [('a', 'b')],
+    }
+    with open(cache_path, 'wb') as file:
+        pickle.dump({'version': 1, 'entries': {os.path.abspath(quote_file): old_entry}}, file)
+
+    quotes = QuoteCache(str(cache_path)).parse(str(quote_file))
+
+    assert [(quote.body, quote.author) for quote in quotes] == [
+        ('a', 'b'), ('well - said', 'c'), ('d', 'e')]
+
+
+def test_cache_round_trip(tmp_path):
+    """A saved cache serves unchanged files without parsing them."""
+    quote_file = tmp_path / 'quotes.txt'
+    quote_file.write_text('a - b\n', encoding='utf-8')
+    cache_path = str(tmp_path / 'cache.pkl')
+    cache = QuoteCache(cache_path)
+    cache.parse(str(quote_file))
+    cache.save()
+
+    cache = QuoteCache(cache_path)
+    quotes = cache.parse(str(quote_file))
+
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert [(quote.body, quote.author) for quote in quotes] == [('a', 'b')]
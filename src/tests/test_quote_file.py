@@ -0,0 +1,45 @@
+"""Tests for compiled quote files."""
+
+import os
+from QuoteEngine import QuoteFile
+
+
+def write_sources(tmp_path):
+    """Write two quote files, the second without any quotes; return their paths."""
+    first, empty = tmp_path / 'first.txt', tmp_path / 'empty.txt'
+    first.write_text('To bork or not to bork - Bork\n', encoding='utf-8')
+    empty.write_text('\n', encoding='utf-8')
+    return [str(first), str(empty)]
+
+
+def test_compile_records_every_source(tmp_path):
+    """Sources without quotes are recorded too, in the order given."""
+    paths = write_sources(tmp_path)
+    output = str(tmp_path / 'quotes.qbin')
+
+    assert QuoteFile.compile(paths, output) == 1
+    with QuoteFile(output) as quotes:
+        assert quotes.sources == paths
+        assert quotes.source(0) == paths[0]
+
+
+def test_is_current_checks_the_source_list(tmp_path):
+    """A quote file is stale for other sources, a missing or a newer source."""
+    paths = write_sources(tmp_path)
+    output = str(tmp_path / 'quotes.qbin')
+    QuoteFile.compile(paths, output)
+    compiled = os.stat(output).st_mtime_ns
+
+    assert QuoteFile.is_current(output, paths)
+    assert QuoteFile.is_current(output, [os.path.join(os.path.dirname(path), '.',
+                                                      os.path.basename(path))
+                                         for path in paths])
+    assert not QuoteFile.is_current(output, paths[:1])
+    assert not QuoteFile.is_current(output, paths[::-1])
+    assert not QuoteFile.is_current(str(tmp_path / 'missing.qbin'), paths)
+
+    os.utime(paths[1], ns=(compiled + 10**9, compiled + 10**9))
+    assert not QuoteFile.is_current(output, paths)
+
+    os.remove(paths[1])
+    assert not QuoteFile.is_current(output, paths)
@@ -0,0 +1,43 @@
+"""Tests for the quote index."""
+
+from QuoteEngine import QuoteFile, QuoteIndex, QuoteModel
+
+QUOTES = [QuoteModel('To bork or not to bork', 'Bork'),
+          QuoteModel('He who smelt it', 'Stinky'),
+          QuoteModel('Bork the mailman', 'bork')]
+
+
+def compiled(tmp_path):
+    """Return the test quotes compiled into an open quote file."""
+    path = str(tmp_path / 'quotes.qbin')
+    QuoteFile.write(path, ((quote, 'test.txt') for quote in QUOTES))
+    return QuoteFile(path)
+
+
+def test_lookups_and_completion():
+    """Exact lookups ignore case; completion and search find fragments."""
+    index = QuoteIndex(QUOTES)
+
+    assert [quote.body for quote in index.by_author('BORK')] == [
+        'To bork or not to bork', 'Bork the mailman']
+    assert index.by_body('he who smelt it') is QUOTES[1]
+    assert index.by_body('missing') is None
+    assert [quote.body for quote in index.complete('bork', 'body')] == ['Bork the mailman']
+    assert [quote.author for quote in index.search('tin', 'author')] == ['Stinky']
+
+
+def test_quote_file_index_decodes_only_results(tmp_path, monkeypatch):
+    """Over a QuoteFile, only the quotes returned are turned into QuoteModels."""
+    created = []
+    from_clean = QuoteModel.from_clean.__func__
+    monkeypatch.setattr(QuoteModel, 'from_clean', classmethod(
+        lambda cls, body, author: created.append(body) or from_clean(cls, body, author)))
+
+    with compiled(tmp_path) as quotes:
+        index = QuoteIndex(quotes)
+        assert created == []
+        assert [quote.body for quote in index.by_author('bork')] == [
+            'To bork or not to bork', 'Bork the mailman']
+        assert [quote.body for quote in index.search('smelt')] == ['He who smelt it']
+
+    assert created == ['To bork or not to bork', 'Bork the mailman', 'He who smelt it']